@@ -0,0 +1,42 @@
+"""add foreign key indexes
+
+Revision ID: 0c5d8e2b7a94
+Revises: e4a7c2d9f813
+Create Date: 2026-10-18 13:50:09.734512
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0c5d8e2b7a94"
+down_revision: Union[str, None] = "e4a7c2d9f813"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# application.vacancy_id, application.status and interview_message.application_id are already covered
+# by the composite indexes of the previous revisions
+INDEXES = [
+    ("ix_application_user_id_id", "application", ["user_id", "id"]),
+    ("ix_skill_vacancy_id", "skill", ["vacancy_id"]),
+    ("ix_skill_skill_type_id", "skill", ["skill_type_id"]),
+    ("ix_skill_result_application_id_skill_id", "skill_result", ["application_id", "skill_id"]),
+    ("ix_skill_result_skill_id", "skill_result", ["skill_id"]),
+    ("ix_vacancy_user_id", "vacancy", ["user_id"]),
+]
+
+
+def upgrade() -> None:
+    # Built concurrently so that the tables stay writable, which cannot be done inside a transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
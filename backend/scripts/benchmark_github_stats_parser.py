@@ -0,0 +1,100 @@
+"""
+CPU time of parsing a github-readme-stats card: the streaming parser against the former BeautifulSoup one.
+
+    uv run scripts/benchmark_github_stats_parser.py --number 2000 scripts/fixtures/github_stats_card.svg
+"""
+
+import argparse
+import re
+import sys
+import timeit
+from pathlib import Path
+from xml.etree.ElementTree import Element, fromstring
+
+from bs4 import BeautifulSoup
+
+# add parent dir to sys.path
+sys.path.append(str(Path(__file__).parents[1]))
+import src.schemas  # noqa: E402, F401  # resolves the import cycle between the schemas and github_eval
+from src.services.pre_interview.github_eval import GithubStats, Stat, parse_github_stats  # noqa: E402
+
+FIXTURES = sorted((Path(__file__).parent / "fixtures").glob("github_stats_*.svg"))
+
+
+def parse_github_stats_soup(svg: str, url: str) -> GithubStats:
+    """The implementation replaced by `parse_github_stats`, kept as the baseline."""
+    soup = BeautifulSoup(svg, "html.parser")
+    svg_data = soup.find("svg")
+    title = svg_data.find("title").text
+    fullname, _, _ = title.partition(" GitHub Stats")
+    fullname = fullname.removesuffix("'s")
+    _, _, rank = title.rpartition("Rank: ")
+    desc = svg_data.find("desc").text
+
+    style = svg_data.find("style").text
+    rank_animation = re.search(r"@keyframes rankAnimation ", style)
+    if rank_animation:
+        stroke_dasharray = 0
+        starting_pos = rank_animation.span()
+        to = re.search(r"to {", style[starting_pos[1] :])
+        if to:
+            to_pos = to.span()[0] + starting_pos[1]
+            stroke_dasharray_str = re.search(r"stroke-dashoffset: (\d+\.\d+);", style[to_pos:])
+            if stroke_dasharray_str:
+                stroke_dasharray = float(stroke_dasharray_str.group(1))
+        rank_progress = round(((250 - stroke_dasharray) / 250) * 100)
+    else:
+        rank_progress = 0
+
+    stats = []
+    for line in desc.split(", "):
+        key, _, value = line.partition(": ")
+        stats.append(Stat(name=key, value=int(value) if value.isdigit() else value))
+
+    icons = [icon_element.prettify() for icon_element in svg_data.find_all("svg", class_="icon")]
+    if len(icons) == len(stats):
+        for icon, stat in zip(icons, stats):
+            stat.icon = icon
+
+    return GithubStats(github_stats_url=url, fullname=fullname, rank=rank, rank_progress=rank_progress, stats=stats)
+
+
+def _canonical_icon(element: Element) -> tuple:
+    """Icon markup without what the serializers differ in: whitespace, attribute order and the case of names."""
+    return (
+        element.tag.lower(),
+        sorted((name.lower(), value) for name, value in element.attrib.items()),
+        (element.text or "").strip(),
+        [_canonical_icon(child) for child in element],
+    )
+
+
+def _comparable(stats: GithubStats) -> dict:
+    result = stats.model_dump()
+    for stat in result["stats"]:
+        if stat["icon"] is not None:
+            stat["icon"] = _canonical_icon(fromstring(stat["icon"]))
+    return result
+
+
+def main(cards: list[Path], number: int) -> None:
+    for card in cards:
+        svg = card.read_text(encoding="utf-8")
+        streaming, soup = parse_github_stats(svg, "url"), parse_github_stats_soup(svg, "url")
+        assert _comparable(streaming) == _comparable(soup), f"{card.name}: results differ"
+
+        print(f"=== {card.name} ({len(svg)} chars, {number} runs)")
+        results = {}
+        for name, parse in (("BeautifulSoup", parse_github_stats_soup), ("streaming", parse_github_stats)):
+            timings = timeit.repeat(lambda parse=parse, svg=svg: parse(svg, "url"), number=number, repeat=5)
+            results[name] = min(timings) / number
+            print(f"{name:>14}: {results[name] * 1e6:8.1f} us per card")
+        print(f"{'speedup':>14}: {results['BeautifulSoup'] / results['streaming']:8.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("cards", nargs="*", type=Path, default=FIXTURES, help="Recorded cards, all fixtures by default")
+    parser.add_argument("--number", type=int, default=1000, help="Parses per measurement")
+    args = parser.parse_args()
+    main(args.cards, args.number)
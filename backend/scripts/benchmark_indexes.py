@@ -0,0 +1,146 @@
+"""
+Query plans of the hot foreign key and status lookups, without and with the indexes of the models.
+
+Seeds a throwaway `index_benchmark` schema in the configured database (or --db-url), runs EXPLAIN ANALYZE
+for each query with the indexes dropped and then created, and removes the schema in the end.
+
+    uv run scripts/benchmark_indexes.py --applications 1000000
+"""
+
+import argparse
+import asyncio
+import re
+import sys
+from pathlib import Path
+
+from sqlalchemy import Select, func, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+# add parent dir to sys.path
+sys.path.append(str(Path(__file__).parents[1]))
+from src.db.models import Application, Base, InterviewMessage, Skill, SkillResult, Vacancy  # noqa: E402
+
+SCHEMA = "index_benchmark"
+
+# Indexes that are dropped for the "before" run, unique constraints and primary keys stay
+BENCHMARK_INDEXES = [
+    "ix_application_user_id_id",
+    "ix_application_vacancy_id_id",
+    "ix_application_status_id",
+    "ix_interview_message_application_id_position",
+    "ix_skill_vacancy_id",
+    "ix_skill_skill_type_id",
+    "ix_skill_result_application_id_skill_id",
+    "ix_skill_result_skill_id",
+    "ix_vacancy_user_id",
+]
+
+
+def queries(applications: int) -> dict[str, Select]:
+    application_id = applications // 2
+    return {
+        "get_user_applications": select(Application).where(Application.user_id == 4242),
+        "applications of a vacancy": select(Application)
+        .where(Application.vacancy_id == 42)
+        .order_by(Application.id)
+        .limit(100),
+        "applications by status": select(Application)
+        .where(Application.status == "approved_for_interview")
+        .order_by(Application.id)
+        .limit(100),
+        "get_interview_messages": select(InterviewMessage)
+        .where(InterviewMessage.application_id == application_id)
+        .order_by(InterviewMessage.position, InterviewMessage.id),
+        "get_application_results": select(SkillResult).where(SkillResult.application_id == application_id),
+        "skills of vacancies (selectin loader)": select(Skill).where(Skill.vacancy_id.in_([1, 2, 3, 4, 5])),
+        "results of a skill (delete cascade)": select(func.count()).where(SkillResult.skill_id == 42),
+        "skills of a type (delete cascade)": select(func.count()).where(Skill.skill_type_id == 42),
+        "vacancies of a user (delete cascade)": select(func.count()).where(Vacancy.user_id == 42),
+    }
+
+
+async def seed(conn: AsyncConnection, applications: int) -> None:
+    users = max(applications // 10, 1)
+    vacancies = max(applications // 100, 1)
+    with_transcripts = max(applications // 10, 1)
+    statuses = "ARRAY['pending','approved_for_interview','rejected_for_interview','in_interview','approved','rejected']"
+
+    statements = [
+        f"""INSERT INTO "user" (name, email, hashed_password, is_admin)
+        SELECT 'user ' || i, 'user' || i || '@example.com', '-', i % 1000 = 0 FROM generate_series(1, {users}) i""",
+        f"""INSERT INTO vacancy (name, description, city, weekly_hours_occupancy, required_experience, open_time,
+        is_active, user_id)
+        SELECT 'vacancy ' || i, 'description', 'city ' || i % 50, 40, i % 10, now(), i % 3 > 0, 1 + i % 1000
+        FROM generate_series(1, {vacancies}) i""",
+        "INSERT INTO skill_type (name) SELECT 'skill ' || i FROM generate_series(1, 200) i",
+        """INSERT INTO skill (weight, details, skill_type_id, vacancy_id)
+        SELECT 1.0 / (1 + s), 'details', 1 + (vacancy.id * 7 + s) % 200, vacancy.id
+        FROM vacancy CROSS JOIN generate_series(0, 4) s""",
+        f"""INSERT INTO application (cv, status, user_id, vacancy_id)
+        SELECT 'cv.pdf', ({statuses})[1 + i % 6], 1 + i % {users}, 1 + (i * 7919) % {vacancies}
+        FROM generate_series(1, {applications}) i""",
+        f"""INSERT INTO interview_message (role, message, position, application_id)
+        SELECT CASE WHEN p % 2 = 0 THEN 'assistant' ELSE 'user' END, 'message', p, a
+        FROM generate_series(1, {applications}, {max(applications // with_transcripts, 1)}) a,
+        generate_series(0, 19) p""",
+        """INSERT INTO skill_result (score, skill_id, application_id)
+        SELECT 0.5, skill.id, application.id FROM application JOIN skill ON skill.vacancy_id = application.vacancy_id
+        WHERE application.status IN ('approved', 'rejected')""",
+    ]
+    for statement in statements:
+        await conn.execute(text(statement))
+
+
+async def explain(conn: AsyncConnection, applications: int) -> dict[str, tuple[float, str]]:
+    await conn.execute(text("ANALYZE"))
+    results = {}
+    for name, query in queries(applications).items():
+        sql = str(query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+        plan = (await conn.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {sql}"))).scalars().all()
+        execution_time = next(float(m[1]) for line in plan if (m := re.search(r"Execution Time: ([\d.]+)", line)))
+        results[name] = (execution_time, "\n".join(plan))
+    return results
+
+
+async def main(db_url: str, applications: int) -> None:
+    engine = create_async_engine(db_url)
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+        await conn.execute(text(f"SET LOCAL search_path TO {SCHEMA}"))
+        await conn.run_sync(Base.metadata.create_all)
+        indexes = [index for table in Base.metadata.tables.values() for index in table.indexes]
+        indexes = [index for index in indexes if index.name in BENCHMARK_INDEXES]
+
+        print(f"Seeding {applications} applications...")
+        await seed(conn, applications)
+
+        for index in indexes:
+            await conn.execute(text(f"DROP INDEX {index.name}"))
+        before = await explain(conn, applications)
+
+        for index in indexes:
+            await conn.run_sync(index.create)
+        after = await explain(conn, applications)
+
+        await conn.execute(text(f"DROP SCHEMA {SCHEMA} CASCADE"))
+    await engine.dispose()
+
+    for name in before:
+        print(f"\n=== {name}: {before[name][0]:.2f} ms -> {after[name][0]:.2f} ms")
+        print("--- without indexes\n" + before[name][1])
+        print("--- with indexes\n" + after[name][1])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db-url", help="Database to use, defaults to db_url from the settings")
+    parser.add_argument("--applications", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    if args.db_url is None:
+        from src.config import api_settings  # noqa: PLC0415
+
+        args.db_url = api_settings.db_url.get_secret_value()
+    asyncio.run(main(args.db_url, args.applications))
@@ -0,0 +1,57 @@
+"""
+Local stand-in for github-readme-stats, serving a recorded stats card for any username.
+
+Point `github_stats_settings.base_url` to it to work without the real instance, or to see how the app behaves when
+the upstream is slow or failing:
+
+    uv run scripts/fake_github_stats.py --port 9000 --delay 15 --error-rate 0.5
+"""
+
+import argparse
+import random
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+CARD = Path(__file__).parent / "fixtures" / "github_stats_card.svg"
+
+
+def make_handler(card: bytes, delay: float, error_rate: float) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            url = urlsplit(self.path)
+            if url.path != "/api":
+                self.send_error(404)
+                return
+
+            time.sleep(delay)
+            if random.random() < error_rate:
+                self.send_error(503)
+                return
+
+            username = parse_qs(url.query).get("username", ["octocat"])[0]
+            body = card.replace(b"Octo Cat", username.encode())
+            self.send_response(200)
+            self.send_header("Content-Type", "image/svg+xml; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return Handler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--card", type=Path, default=CARD, help="SVG returned for every username")
+    parser.add_argument("--delay", type=float, default=0.0, help="Seconds to wait before responding")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with 503")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(
+        (args.host, args.port), make_handler(args.card.read_bytes(), args.delay, args.error_rate)
+    )
+    print(f"Serving {args.card.name} at http://{args.host}:{args.port}/api?username=...")
+    server.serve_forever()
@@ -1,60 +1,53 @@
-from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, HTTPException, Response, UploadFile
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, Response, UploadFile
 from fastapi import status as http_status
 from fastapi_derive_responses import AutoDeriveResponsesAPIRoute
 
 from src.api.auth.dependencies import get_current_user, require_admin
-from src.api.logging_ import logger
 from src.api.repositories.dependencies import (
     get_application_repository,
     get_converting_repository,
-    get_pre_interview_repository,
+    get_job_repository,
+    get_unit_of_work,
     get_vacancy_repository,
 )
-from src.api.utils import save_file_as_pdf
+from src.api.utils import extract_cv_text, save_file_as_pdf
+from src.config import worker_settings
 from src.db.models import User
-from src.db.repositories import ApplicationRepository, PreInterviewResultRepository, VacancyRepository
-from src.schemas import ApplicationResponse, ApplicationWithVacancyResponse, Status, VacancyResponse
-from src.services.ai.assessor import pre_interview_assessment
+from src.db.repositories import ApplicationRepository, JobRepository, VacancyRepository
+from src.db.storage import UnitOfWork
+from src.schemas import (
+    ApplicationListParams,
+    ApplicationResponse,
+    ApplicationWithVacancyResponse,
+    JobKind,
+    Status,
+    VacancyResponse,
+)
 from src.services.converting import ConvertingRepository
-from src.services.pre_interview.github_eval import GithubStats, parse_github_stats
+from src.services.pre_interview.github_stats import github_username
 
 router = APIRouter(prefix="/applications", tags=["Applications"], route_class=AutoDeriveResponsesAPIRoute)
 
 
-async def _run_pre_interview_and_update(
-    application_id: int,
-    vacancy_id: int,
-    github_info: GithubStats | None,
-    application_repository: ApplicationRepository,
-    vacancy_repository: VacancyRepository,
-    pre_interview_repository: PreInterviewResultRepository,
-):
-    vacancy = await vacancy_repository.get_vacancy(vacancy_id)
-    application = await application_repository.get_application(application_id)
-    res = await pre_interview_assessment(
-        application=application,
-        vacancy=vacancy,
-        repository=pre_interview_repository,
-        github=github_info,
-    )
-    new_status = Status.APPROVED_FOR_INTERVIEW if res.is_recommended else Status.REJECTED_FOR_INTERVIEW
-    await application_repository.edit_application(application_id, status=new_status)
-    logger.info(f'Pre-interview result for application {application_id} created')
-
-
 @router.post("", status_code=http_status.HTTP_201_CREATED)
 async def create_application(
-    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     vacancy_id: int = Form(...),
     github: str | None = Form(None),
     application_repository: ApplicationRepository = Depends(get_application_repository),
     vacancy_repository: VacancyRepository = Depends(get_vacancy_repository),
-    pre_interview_repository: PreInterviewResultRepository = Depends(get_pre_interview_repository),
+    job_repository: JobRepository = Depends(get_job_repository),
     converting_repository: ConvertingRepository = Depends(get_converting_repository),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work),
     user: User = Depends(get_current_user),
 ) -> ApplicationResponse:
+    # Conversion and text extraction go first, so that the transaction is not held open while they run
     dest_path = await save_file_as_pdf(file, converting_repository)
+    unit_of_work.after_rollback(lambda: dest_path.unlink(missing_ok=True))
+    cv_text = await extract_cv_text(dest_path)
+
     vacancy = await vacancy_repository.get_vacancy(vacancy_id)
     if vacancy is None:
         raise HTTPException(
@@ -63,38 +56,30 @@ async def create_application(
 
     application = await application_repository.create_application(
         cv=str(dest_path),
+        cv_text=cv_text,
         status=Status.PENDING,
         git=github,
         user_id=user.id,
         vacancy_id=vacancy_id,
     )
 
-    github_info = None
-    if type(github) is str and 'github' in github:
-        username = github.rstrip("/").split("/")[-1]
-        github_info = await parse_github_stats(username)
-
-    background_tasks.add_task(
-        _run_pre_interview_and_update,
-        application_id=application.id,
-        vacancy_id=vacancy_id,
-        github_info=github_info,
-        application_repository=application_repository,
-        vacancy_repository=vacancy_repository,
-        pre_interview_repository=pre_interview_repository,
+    # Github stats are fetched by a job, which then queues the assessment
+    await job_repository.enqueue(
+        kind=JobKind.GITHUB_STATS if github_username(github) else JobKind.PRE_INTERVIEW,
+        payload={"application_id": application.id},
+        max_attempts=worker_settings.max_attempts,
     )
 
-    application.github_stats = github_info
-
     return ApplicationResponse.model_validate(application)
 
 
 @router.get("")
 async def list_applications(
+    params: Annotated[ApplicationListParams, Query()],
     application_repository: ApplicationRepository = Depends(get_application_repository),
     _: User = Depends(require_admin),
 ) -> list[ApplicationResponse]:
-    applications = await application_repository.get_all_applications()
+    applications = await application_repository.get_all_applications(**params.model_dump())
     return [ApplicationResponse.model_validate(app) for app in applications]
 
 
@@ -112,7 +97,7 @@ async def get_user_applications_with_vacancies(
     application_repository: ApplicationRepository = Depends(get_application_repository),
     user: User = Depends(get_current_user),
 ) -> list[ApplicationWithVacancyResponse]:
-    applications = await application_repository.get_user_applications(user.id)
+    applications = await application_repository.get_user_applications(user.id, with_vacancy=True)
     result = []
     for app in applications:
         app_with_vacancy = ApplicationWithVacancyResponse(
@@ -150,8 +135,18 @@ async def edit_application_endpoint(
     application_repository: ApplicationRepository = Depends(get_application_repository),
     vacancy_repository: VacancyRepository = Depends(get_vacancy_repository),
     converting_repository: ConvertingRepository = Depends(get_converting_repository),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work),
     user: User = Depends(get_current_user),
 ) -> ApplicationResponse:
+    update_kwargs: dict = {}
+
+    # Before any query, so that the transaction is not held open during conversion and text extraction
+    if file is not None:
+        dest_path = await save_file_as_pdf(file, converting_repository)
+        unit_of_work.after_rollback(lambda: dest_path.unlink(missing_ok=True))
+        update_kwargs["cv"] = str(dest_path)
+        update_kwargs["cv_text"] = await extract_cv_text(dest_path)
+
     application = await application_repository.get_application(application_id)
     if not application:
         raise HTTPException(status_code=404, detail=f"Application {application_id} not found")
@@ -166,13 +161,6 @@ async def edit_application_endpoint(
     if user_id is not None and not user.is_admin:
         raise HTTPException(status_code=403, detail="You are not authorized to transfer this application")
 
-    update_kwargs: dict = {}
-
-    # Handle optional CV file upload
-    if file is not None:
-        dest_path = await save_file_as_pdf(file, converting_repository)
-        update_kwargs["cv"] = str(dest_path)
-
     # Collect optional fields for partial update
     if status is not None:
         update_kwargs["status"] = status
@@ -0,0 +1,57 @@
+import time
+from collections import OrderedDict
+
+from sqlalchemy import inspect
+
+from src.config import api_settings
+from src.db.models import User
+
+
+class PrincipalCache:
+    """
+    Authenticated users kept in memory for `ttl` seconds, keyed by user id and token expiration, so that a token
+    never outlives its own cache entry. Entries are detached copies, changes of the user go through `invalidate`
+    once committed.
+
+    A user loaded before an invalidation may only be cached after it, so `set` takes the `version` read before loading
+    and drops the user if anything was invalidated since.
+    """
+
+    def __init__(self, ttl: float, max_size: int) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: OrderedDict[tuple[int, int | None], tuple[float, User]] = OrderedDict()
+        self.version = 0
+
+    def get(self, user_id: int, exp: int | None) -> User | None:
+        key = (user_id, exp)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, user = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return user
+
+    def set(self, user_id: int, exp: int | None, user: User, version: int) -> None:
+        if self.ttl <= 0 or version != self.version:
+            return
+        # A copy, so that the cached user is never bound to (and expired by) the session of some request
+        copy = User(**{attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs})
+        self._entries[(user_id, exp)] = (time.monotonic() + self.ttl, copy)
+        self._entries.move_to_end((user_id, exp))
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        self.version += 1
+        for key in [key for key in self._entries if key[0] == user_id]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+principal_cache = PrincipalCache(api_settings.principal_cache_ttl_seconds, api_settings.principal_cache_max_size)
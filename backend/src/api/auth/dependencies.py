@@ -3,31 +3,64 @@ from typing import Annotated
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
+from src.api.auth.cache import principal_cache
 from src.api.auth.util import decode_token
-from src.api.repositories.dependencies import get_user_repository
+from src.api.repositories.dependencies import get_storage
+from src.db import AbstractSQLAlchemyStorage
 from src.db.models import User
 from src.db.repositories import UserRepository
+from src.schemas.auth import TokenPayload
 
 bearer_scheme = HTTPBearer(scheme_name="Bearer", auto_error=True)
 
 
-async def get_current_user(
+async def get_token_payload(
         creds: Annotated[HTTPAuthorizationCredentials, Depends(bearer_scheme)],
-        user_repository: UserRepository = Depends(get_user_repository)
-) -> User:
-    """Get current user from JWT token."""
+) -> TokenPayload:
+    """Get the claims of the JWT token."""
     if creds.scheme.lower() != "bearer":
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid auth scheme")
+    return decode_token(creds.credentials)
+
 
-    token = creds.credentials
-    user = await user_repository.get_user(decode_token(token).sub)
-    if not user:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
+def get_principal_repository(storage: AbstractSQLAlchemyStorage = Depends(get_storage)) -> UserRepository:
+    """
+    Users are authenticated in a short session of their own: through the request's unit of work the lookup would start
+    its transaction before the endpoint runs and keep it open during whatever slow work the endpoint does.
+    """
+    return UserRepository(storage)
+
+
+async def _load_user(payload: TokenPayload, user_repository: UserRepository) -> User:
+    user = principal_cache.get(payload.sub, payload.exp)
+    if user is None:
+        version = principal_cache.version
+        user = await user_repository.get_user(payload.sub)
+        if not user:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
+        principal_cache.set(payload.sub, payload.exp, user, version)
     return user
 
 
-async def require_admin(current_user: Annotated[User, Depends(get_current_user)]) -> User:
+async def get_current_user(
+        payload: Annotated[TokenPayload, Depends(get_token_payload)],
+        user_repository: UserRepository = Depends(get_principal_repository)
+) -> User:
+    """Get current user from JWT token."""
+    return await _load_user(payload, user_repository)
+
+
+async def require_admin(
+        payload: Annotated[TokenPayload, Depends(get_token_payload)],
+        user_repository: UserRepository = Depends(get_principal_repository)
+) -> User:
     """Require admin privileges."""
+    # Tokens of non-admins are rejected without loading the user, the claim alone never grants access though:
+    # the admin flag may have been revoked since the token was issued
+    if payload.is_admin is False:
+        raise HTTPException(status_code=403, detail="Admin only")
+
+    current_user = await _load_user(payload, user_repository)
     if not current_user.is_admin:
         raise HTTPException(status_code=403, detail="Admin only")
     return current_user
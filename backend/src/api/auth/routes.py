@@ -1,48 +1,74 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi_derive_responses import AutoDeriveResponsesAPIRoute
-from passlib.context import CryptContext
 
 from src.api.auth.dependencies import get_current_user
-from src.api.auth.util import create_access_token
-from src.api.repositories.dependencies import get_user_repository
+from src.api.auth.util import create_tokens, hash_password, rotate_tokens, verify_password
+from src.api.repositories.dependencies import get_refresh_token_repository, get_storage, get_user_repository
+from src.db import AbstractSQLAlchemyStorage
 from src.db.models import User
-from src.db.repositories import UserRepository
-from src.schemas import LoginRequest, RegisterRequest, TokenResponse, UserResponse
+from src.db.repositories import RefreshTokenRepository, UserRepository
+from src.schemas import LoginRequest, RefreshRequest, RegisterRequest, TokenResponse, UserResponse
+from src.services.tokens import token_service
 
 router = APIRouter(prefix="/auth", tags=["Authentication"], route_class=AutoDeriveResponsesAPIRoute)
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 
 @router.post("/register", status_code=status.HTTP_201_CREATED)
 async def register(
-    payload: RegisterRequest, user_repository: UserRepository = Depends(get_user_repository)
+    payload: RegisterRequest,
+    user_repository: UserRepository = Depends(get_user_repository),
+    refresh_token_repository: RefreshTokenRepository = Depends(get_refresh_token_repository),
 ) -> TokenResponse:
     existing = await user_repository.get_user_by_email(str(payload.email))
     if existing:
         raise HTTPException(status_code=409, detail="Email already in use")
 
-    hashed = pwd_context.hash(payload.password)
+    hashed = await hash_password(payload.password)
     user = await user_repository.create_user(
         name=payload.name,
         email=str(payload.email),
         hashed_password=hashed,
         is_admin=payload.is_admin,
     )
-    token = create_access_token({"sub": str(user.id)})
-    return TokenResponse(access_token=token)
+    return await create_tokens(user, refresh_token_repository)
 
 
 @router.post("/token")
 async def login(
-    credentials: LoginRequest, user_repository: UserRepository = Depends(get_user_repository)
+    credentials: LoginRequest,
+    user_repository: UserRepository = Depends(get_user_repository),
+    refresh_token_repository: RefreshTokenRepository = Depends(get_refresh_token_repository),
 ) -> TokenResponse:
     user = await user_repository.get_user_by_email(credentials.email)
-    if not user or not pwd_context.verify(credentials.password, user.hashed_password):
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    verified, new_hash = await verify_password(credentials.password, user.hashed_password)
+    if not verified:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    if new_hash is not None:
+        # The cost factor was changed since the password was set
+        await user_repository.edit_user(user.id, hashed_password=new_hash)
+
+    return await create_tokens(user, refresh_token_repository)
+
+
+@router.post("/refresh")
+async def refresh(payload: RefreshRequest, storage: AbstractSQLAlchemyStorage = Depends(get_storage)) -> TokenResponse:
+    """
+    Exchange a refresh token for a new pair of tokens, the claims are taken from the current state of the user.
+    Each refresh token is accepted once: presenting it again means that it leaked, so all tokens of the user are revoked.
+    """
+    # Not in the request's unit of work: the revocation must be committed even though the request fails
+    return await rotate_tokens(payload.refresh_token, UserRepository(storage), RefreshTokenRepository(storage))
+
 
-    token = create_access_token({"sub": str(user.id)})
-    return TokenResponse(access_token=token)
+@router.get("/jwks")
+async def jwks() -> dict:
+    """Public key verifying the access tokens, as a JSON Web Key Set. Not available for HMAC algorithms."""
+    keys = token_service.public_jwks()
+    if keys is None:
+        raise HTTPException(status_code=404, detail="Tokens are signed with a shared secret")
+    return keys
 
 
 @router.get("/me")
@@ -1,20 +1,24 @@
-from datetime import UTC, datetime, timedelta
+import datetime
 
 from fastapi import HTTPException, status
-from jose import JWTError, jwt
 
-from src.config import api_settings
-from src.schemas.auth import TokenPayload
+from src.db.models import User
+from src.db.repositories import RefreshTokenRepository, UserRepository
+from src.schemas.auth import TokenPayload, TokenResponse
+from src.services.passwords import PasswordHasherBusyError, password_hasher
+from src.services.tokens import InvalidTokenError, TokenType, token_service
 
 
-def decode_token(token: str) -> TokenPayload:
+def decode_token(token: str, token_type: TokenType = TokenType.ACCESS) -> TokenPayload:
     try:
-        payload = jwt.decode(token, api_settings.secret_key.get_secret_value(), algorithms=[api_settings.encryption_algorithm])
+        payload = token_service.decode(token, token_type)
         sub = payload.get("sub")
         if sub is None:
             raise ValueError("Missing 'sub' in token")
-        return TokenPayload(sub=int(sub), exp=payload.get("exp"))
-    except (JWTError, ValueError, TypeError):
+        return TokenPayload(
+            sub=int(sub), exp=payload.get("exp"), is_admin=payload.get("is_admin"), jti=payload.get("jti")
+        )
+    except (InvalidTokenError, ValueError, TypeError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
@@ -22,8 +26,45 @@ def decode_token(token: str) -> TokenPayload:
         )
 
 
-def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
-    to_encode = data.copy()
-    expire = datetime.now(UTC) + (expires_delta or timedelta(minutes=api_settings.token_expiration_in_minutes))
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, api_settings.secret_key.get_secret_value(), algorithm=api_settings.encryption_algorithm)
+async def create_tokens(user: User, refresh_token_repository: RefreshTokenRepository) -> TokenResponse:
+    """
+    Short-lived access token and a refresh token to get the next one without logging in. The refresh token is stored
+    by its id, so that it can be used only once and revoked.
+    """
+    expires_at = datetime.datetime.now(datetime.UTC) + token_service.refresh_token_expiration
+    refresh_token = await refresh_token_repository.create_token(user.id, expires_at)
+    return TokenResponse(
+        access_token=token_service.create_access_token({"sub": str(user.id), "is_admin": user.is_admin}),
+        refresh_token=token_service.create_refresh_token({"sub": str(user.id), "jti": refresh_token.id}),
+    )
+
+
+async def rotate_tokens(
+    refresh_token: str, user_repository: UserRepository, refresh_token_repository: RefreshTokenRepository
+) -> TokenResponse:
+    """Use up the refresh token for a new pair, or revoke all refresh tokens of its user if it was already used."""
+    payload = decode_token(refresh_token, TokenType.REFRESH)
+    # Tokens issued before they were stored have no id and cannot be used anymore
+    if payload.jti is None or await refresh_token_repository.consume_token(payload.jti) != payload.sub:
+        await refresh_token_repository.revoke_user_tokens(payload.sub)
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
+
+    user = await user_repository.get_user(payload.sub)
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
+    return await create_tokens(user, refresh_token_repository)
+
+
+async def hash_password(password: str) -> str:
+    try:
+        return await password_hasher.hash(password)
+    except PasswordHasherBusyError:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Server is busy, try again later")
+
+
+async def verify_password(password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """Check the password, the second value is a new hash to store when the old one uses outdated parameters."""
+    try:
+        return await password_hasher.verify_and_update(password, hashed_password)
+    except PasswordHasherBusyError:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Server is busy, try again later")
@@ -0,0 +1,61 @@
+import csv
+import io
+import json
+from collections.abc import AsyncIterable, AsyncIterator, Sequence
+
+from fastapi.responses import StreamingResponse
+
+from src.schemas import ExportFormat
+
+# Rows are sent in chunks of about this size instead of one by one
+CHUNK_SIZE = 64 * 1024
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+def _csv_value(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, dict | list):
+        return json.dumps(value, ensure_ascii=False)
+    return str(value)
+
+
+async def _encode(
+    rows: AsyncIterable[dict], export_format: ExportFormat, columns: Sequence[str]
+) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if export_format == ExportFormat.CSV:
+        writer.writerow(columns)
+
+    async for row in rows:
+        if export_format == ExportFormat.CSV:
+            writer.writerow([_csv_value(row.get(column)) for column in columns])
+        else:
+            buffer.write(json.dumps(row, ensure_ascii=False))
+            buffer.write("\n")
+
+        if buffer.tell() >= CHUNK_SIZE:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def export_response(
+    rows: AsyncIterable[dict], export_format: ExportFormat, columns: Sequence[str], filename: str
+) -> StreamingResponse:
+    """
+    Stream JSON-compatible rows as NDJSON or CSV while they are fetched. Nested values of CSV rows are written as JSON.
+    """
+    return StreamingResponse(
+        _encode(rows, export_format, columns),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format.value}"'},
+    )
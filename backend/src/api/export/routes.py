@@ -0,0 +1,71 @@
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from fastapi_derive_responses import AutoDeriveResponsesAPIRoute
+
+from src.api.auth.dependencies import require_admin
+from src.api.export.formats import export_response
+from src.api.repositories.dependencies import get_storage
+from src.db import AbstractSQLAlchemyStorage
+from src.db.models import User
+from src.db.repositories import ApplicationRepository, VacancyRepository
+from src.schemas import (
+    ApplicationResponse,
+    AssessmentExportRow,
+    ExportFormat,
+    SkillResponse,
+    VacancyResponse,
+    VacancyWithSkillsResponse,
+)
+
+# Exports are streamed after the endpoint returns, when the request's unit of work is already closed,
+# so rows are read with a session of their own from the base storage
+router = APIRouter(prefix="/export", tags=["Export"], route_class=AutoDeriveResponsesAPIRoute)
+
+
+@router.get("/applications", response_class=StreamingResponse)
+async def export_applications(
+    format: ExportFormat = ExportFormat.NDJSON,
+    _: User = Depends(require_admin),
+    storage: AbstractSQLAlchemyStorage = Depends(get_storage),
+):
+    async def rows() -> AsyncIterator[dict]:
+        async for application in ApplicationRepository(storage).stream_applications():
+            yield ApplicationResponse.model_validate(application).model_dump(mode="json")
+
+    return export_response(rows(), format, list(ApplicationResponse.model_fields), "applications")
+
+
+@router.get("/vacancies", response_class=StreamingResponse)
+async def export_vacancies_with_skills(
+    format: ExportFormat = ExportFormat.NDJSON,
+    _: User = Depends(require_admin),
+    storage: AbstractSQLAlchemyStorage = Depends(get_storage),
+):
+    """NDJSON rows are `VacancyWithSkillsResponse`, CSV rows are vacancy columns and `skills` as JSON."""
+
+    async def rows() -> AsyncIterator[dict]:
+        async for vacancy in VacancyRepository(storage).stream_vacancies(with_skills=True):
+            row = VacancyWithSkillsResponse(
+                vacancy=VacancyResponse.model_validate(vacancy),
+                skills=[SkillResponse.model_validate(skill) for skill in vacancy.skills],
+            ).model_dump(mode="json")
+            if format == ExportFormat.CSV:
+                row = {**row["vacancy"], "skills": row["skills"]}
+            yield row
+
+    return export_response(rows(), format, [*VacancyResponse.model_fields, "skills"], "vacancies")
+
+
+@router.get("/assessments", response_class=StreamingResponse)
+async def export_assessments(
+    format: ExportFormat = ExportFormat.NDJSON,
+    _: User = Depends(require_admin),
+    storage: AbstractSQLAlchemyStorage = Depends(get_storage),
+):
+    async def rows() -> AsyncIterator[dict]:
+        async for row in ApplicationRepository(storage).stream_assessments():
+            yield AssessmentExportRow.model_validate(row).model_dump(mode="json")
+
+    return export_response(rows(), format, list(AssessmentExportRow.model_fields), "assessments")
@@ -1,3 +1,5 @@
+import datetime
+
 from fastapi import APIRouter, BackgroundTasks, HTTPException
 from fastapi.params import Depends
 from fastapi_derive_responses import AutoDeriveResponsesAPIRoute
@@ -12,12 +14,14 @@ from src.api.auth.dependencies import get_current_user
 from src.api.logging_ import logger
 from src.api.repositories.dependencies import (
     get_application_repository,
+    get_github_stats_service,
     get_interview_message_repository,
-    get_post_interview_repository,
-    get_skill_result_repository,
+    get_storage,
 )
-from src.config import open_ai_realtime_settings
-from src.db.models import InterviewMessage, User
+from src.api.utils import extract_cv_text
+from src.config import github_stats_settings, open_ai_realtime_settings
+from src.db import AbstractSQLAlchemyStorage
+from src.db.models import Application, InterviewMessage, User
 from src.db.repositories import (
     ApplicationRepository,
     InterviewMessageRepository,
@@ -26,9 +30,11 @@ from src.db.repositories import (
 )
 from src.schemas import InterviewHistoryRequest, InterviewMessageResponse, Status
 from src.services.ai.assessor import post_interview_assessment
-from src.services.ai.openai_client import async_client
+from src.services.ai.openai_client import openai_scheduler
 from src.services.ai.prompt_builder import build_realtime_prompt
-from src.services.pre_interview.github_eval import parse_github_stats
+from src.services.ai.scheduler import Priority
+from src.services.pre_interview.github_eval import GithubStats
+from src.services.pre_interview.github_stats import GithubStatsService, github_username
 
 router = APIRouter(prefix="/interview", tags=["Interview"], route_class=AutoDeriveResponsesAPIRoute)
 
@@ -37,10 +43,13 @@ async def _run_post_interview_and_update(
     application_id: int,
     transcript: list[InterviewMessage],
     pre_interview,
-    post_interview_repository: PostInterviewResultRepository,
-    application_repository: ApplicationRepository,
-    skill_result_repository: SkillResultRepository,
+    storage: AbstractSQLAlchemyStorage,
 ):
+    # Runs after the response, when the request's unit of work is already closed
+    application_repository = ApplicationRepository(storage)
+    post_interview_repository = PostInterviewResultRepository(storage)
+    skill_result_repository = SkillResultRepository(storage)
+
     application = await application_repository.get_application(application_id)
     vacancy = await application_repository.get_applications_vacancy(application_id)
     res = await post_interview_assessment(
@@ -49,6 +58,7 @@ async def _run_post_interview_and_update(
         transcript=transcript,
         pre_interview_result=pre_interview,
         post_interview_repository=post_interview_repository,
+        application_repository=application_repository,
         skill_results_repository=skill_result_repository,
     )
     new_status = Status.APPROVED if res.is_recommended else Status.REJECTED
@@ -56,13 +66,40 @@ async def _run_post_interview_and_update(
     logger.info(f'Post-interview result for application {application_id} created')
 
 
+async def _get_github_stats(
+    application: Application,
+    application_repository: ApplicationRepository,
+    github_stats_service: GithubStatsService,
+) -> GithubStats | None:
+    """Stats stored with the application, fetched again only when they are too old."""
+    stored = GithubStats.model_validate(application.github_stats) if application.github_stats else None
+    fetched_at = application.github_stats_fetched_at
+    max_age = datetime.timedelta(seconds=github_stats_settings.application_max_age_seconds)
+    if fetched_at is not None and datetime.datetime.now(tz=datetime.UTC) - fetched_at < max_age:
+        return stored
+
+    username = github_username(application.profile_url)
+    if username is None:
+        return None
+    github_info = await github_stats_service.get_stats(username)
+    if github_info is None:
+        # The upstream is unavailable, outdated stats are better than none
+        return stored
+    await application_repository.set_github_stats(application.id, github_info.model_dump(mode="json"))
+    return github_info
+
+
 @router.get("/session")
 async def get_ephemeral_session(
     application_id: int,
     user: User = Depends(get_current_user),
-    application_repository: ApplicationRepository = Depends(get_application_repository),
+    storage: AbstractSQLAlchemyStorage = Depends(get_storage),
+    github_stats_service: GithubStatsService = Depends(get_github_stats_service),
 ) -> ClientSecretCreateResponse:
-    application = await application_repository.get_application(application_id)
+    # Not the request's unit of work: its transaction would stay open during the GitHub and OpenAI calls,
+    # each write here is independent and stored right away instead
+    application_repository = ApplicationRepository(storage)
+    application = await application_repository.get_application(application_id, with_vacancy=True)
     if not application:
         raise HTTPException(status_code=404, detail=f"Application {application_id} not found")
 
@@ -73,14 +110,18 @@ async def get_ephemeral_session(
             f"Current status: {application.status}",
         )
 
-    github_info = None
-    if type(application.profile_url) is str and "github" in application.profile_url:
-        username = application.profile_url.rstrip("/").split("/")[-1]
-        github_info = await parse_github_stats(username)
+    github_info = await _get_github_stats(application, application_repository, github_stats_service)
+
+    if application.cv_text is None:
+        # Applications created before CV text was stored at upload time
+        application.cv_text = await extract_cv_text(application.cv)
+        if application.cv_text is not None:
+            await application_repository.edit_application(application.id, cv_text=application.cv_text)
 
     system_prompt = build_realtime_prompt(application, user, github_info)
     logger.info(system_prompt)
-    session = await async_client.realtime.client_secrets.create(
+    session = await openai_scheduler.create_realtime_client_secret(
+        priority=Priority.INTERACTIVE,
         expires_after=ExpiresAfter(
             anchor="created_at",
             seconds=7200,
@@ -113,11 +154,9 @@ async def upload_message_history(
     background_tasks: BackgroundTasks,
     _: User = Depends(get_current_user),
     message_repository: InterviewMessageRepository = Depends(get_interview_message_repository),
-    post_interview_repository: PostInterviewResultRepository = Depends(get_post_interview_repository),
     application_repository: ApplicationRepository = Depends(get_application_repository),
-    skill_result_repository: SkillResultRepository = Depends(get_skill_result_repository),
+    storage: AbstractSQLAlchemyStorage = Depends(get_storage),
 ) -> list[InterviewMessageResponse]:
-    created_messages = []
     application = await application_repository.get_application(data.application_id)
     if not application:
         raise HTTPException(status_code=404, detail=f"Application {data.application_id} not found")
@@ -128,22 +167,17 @@ async def upload_message_history(
     if not pre_interview:
         raise HTTPException(status_code=404, detail="Pre-interview not found")
 
-    for msg in data.messages:
-        created_message = await message_repository.create_message(
-            role=msg.role,
-            message=msg.message,
-            application_id=data.application_id,
-        )
-        created_messages.append(created_message)
+    created_messages = await message_repository.bulk_create_messages(
+        application_id=data.application_id,
+        items=[{"role": msg.role, "message": msg.message} for msg in data.messages],
+    )
 
     background_tasks.add_task(
         _run_post_interview_and_update,
         application_id=application.id,
         transcript=created_messages,
         pre_interview=pre_interview,
-        post_interview_repository=post_interview_repository,
-        application_repository=application_repository,
-        skill_result_repository=skill_result_repository,
+        storage=storage,
     )
 
     return created_messages
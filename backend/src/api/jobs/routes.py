@@ -0,0 +1,19 @@
+from fastapi import APIRouter, Depends
+from fastapi_derive_responses import AutoDeriveResponsesAPIRoute
+
+from src.api.auth.dependencies import require_admin
+from src.api.repositories.dependencies import get_job_repository
+from src.db.models import User
+from src.db.repositories import JobRepository
+from src.schemas import QueueDepthResponse
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"], route_class=AutoDeriveResponsesAPIRoute)
+
+
+@router.get("/depth")
+async def get_queue_depth(
+    job_repository: JobRepository = Depends(get_job_repository),
+    _: User = Depends(require_admin),
+) -> QueueDepthResponse:
+    depth = await job_repository.get_queue_depth()
+    return QueueDepthResponse.model_validate(depth)
@@ -3,8 +3,12 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
 import src.api.logging_  # noqa: F401
-from src.config import api_settings
+from src.config import api_settings, github_stats_settings
 from src.db import SQLAlchemyStorage
+from src.services.converting import ConvertingRepository
+from src.services.passwords import password_hasher
+from src.services.pdf_text import pdf_text_extractor
+from src.services.pre_interview.github_stats import GithubStatsService
 
 
 @asynccontextmanager
@@ -12,9 +16,22 @@ async def lifespan(app: FastAPI):
     # Application startup
     storage = SQLAlchemyStorage.from_url(api_settings.db_url.get_secret_value())
     app.state.storage = storage
+    converting_repository = ConvertingRepository(
+        instances=api_settings.unoserver_instances,
+        connections_per_instance=api_settings.unoserver_connections_per_instance,
+        timeout_seconds=api_settings.conversion_timeout_seconds,
+        max_queue=api_settings.conversion_queue_size,
+    )
+    app.state.converting_repository = converting_repository
+    github_stats_service = GithubStatsService(storage, github_stats_settings)
+    app.state.github_stats_service = github_stats_service
 
     try:
         yield
     finally:
         # Application shutdown
+        await github_stats_service.close()
         await storage.close_connection()
+        converting_repository.close()
+        pdf_text_extractor.shutdown()
+        password_hasher.shutdown()
@@ -3,25 +3,10 @@ from fastapi import status as http_status
 from fastapi_derive_responses import AutoDeriveResponsesAPIRoute
 
 from src.api.auth.dependencies import require_admin
-from src.api.repositories.dependencies import (
-    get_application_repository,
-    get_interview_message_repository,
-    get_post_interview_repository,
-    get_skill_result_repository,
-)
+from src.api.repositories.dependencies import get_application_repository, get_post_interview_repository
 from src.db.models import User
-from src.db.repositories import (
-    ApplicationRepository,
-    InterviewMessageRepository,
-    PostInterviewResultRepository,
-    SkillResultRepository,
-)
-from src.schemas import (
-    InterviewMessageResponse,
-    PostInterviewResponse,
-    PostInterviewResultResponse,
-    SkillResultResponse,
-)
+from src.db.repositories import ApplicationRepository, PostInterviewResultRepository
+from src.schemas import PostInterviewResponse, PostInterviewResultResponse
 
 router = APIRouter(prefix="/postinterview", tags=["Post-interview results"], route_class=AutoDeriveResponsesAPIRoute)
 
@@ -61,37 +46,19 @@ async def create_post_interview(
 @router.get("/for_application/{application_id}")
 async def get_post_interview_for_application(
     application_id: int,
+    post_interview_repository: PostInterviewResultRepository = Depends(get_post_interview_repository),
     application_repository: ApplicationRepository = Depends(get_application_repository),
-    skill_result_repository: SkillResultRepository = Depends(get_skill_result_repository),
-    message_repository: InterviewMessageRepository = Depends(get_interview_message_repository),
     _: User = Depends(require_admin),
 ) -> PostInterviewResultResponse:
-    application = await application_repository.get_application(application_id)
-    if application is None:
-        raise HTTPException(
-            status_code=404, detail=f"Application {application_id} not found"
-        )
-
-    post_interview = application.post_interview_result
-    if post_interview is None:
+    result = await post_interview_repository.get_application_result_with_details(application_id)
+    if result is None:
+        if await application_repository.get_application(application_id) is None:
+            raise HTTPException(
+                status_code=404, detail=f"Application {application_id} not found"
+            )
         raise HTTPException(404, f"Post interview assessment for application {application_id} not found")
 
-    skill_results = await skill_result_repository.get_application_results(application_id)
-    messages = await message_repository.get_interview_messages(application_id)
-
-    response = PostInterviewResultResponse(
-        id=post_interview.id,
-        is_recommended=post_interview.is_recommended,
-        score=post_interview.score,
-        skill_scores=[SkillResultResponse(id=res.id, score=res.score, skill_id=res.skill_id) for res in skill_results],
-        summary=post_interview.summary,
-        interview_transcript=[InterviewMessageResponse(id=msg.id, role=msg.role, message=msg.message) for msg in messages],
-        interview_summary=post_interview.interview_summary,
-        candidate_response=post_interview.candidate_response,
-        emotional_analysis=post_interview.emotional_analysis,
-        candidate_roadmap=post_interview.candidate_roadmap,
-    )
-    return PostInterviewResultResponse.model_validate(response)
+    return PostInterviewResultResponse.model_validate(result)
 
 
 @router.patch("/{result_id}")
@@ -41,7 +41,7 @@ async def get_pre_interview_for_application(
     application_repository: ApplicationRepository = Depends(get_application_repository),
     _: User = Depends(require_admin),
 ) -> PreInterviewResponse:
-    application = await application_repository.get_application(application_id)
+    application = await application_repository.get_application(application_id, with_results=True)
     if application is None:
         raise HTTPException(
             status_code=404, detail=f"Application {application_id} not found"
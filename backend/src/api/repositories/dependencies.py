@@ -1,19 +1,24 @@
+from collections.abc import AsyncGenerator
+
 from fastapi import Depends, Request
 
-from src.config import api_settings
 from src.db.repositories import (
     ApplicationRepository,
     InterviewMessageRepository,
+    JobRepository,
     PostInterviewResultRepository,
     PreInterviewResultRepository,
+    RefreshTokenRepository,
     SkillRepository,
     SkillResultRepository,
     SkillTypeRepository,
     UserRepository,
+    VacancyExtractionRepository,
     VacancyRepository,
 )
-from src.db.storage import AbstractSQLAlchemyStorage
+from src.db.storage import AbstractSQLAlchemyStorage, UnitOfWork
 from src.services.converting import ConvertingRepository
+from src.services.pre_interview.github_stats import GithubStatsService
 
 
 def get_storage(request: Request) -> AbstractSQLAlchemyStorage:
@@ -23,59 +28,98 @@ def get_storage(request: Request) -> AbstractSQLAlchemyStorage:
     return storage
 
 
-def get_application_repository(
+async def get_unit_of_work(
     storage: AbstractSQLAlchemyStorage = Depends(get_storage),
+) -> AsyncGenerator[UnitOfWork]:
+    """
+    All repositories of a request share this unit of work: one session and one transaction,
+    committed after the endpoint returns and rolled back if it raises.
+    """
+    async with UnitOfWork(storage) as unit_of_work:
+        yield unit_of_work
+
+
+def get_application_repository(
+    storage: AbstractSQLAlchemyStorage = Depends(get_unit_of_work),
 ) -> ApplicationRepository:
     return ApplicationRepository(storage)
 
 
 def get_skill_repository(
-    storage: AbstractSQLAlchemyStorage = Depends(get_storage),
+    storage: AbstractSQLAlchemyStorage = Depends(get_unit_of_work),
 ) -> SkillRepository:
     return SkillRepository(storage)
 
 
 def get_skill_type_repository(
-    storage: AbstractSQLAlchemyStorage = Depends(get_storage),
+    storage: AbstractSQLAlchemyStorage = Depends(get_unit_of_work),
 ) -> SkillTypeRepository:
     return SkillTypeRepository(storage)
 
 
 def get_user_repository(
-    storage: AbstractSQLAlchemyStorage = Depends(get_storage),
+    storage: AbstractSQLAlchemyStorage = Depends(get_unit_of_work),
 ) -> UserRepository:
     return UserRepository(storage)
 
 
+def get_refresh_token_repository(
+    storage: AbstractSQLAlchemyStorage = Depends(get_unit_of_work),
+) -> RefreshTokenRepository:
+    return RefreshTokenRepository(storage)
+
+
 def get_vacancy_repository(
-    storage: AbstractSQLAlchemyStorage = Depends(get_storage),
+    storage: AbstractSQLAlchemyStorage = Depends(get_unit_of_work),
 ) -> VacancyRepository:
     return VacancyRepository(storage)
 
 
 def get_pre_interview_repository(
-    storage: AbstractSQLAlchemyStorage = Depends(get_storage),
+    storage: AbstractSQLAlchemyStorage = Depends(get_unit_of_work),
 ) -> PreInterviewResultRepository:
     return PreInterviewResultRepository(storage)
 
 
 def get_post_interview_repository(
-    storage: AbstractSQLAlchemyStorage = Depends(get_storage),
+    storage: AbstractSQLAlchemyStorage = Depends(get_unit_of_work),
 ) -> PostInterviewResultRepository:
     return PostInterviewResultRepository(storage)
 
 
 def get_interview_message_repository(
-    storage: AbstractSQLAlchemyStorage = Depends(get_storage),
+    storage: AbstractSQLAlchemyStorage = Depends(get_unit_of_work),
 ) -> InterviewMessageRepository:
     return InterviewMessageRepository(storage)
 
 
 def get_skill_result_repository(
-    storage: AbstractSQLAlchemyStorage = Depends(get_storage),
+    storage: AbstractSQLAlchemyStorage = Depends(get_unit_of_work),
 ) -> SkillResultRepository:
     return SkillResultRepository(storage)
 
 
-def get_converting_repository() -> ConvertingRepository:
-    return ConvertingRepository(api_settings.unoserver_server, api_settings.unoserver_port)
+def get_job_repository(
+    storage: AbstractSQLAlchemyStorage = Depends(get_unit_of_work),
+) -> JobRepository:
+    return JobRepository(storage)
+
+
+def get_vacancy_extraction_repository(
+    storage: AbstractSQLAlchemyStorage = Depends(get_unit_of_work),
+) -> VacancyExtractionRepository:
+    return VacancyExtractionRepository(storage)
+
+
+def get_converting_repository(request: Request) -> ConvertingRepository:
+    converting_repository = getattr(request.app.state, "converting_repository", None)
+    if converting_repository is None:
+        raise RuntimeError("Converting repository is not initialized. Check lifespan setup.")
+    return converting_repository
+
+
+def get_github_stats_service(request: Request) -> GithubStatsService:
+    github_stats_service = getattr(request.app.state, "github_stats_service", None)
+    if github_stats_service is None:
+        raise RuntimeError("Github stats service is not initialized. Check lifespan setup.")
+    return github_stats_service
@@ -1,4 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, Response
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from fastapi import status as http_status
 from fastapi_derive_responses import AutoDeriveResponsesAPIRoute
 
@@ -6,7 +8,13 @@ from src.api.auth.dependencies import require_admin
 from src.api.repositories.dependencies import get_skill_repository, get_skill_type_repository, get_vacancy_repository
 from src.db.models import User
 from src.db.repositories import SkillRepository, SkillTypeRepository, VacancyRepository
-from src.schemas import SkillResponse, SkillTypeCreateRequest, SkillTypeResponse, SkillTypeUpdateRequest
+from src.schemas import (
+    PaginationParams,
+    SkillResponse,
+    SkillTypeCreateRequest,
+    SkillTypeResponse,
+    SkillTypeUpdateRequest,
+)
 
 skills_router = APIRouter(prefix="/skills", tags=["Skills"], route_class=AutoDeriveResponsesAPIRoute)
 
@@ -117,10 +125,13 @@ async def get_skill_type(
 
 @skills_type_router.get("")
 async def get_all_skill_types(
+    pagination: Annotated[PaginationParams, Query()],
     skills_repository: SkillTypeRepository = Depends(get_skill_type_repository),
     _: User = Depends(require_admin),
 ) -> list[SkillTypeResponse]:
-    skill_types = await skills_repository.get_all_skill_types()
+    skill_types = await skills_repository.get_all_skill_types(
+        after_id=pagination.after_id, limit=pagination.limit, order=pagination.order
+    )
     return [SkillTypeResponse.model_validate(type) for type in skill_types]
 
 
@@ -1,18 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException, Response
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from fastapi import status as http_status
 from fastapi_derive_responses import AutoDeriveResponsesAPIRoute
-from passlib.context import CryptContext
 
+from src.api.auth.cache import principal_cache
 from src.api.auth.dependencies import get_current_user, require_admin
-from src.api.repositories.dependencies import get_user_repository
+from src.api.auth.util import hash_password
+from src.api.repositories.dependencies import get_refresh_token_repository, get_unit_of_work, get_user_repository
 from src.db.models import User
-from src.db.repositories import UserRepository
-from src.schemas import RegisterRequest, UserCreate, UserResponse
+from src.db.repositories import RefreshTokenRepository, UserRepository
+from src.db.storage import UnitOfWork
+from src.schemas import RegisterRequest, UserCreate, UserListParams, UserResponse
 
 router = APIRouter(prefix="/users", tags=["Users"], route_class=AutoDeriveResponsesAPIRoute)
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 
 @router.post("", status_code=http_status.HTTP_201_CREATED)
 async def create_user(
@@ -24,7 +26,7 @@ async def create_user(
     if existing:
         raise HTTPException(status_code=409, detail="Email already in use")
 
-    hashed = pwd_context.hash(payload.password)
+    hashed = await hash_password(payload.password)
     user = await user_repository.create_user(
         name=payload.name,
         email=str(payload.email),
@@ -36,10 +38,11 @@ async def create_user(
 
 @router.get("")
 async def list_users(
+    params: Annotated[UserListParams, Query()],
     _: User = Depends(require_admin),
     user_repository: UserRepository = Depends(get_user_repository),
 ) -> list[UserResponse]:
-    users = await user_repository.list_users()
+    users = await user_repository.list_users(**params.model_dump())
     return [UserResponse.model_validate(user) for user in users]
 
 
@@ -53,7 +56,7 @@ async def register(
     if existing:
         raise HTTPException(status_code=409, detail="Email already in use")
 
-    hashed = pwd_context.hash(payload.password)
+    hashed = await hash_password(payload.password)
     user = await user_repository.create_user(
         name=payload.name,
         email=str(payload.email),
@@ -86,6 +89,8 @@ async def edit_user_endpoint(
     is_admin: bool | None = None,
     current_user: User = Depends(get_current_user),
     user_repository: UserRepository = Depends(get_user_repository),
+    refresh_token_repository: RefreshTokenRepository = Depends(get_refresh_token_repository),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work),
 ) -> UserResponse:
     if current_user.id != user_id and not current_user.is_admin:
         raise HTTPException(status_code=403, detail="Forbidden")
@@ -96,7 +101,7 @@ async def edit_user_endpoint(
     if email is not None:
         update_kwargs["email"] = email
     if password is not None:
-        update_kwargs["hashed_password"] = pwd_context.hash(password)
+        update_kwargs["hashed_password"] = await hash_password(password)
     if is_admin is not None:
         if not current_user.is_admin:
             raise HTTPException(status_code=403, detail="Only admins can change admin flag")
@@ -108,6 +113,11 @@ async def edit_user_endpoint(
     edited = await user_repository.edit_user(user_id, **update_kwargs)
     if edited is None:
         raise HTTPException(status_code=404, detail=f"User {user_id} not found")
+    if password is not None:
+        # Sessions started with the old password end when their access tokens expire
+        await refresh_token_repository.revoke_user_tokens(user_id)
+    # Until the commit other requests still read the old row and could cache it again
+    unit_of_work.after_commit(lambda: principal_cache.invalidate(user_id))
     return UserResponse.model_validate(edited)
 
 
@@ -116,9 +126,11 @@ async def delete_user_endpoint(
     user_id: int,
     _: User = Depends(require_admin),
     user_repository: UserRepository = Depends(get_user_repository),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work),
 ):
     deleted = await user_repository.delete_user(user_id)
     if deleted is None:
         raise HTTPException(status_code=404, detail=f"User {user_id} not found")
+    unit_of_work.after_commit(lambda: principal_cache.invalidate(user_id))
 
     return Response(status_code=http_status.HTTP_204_NO_CONTENT)
@@ -5,8 +5,12 @@ from uuid import uuid4
 from fastapi import HTTPException, UploadFile
 from starlette.concurrency import run_in_threadpool
 
+from src.api.logging_ import logger
 from src.config import api_settings
-from src.services.converting import ConvertingRepository
+from src.services.converting import ConversionCache, ConversionQueueFullError, ConvertingRepository
+from src.services.pdf_text import pdf_text_extractor
+
+conversion_cache = ConversionCache(api_settings.files_dir / "conversion_cache", api_settings.conversion_cache_max_bytes)
 
 
 async def save_upload_to_path(upload: UploadFile, dest_path: Path) -> None:
@@ -29,28 +33,44 @@ async def save_file_as_pdf(file: UploadFile, converting_repository: ConvertingRe
     if ext not in allowed_extensions:
         raise HTTPException(status_code=400, detail="Unsupported file type")
 
-    file_id = str(uuid4())
-    original_safe_name = f"{file_id}{ext}"
-    pdf_safe_name = f"{file_id}.pdf"
-
-    original_path = (api_settings.files_dir / "cv" / original_safe_name).resolve()
-    pdf_path = (api_settings.files_dir / "cv" / pdf_safe_name).resolve()
+    pdf_path = (api_settings.files_dir / "cv" / f"{uuid4()}.pdf").resolve()
 
     base_dir = api_settings.files_dir.resolve()
-    for path in [original_path, pdf_path]:
-        if not str(path).startswith(str(base_dir)):
-            raise HTTPException(status_code=400, detail="Invalid file destination")
-
-    await save_upload_to_path(file, original_path)
+    if not str(pdf_path).startswith(str(base_dir)):
+        raise HTTPException(status_code=400, detail="Invalid file destination")
 
     if ext == ".pdf":
-        return original_path
+        await save_upload_to_path(file, pdf_path)
+        return pdf_path
 
-    try:
-        converting_repository.any2pdf(str(original_path), str(pdf_path))
-        original_path.unlink(missing_ok=True)
+    # Documents are converted in memory, the original is never written to disk
+    data = await file.read()
+    await file.close()
+
+    # The same documents are uploaded again and again, so converted files are reused by content
+    cache_key = ConversionCache.key(data)
+    if await conversion_cache.link(cache_key, pdf_path):
         return pdf_path
+
+    try:
+        pdf = await converting_repository.convert(data)
+    except ConversionQueueFullError:
+        raise HTTPException(status_code=503, detail="Too many documents are being converted, try again later")
+    except TimeoutError:
+        raise HTTPException(status_code=504, detail="Converting file to PDF took too long")
     except Exception as e:
-        original_path.unlink(missing_ok=True)
-        pdf_path.unlink(missing_ok=True)
         raise HTTPException(status_code=500, detail=f"Failed to convert file to PDF: {str(e)}")
+
+    pdf_path.parent.mkdir(parents=True, exist_ok=True)
+    await run_in_threadpool(pdf_path.write_bytes, pdf)
+    await conversion_cache.store(cache_key, pdf)
+    return pdf_path
+
+
+async def extract_cv_text(pdf_path: Path | str) -> str | None:
+    """Extracts text from the PDF in the extraction process pool. Returns None if the file cannot be parsed in time."""
+    try:
+        return await pdf_text_extractor.extract_text(pdf_path)
+    except Exception as e:
+        logger.warning(f"Failed to extract text from {pdf_path}: {e}")
+        return None
@@ -1,25 +1,37 @@
 from pathlib import Path
+from typing import Annotated
 
-from fastapi import APIRouter, Depends, File, HTTPException, Response, UploadFile
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, Response, UploadFile
 from fastapi import status as http_status
 from fastapi_derive_responses import AutoDeriveResponsesAPIRoute
 
 from src.api.auth.dependencies import get_current_user, require_admin
-from src.api.repositories.dependencies import get_converting_repository, get_skill_repository, get_vacancy_repository
+from src.api.logging_ import logger
+from src.api.repositories.dependencies import (
+    get_converting_repository,
+    get_skill_repository,
+    get_storage,
+    get_vacancy_extraction_repository,
+    get_vacancy_repository,
+)
 from src.api.utils import save_file_as_pdf
+from src.db import AbstractSQLAlchemyStorage
 from src.db.models import User
-from src.db.repositories import SkillRepository, VacancyRepository
+from src.db.repositories import SkillRepository, VacancyExtractionRepository, VacancyRepository
 from src.schemas import (
     SkillResponse,
     VacancyCreateRequest,
     VacancyEditRequest,
     VacancyFromFile,
+    VacancyImportResponse,
+    VacancyListParams,
     VacancyResponse,
     VacancyWithSkillsCreateRequest,
     VacancyWithSkillsResponse,
 )
-from src.services.ai.vacancy_filler import fill_vacancy_from_file
+from src.services.ai.vacancy_filler import VACANCY_PROMPT_VERSION, fill_vacancy_from_file
 from src.services.converting import ConvertingRepository
+from src.services.vacancy_import import RowError, VacancyImporter, iter_csv_rows, iter_lines, iter_ndjson_rows
 
 router = APIRouter(prefix="/vacancy", tags=["Vacancy"], route_class=AutoDeriveResponsesAPIRoute)
 
@@ -71,15 +83,11 @@ async def create_vacancy_with_skills(
         user_id=user.id,
     )
 
-    skills = []
-    for skill_request in request.skills:
-        skill = await skill_repository.create_skill(
-            weight=skill_request.weight,
-            details=skill_request.details,
-            skill_type_id=skill_request.skill_type_id,
-            vacancy_id=vacancy.id,
-        )
-        skills.append(skill)
+    # Both inserts run in the request's transaction, so a bad skill does not leave a vacancy without skills
+    skills = await skill_repository.bulk_create_skills(
+        vacancy_id=vacancy.id,
+        items=[skill_request.model_dump() for skill_request in request.skills],
+    )
 
     return VacancyWithSkillsResponse(
         vacancy=VacancyResponse.model_validate(vacancy),
@@ -87,12 +95,55 @@ async def create_vacancy_with_skills(
     )
 
 
+@router.post(
+    "/import",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/x-ndjson": {"schema": {"type": "string"}},
+                "text/csv": {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+async def import_vacancies(
+    http_request: Request,
+    user: User = Depends(require_admin),
+    storage: AbstractSQLAlchemyStorage = Depends(get_storage),
+) -> VacancyImportResponse:
+    """
+    Bulk create vacancies with skills from a streamed body.
+
+    NDJSON: one `VacancyWithSkillsCreateRequest` object per line.
+    CSV: a header with vacancy fields as columns and a `skills` column holding a JSON list of skills.
+
+    Rows are committed in batches, rows that fail validation or insertion are reported in `errors`.
+    """
+    content_type = http_request.headers.get("content-type", "").split(";")[0].strip().lower()
+    lines = iter_lines(http_request.stream())
+    if content_type == "text/csv":
+        rows = iter_csv_rows(lines)
+    elif content_type in ("application/x-ndjson", "application/jsonl", "application/json-lines"):
+        rows = iter_ndjson_rows(lines)
+    else:
+        raise HTTPException(415, "Expected application/x-ndjson or text/csv body")
+
+    # Batches are committed on their own, not in the request's unit of work
+    importer = VacancyImporter(storage, user_id=user.id)
+    try:
+        return await importer.run(rows)
+    except RowError as e:
+        raise HTTPException(400, str(e))
+
+
 @router.get("/with_skills")
 async def get_all_vacancies_with_skills(
+    params: Annotated[VacancyListParams, Query()],
     _: User = Depends(get_current_user),
     vacancy_repository: VacancyRepository = Depends(get_vacancy_repository),
 ) -> list[VacancyWithSkillsResponse]:
-    vacancies = await vacancy_repository.get_all_vacancies()
+    vacancies = await vacancy_repository.get_all_vacancies(with_skills=True, **params.model_dump())
 
     results: list[VacancyWithSkillsResponse] = []
     for vacancy in vacancies:
@@ -125,7 +176,7 @@ async def get_vacancy_with_skills(
     _: User = Depends(get_current_user),
     vacancy_repository: VacancyRepository = Depends(get_vacancy_repository),
 ) -> VacancyWithSkillsResponse:
-    vacancy = await vacancy_repository.get_vacancy(vacancy_id)
+    vacancy = await vacancy_repository.get_vacancy(vacancy_id, with_skills=True)
     if vacancy is None:
         raise HTTPException(status_code=404, detail=f"Vacancy {vacancy_id} not found")
 
@@ -137,10 +188,11 @@ async def get_vacancy_with_skills(
 
 @router.get("")
 async def get_all_vacancies(
+    params: Annotated[VacancyListParams, Query()],
     _: User = Depends(get_current_user),
     vacancy_repository: VacancyRepository = Depends(get_vacancy_repository),
 ) -> list[VacancyResponse]:
-    vacancies = await vacancy_repository.get_all_vacancies()
+    vacancies = await vacancy_repository.get_all_vacancies(**params.model_dump())
     return [VacancyResponse.model_validate(vac) for vac in vacancies]
 
 
@@ -149,11 +201,15 @@ async def get_vacancy_from_file(
     file: UploadFile = File(...),
     _: User = Depends(require_admin),
     converting_repository: ConvertingRepository = Depends(get_converting_repository),
+    storage: AbstractSQLAlchemyStorage = Depends(get_storage),
 ) -> VacancyFromFile:
     dest_path: Path = await save_file_as_pdf(file, converting_repository)
 
     try:
-        result = await fill_vacancy_from_file(filepath=dest_path)
+        # Not the request's unit of work, that would keep its transaction open during the model call
+        result = await fill_vacancy_from_file(
+            filepath=dest_path, vacancy_extraction_repository=VacancyExtractionRepository(storage)
+        )
         return result
     except Exception as e:
         # Bubble up as a 502 to signify upstream model/service failure
@@ -165,6 +221,20 @@ async def get_vacancy_from_file(
             pass
 
 
+@router.delete("/from_file/cache", status_code=http_status.HTTP_204_NO_CONTENT)
+async def invalidate_vacancy_from_file_cache(
+    only_outdated: bool = True,
+    _: User = Depends(require_admin),
+    vacancy_extraction_repository: VacancyExtractionRepository = Depends(get_vacancy_extraction_repository),
+):
+    """Drop memoised `/vacancy/from_file` results: by default only the ones made with older prompt versions."""
+    deleted = await vacancy_extraction_repository.delete_results(
+        keep_prompt_version=VACANCY_PROMPT_VERSION if only_outdated else None
+    )
+    logger.info(f"Invalidated {deleted} cached vacancy extractions")
+    return Response(status_code=http_status.HTTP_204_NO_CONTENT)
+
+
 @router.patch("/{vacancy_id}")
 async def edit_vacancy(
     vacancy_id: int,
@@ -1,10 +1,23 @@
 import os
 from pathlib import Path
 
-from src.config_schema import ApiSettings, OpenAIRealtimeSettings, OpenAITextSettings, Settings
+from src.config_schema import (
+    ApiSettings,
+    GithubStatsSettings,
+    OpenAIRealtimeSettings,
+    OpenAITextSettings,
+    PasswordHashingSettings,
+    PdfTextSettings,
+    Settings,
+    WorkerSettings,
+)
 
 settings_path = os.getenv("SETTINGS_PATH", "settings.yaml")
 settings: Settings = Settings.from_yaml(Path(settings_path))
 api_settings: ApiSettings | None = settings.api_settings
 open_ai_text_settings: OpenAITextSettings | None = settings.open_ai_text_settings
 open_ai_realtime_settings: OpenAIRealtimeSettings | None = settings.open_ai_realtime_settings
+pdf_text_settings: PdfTextSettings = settings.pdf_text_settings
+github_stats_settings: GithubStatsSettings = settings.github_stats_settings
+password_hashing_settings: PasswordHashingSettings = settings.password_hashing_settings
+worker_settings: WorkerSettings = settings.worker_settings
@@ -22,12 +22,42 @@ class ApiSettings(BaseModel):
     secret_key: SecretStr = Field(..., example="xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx")
     encryption_algorithm: str = "HS256"
     "The encryption algorithm for encryption/decryption in auth"
+    private_key_path: Path | None = None
+    "PEM private key signing the tokens, required for asymmetric algorithms (RS*, ES*), `secret_key` is used otherwise"
+    public_key_path: Path | None = None
+    "PEM public key verifying the tokens, published at /auth/jwks so that other services can verify tokens themselves"
     token_expiration_in_minutes: int = 60
     "Token expiration time in minutes"
+    refresh_token_expiration_in_days: int = 30
+    "Refresh token expiration time in days, a new access token can be obtained with it at /auth/refresh"
+    token_cache_max_size: int = 10_000
+    "How many decoded tokens are kept in memory until they expire"
+    principal_cache_ttl_seconds: float = 30.0
+    "How long an authenticated user is served from memory before it is loaded again, 0 disables the cache"
+    principal_cache_max_size: int = 10_000
+    "How many authenticated users are kept in memory"
     unoserver_server: str
     "The unoserver URL"
     unoserver_port: int
     "The unoserver port"
+    unoserver_extra_instances: list[str] = []
+    'Additional unoserver instances as "host:port", conversions are spread over all of them'
+    unoserver_connections_per_instance: int = 2
+    "How many conversions are sent to one unoserver instance at the same time"
+    conversion_timeout_seconds: float = 60.0
+    "Conversion of a single document is aborted after this time"
+    conversion_queue_size: int = 32
+    "How many conversions may wait for a free unoserver connection before new ones are rejected"
+    conversion_cache_max_bytes: int = 1024**3
+    "Size limit of the converted PDFs cache in `files_dir`, least recently used files are removed first"
+
+    @property
+    def unoserver_instances(self) -> list[tuple[str, int]]:
+        instances = [(self.unoserver_server, self.unoserver_port)]
+        for instance in self.unoserver_extra_instances:
+            host, _, port = instance.rpartition(":")
+            instances.append((host, int(port)))
+        return instances
 
 
 class OpenAITextSettings(BaseModel):
@@ -35,6 +65,18 @@ class OpenAITextSettings(BaseModel):
     "OpenAI API key"
     model: str = Field(...)
     "OpenAI text model"
+    requests_per_minute: int = 500
+    "Requests per minute allowed for the API key, adjusted at runtime from the rate limit headers"
+    tokens_per_minute: int = 500_000
+    "Tokens per minute allowed for the API key, adjusted at runtime from the rate limit headers"
+    budget_share: float = Field(1.0, gt=0, le=1)
+    "Part of the per-minute budgets used by one process, each tracks its own: 1 / (API + job worker processes)"
+    max_concurrency: int = 16
+    "Maximum number of simultaneous requests to OpenAI from one process"
+    max_retries: int = 5
+    "How many times a rate limited or failed request is retried"
+    vacancy_extraction_cache_ttl_seconds: int = 30 * 24 * 60 * 60
+    "How long fields extracted from a vacancy document are reused for the same file, model and prompt"
 
 
 class OpenAIRealtimeSettings(BaseModel):
@@ -52,11 +94,77 @@ class OpenAIRealtimeSettings(BaseModel):
     "Realtime of OpenAI ephemeral token for WebRTC connection"
 
 
+class PdfTextSettings(BaseModel):
+    backend: str = "pypdf2"
+    "Library used to extract text from PDFs"
+    max_workers: int | None = None
+    "How many documents are extracted at the same time, each in its own process, defaults to the number of CPU cores"
+    max_pages: int = 30
+    "Pages after this one are ignored"
+    timeout_seconds: float = 20.0
+    "Extraction of a single document is aborted after this time"
+    pages_per_chunk: int = 4
+    "How many pages are sent back by the extraction process at once"
+
+
+class GithubStatsSettings(BaseModel):
+    base_url: str = "https://github-readme-stats.vercel.app"
+    "github-readme-stats instance, e.g. a self-hosted one or a local fake for tests"
+    connect_timeout_seconds: float = 3.0
+    "Connecting to the instance is aborted after this time"
+    timeout_seconds: float = 10.0
+    "A stats card is not waited for longer than this"
+    max_connections: int = 20
+    "Maximum number of simultaneous connections to the instance from one process"
+    max_keepalive_connections: int = 10
+    "How many idle connections are kept open for reuse"
+    fresh_ttl_seconds: int = 6 * 60 * 60
+    "Cached stats younger than this are returned as is"
+    stale_ttl_seconds: int = 7 * 24 * 60 * 60
+    "Cached stats younger than this are returned right away and refreshed in the background"
+    application_max_age_seconds: int = 24 * 60 * 60
+    "Stats stored with an application are fetched again at interview start when older than this"
+    failure_threshold: int = 5
+    "Consecutive failed requests after which the instance is not called for `recovery_seconds`"
+    recovery_seconds: float = 60.0
+    "How long requests are skipped once `failure_threshold` is reached"
+
+
+class PasswordHashingSettings(BaseModel):
+    rounds: int = Field(12, ge=4, le=31)
+    "bcrypt cost factor, stored hashes with a different one are rehashed on the next successful login"
+    max_workers: int | None = None
+    "Size of the hashing thread pool, defaults to the number of CPU cores"
+    max_waiting: int = 64
+    "How many hashes may wait for a free thread before new ones are rejected"
+
+
+class WorkerSettings(BaseModel):
+    concurrency: int = 4
+    "Maximum number of jobs processed concurrently by one worker process"
+    poll_interval_seconds: float = 1.0
+    "How long to sleep when the queue is empty"
+    max_attempts: int = 5
+    "How many times a job is tried before it is marked as failed"
+    retry_base_delay_seconds: float = 10.0
+    "Delay before the first retry, doubled on every following attempt"
+    retry_max_delay_seconds: float = 600.0
+    "Upper bound for the retry delay"
+    lock_timeout_seconds: int = 900
+    "Running jobs locked for longer than this are considered abandoned and claimed again"
+    job_timeout_seconds: float = 600.0
+    "Jobs running longer than this are cancelled and retried, must be below `lock_timeout_seconds`"
+
+
 class Settings(BaseModel):
     model_config = ConfigDict(json_schema_extra={"title": "Settings"}, extra="ignore")
     api_settings: ApiSettings | None = None
     open_ai_text_settings: OpenAITextSettings | None = None
     open_ai_realtime_settings: OpenAIRealtimeSettings | None = None
+    pdf_text_settings: PdfTextSettings = PdfTextSettings()
+    github_stats_settings: GithubStatsSettings = GithubStatsSettings()
+    password_hashing_settings: PasswordHashingSettings = PasswordHashingSettings()
+    worker_settings: WorkerSettings = WorkerSettings()
 
     @classmethod
     def from_yaml(cls, path: Path) -> "Settings":
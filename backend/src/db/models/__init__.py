@@ -1,22 +1,30 @@
 from src.db.models.base import Base  # noqa: I001
 
 from src.db.models.application import Application
+from src.db.models.github_stats import GithubStatsCache
 from src.db.models.interview import InterviewMessage
+from src.db.models.job import Job
 from src.db.models.post_interview import PostInterviewResult
 from src.db.models.pre_interview import PreInterviewResult
+from src.db.models.refresh_token import RefreshToken
 from src.db.models.skill import Skill, SkillResult, SkillType
 from src.db.models.user import User
 from src.db.models.vacancy import Vacancy
+from src.db.models.vacancy_extraction import VacancyExtraction
 
 __all__ = [
     'Application',
     'Base',
+    'GithubStatsCache',
     'Skill',
     'SkillType',
     'SkillResult',
     'PreInterviewResult',
     'PostInterviewResult',
+    'RefreshToken',
     'InterviewMessage',
+    'Job',
     'User',
     'Vacancy',
+    'VacancyExtraction',
 ]
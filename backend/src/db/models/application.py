@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import JSON, DateTime, ForeignKey, Index, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.db.models import Base
@@ -23,26 +24,38 @@ class Application(Base):
 
     cv: Mapped[str]
     'Path to the CV'
+    cv_sha256: Mapped[str | None] = mapped_column(index=True)
+    'SHA-256 of the CV file, used to share uploaded files between applications'
+    cv_file_id: Mapped[str | None]
+    'Id of the CV uploaded to the OpenAI Files API'
+    cv_text: Mapped[str | None] = mapped_column(Text, nullable=True)
+    'Text extracted from the CV at upload time'
     status: Mapped[str]
 
     profile_url: Mapped[str | None]
+    github_stats: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    '`GithubStats` of `profile_url`, filled in by the github stats job'
+    github_stats_fetched_at: Mapped[datetime.datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    'When the github stats were last fetched, also set when the profile had none'
     user_id: Mapped[int] = mapped_column(ForeignKey('user.id', ondelete='CASCADE'))
     vacancy_id: Mapped[int] = mapped_column(ForeignKey('vacancy.id', ondelete='CASCADE'))
+    created_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     user: Mapped[User] = relationship(
         'User',
         back_populates='applications',
-        lazy='selectin',
+        lazy='raise',
     )
     vacancy: Mapped[Vacancy] = relationship(
         "Vacancy",
         back_populates="applications",
-        lazy="selectin",
+        lazy="raise",
     )
     pre_interview_result: Mapped[PreInterviewResult] = relationship(
         "PreInterviewResult",
         back_populates="application",
-        lazy="selectin",
+        lazy="raise",
+        passive_deletes=True,
         cascade="all, delete-orphan",
         uselist=False,
         single_parent=True,
@@ -50,7 +63,8 @@ class Application(Base):
     post_interview_result: Mapped[PostInterviewResult] = relationship(
         "PostInterviewResult",
         back_populates="application",
-        lazy="selectin",
+        lazy="raise",
+        passive_deletes=True,
         cascade="all, delete-orphan",
         uselist=False,
         single_parent=True,
@@ -58,12 +72,22 @@ class Application(Base):
     interview_messages: Mapped[list[InterviewMessage]] = relationship(
         "InterviewMessage",
         back_populates="application",
-        lazy="selectin",
+        lazy="raise",
+        passive_deletes=True,
         cascade="all, delete-orphan",
     )
     skill_results: Mapped[list[SkillResult]] = relationship(
         "SkillResult",
         back_populates="application",
-        lazy="selectin",
+        lazy="raise",
+        passive_deletes=True,
         cascade="all, delete-orphan",
     )
+
+    __table_args__ = (
+        # Keyset pagination of the filtered application lists, also serve the foreign key lookups
+        Index('ix_application_status_id', 'status', 'id'),
+        Index('ix_application_vacancy_id_id', 'vacancy_id', 'id'),
+        Index('ix_application_user_id_id', 'user_id', 'id'),
+        Index('ix_application_created_at', 'created_at'),
+    )
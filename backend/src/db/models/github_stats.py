@@ -0,0 +1,16 @@
+import datetime
+
+from sqlalchemy import JSON, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.db.models import Base
+
+
+class GithubStatsCache(Base):
+    __tablename__ = "github_stats_cache"
+
+    username: Mapped[str] = mapped_column(primary_key=True)
+    "Lowercase GitHub username"
+    stats: Mapped[dict] = mapped_column(JSON)
+    "Parsed `GithubStats`"
+    fetched_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True))
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.db.models import Base
@@ -18,10 +18,16 @@ class InterviewMessage(Base):
 
     role: Mapped[str]
     message: Mapped[str]
+    position: Mapped[int] = mapped_column(default=0)
+    "Order of the message in the application's transcript"
 
     application_id: Mapped[int] = mapped_column(ForeignKey("application.id", ondelete="CASCADE"))
     application: Mapped[Application] = relationship(
         "Application",
         back_populates="interview_messages",
-        lazy="selectin",
+        lazy="raise",
+    )
+
+    __table_args__ = (
+        UniqueConstraint("application_id", "position", name="uq_interview_message_application_id_position"),
     )
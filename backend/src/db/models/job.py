@@ -0,0 +1,28 @@
+import datetime
+
+from sqlalchemy import JSON, DateTime, Index, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.db.models import Base
+
+
+class Job(Base):
+    __tablename__ = "job"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+    kind: Mapped[str]
+    payload: Mapped[dict] = mapped_column(JSON, default=dict)
+    status: Mapped[str]
+
+    attempts: Mapped[int] = mapped_column(default=0)
+    max_attempts: Mapped[int]
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    run_after: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    "The job is not claimed before this moment, used for retries with backoff"
+    locked_at: Mapped[datetime.datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    "When the job was claimed by a worker"
+    created_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (Index("ix_job_status_run_after", "status", "run_after"),)
@@ -32,5 +32,5 @@ class PostInterviewResult(Base):
     application: Mapped[Application] = relationship(
         "Application",
         back_populates="post_interview_result",
-        lazy="selectin",
+        lazy="raise",
     )
@@ -28,5 +28,5 @@ class PreInterviewResult(Base):
     application: Mapped[Application] = relationship(
         "Application",
         back_populates="pre_interview_result",
-        lazy="selectin",
+        lazy="raise",
     )
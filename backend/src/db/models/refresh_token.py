@@ -0,0 +1,15 @@
+import datetime
+
+from sqlalchemy import DateTime, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.db.models import Base
+
+
+class RefreshToken(Base):
+    __tablename__ = "refresh_token"
+
+    id: Mapped[str] = mapped_column(primary_key=True)
+    "The `jti` claim of the token, the row is deleted once the token is used or revoked"
+    user_id: Mapped[int] = mapped_column(ForeignKey("user.id", ondelete="CASCADE"), index=True)
+    expires_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True))
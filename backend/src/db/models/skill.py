@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.db.models import Base
@@ -21,7 +21,8 @@ class SkillType(Base):
     skills: Mapped[list[Skill]] = relationship(
         'Skill',
         back_populates='skill_type',
-        lazy='selectin',
+        lazy='raise',
+        passive_deletes=True,
     )
 
 
@@ -33,23 +34,24 @@ class Skill(Base):
     weight: Mapped[float]
     details: Mapped[str]
 
-    skill_type_id: Mapped[int] = mapped_column(ForeignKey('skill_type.id', ondelete='CASCADE'))
-    vacancy_id: Mapped[int] = mapped_column(ForeignKey('vacancy.id', ondelete='CASCADE'))
+    skill_type_id: Mapped[int] = mapped_column(ForeignKey('skill_type.id', ondelete='CASCADE'), index=True)
+    vacancy_id: Mapped[int] = mapped_column(ForeignKey('vacancy.id', ondelete='CASCADE'), index=True)
 
     skill_type: Mapped[SkillType] = relationship(
         'SkillType',
         back_populates='skills',
-        lazy='selectin',
+        lazy='raise',
     )
     vacancy: Mapped[Vacancy] = relationship(
         "Vacancy",
         back_populates="skills",
-        lazy="selectin",
+        lazy="raise",
     )
     skill_results: Mapped[list[SkillResult]] = relationship(
         'SkillResult',
         back_populates='skill',
-        lazy='selectin',
+        lazy='raise',
+        passive_deletes=True,
     )
 
 
@@ -60,16 +62,18 @@ class SkillResult(Base):
 
     score: Mapped[float]
 
-    skill_id: Mapped[int] = mapped_column(ForeignKey('skill.id', ondelete='CASCADE'))
+    skill_id: Mapped[int] = mapped_column(ForeignKey('skill.id', ondelete='CASCADE'), index=True)
     application_id: Mapped[int] = mapped_column(ForeignKey('application.id', ondelete='CASCADE'))
 
     skill: Mapped[Skill] = relationship(
         'Skill',
         back_populates='skill_results',
-        lazy='selectin',
+        lazy='raise',
     )
     application: Mapped[Application] = relationship(
         'Application',
         back_populates='skill_results',
-        lazy='selectin',
+        lazy='raise',
     )
+
+    __table_args__ = (Index('ix_skill_result_application_id_skill_id', 'application_id', 'skill_id'),)
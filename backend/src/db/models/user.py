@@ -25,10 +25,12 @@ class User(Base):
     applications: Mapped[list[Application]] = relationship(
         'Application',
         back_populates='user',
-        lazy='selectin',
+        lazy='raise',
+        passive_deletes=True,
     )
     vacancies: Mapped[list[Vacancy]] = relationship(
         'Vacancy',
         back_populates='user',
-        lazy='selectin',
+        lazy='raise',
+        passive_deletes=True,
     )
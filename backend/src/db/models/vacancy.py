@@ -4,7 +4,7 @@ import datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DECIMAL, DateTime, ForeignKey, Text
+from sqlalchemy import DECIMAL, DateTime, ForeignKey, Index, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.db.models import Base
@@ -40,21 +40,35 @@ class Vacancy(Base):
     )
 
     is_active: Mapped[bool] = mapped_column(default=True)
+    # Moved on any change of the vacancy or its skills, keys the cached prompt blocks built from them
+    updated_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
 
-    user_id: Mapped[int] = mapped_column(ForeignKey('user.id', ondelete='CASCADE'))
+    user_id: Mapped[int] = mapped_column(ForeignKey('user.id', ondelete='CASCADE'), index=True)
 
     applications: Mapped[list[Application]] = relationship(
         'Application',
         back_populates='vacancy',
-        lazy='selectin',
+        lazy='raise',
+        passive_deletes=True,
     )
     skills: Mapped[list[Skill]] = relationship(
         'Skill',
         back_populates='vacancy',
-        lazy='selectin',
+        lazy='raise',
+        passive_deletes=True,
     )
     user: Mapped[User] = relationship(
         'User',
         back_populates='vacancies',
-        lazy='selectin',
+        lazy='raise',
+    )
+
+    __table_args__ = (
+        # Keyset pagination of the filtered vacancy lists
+        Index('ix_vacancy_is_active_id', 'is_active', 'id'),
+        Index('ix_vacancy_city_id', 'city', 'id'),
     )
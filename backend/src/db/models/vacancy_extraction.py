@@ -0,0 +1,22 @@
+import datetime
+
+from sqlalchemy import JSON, DateTime, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.db.models import Base
+
+
+class VacancyExtraction(Base):
+    __tablename__ = "vacancy_extraction_cache"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+    document_hash: Mapped[str]
+    "SHA-256 of the vacancy PDF"
+    model: Mapped[str]
+    prompt_version: Mapped[str]
+    result: Mapped[dict] = mapped_column(JSON)
+    "Extracted `VacancyFromFile`"
+    created_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (UniqueConstraint("document_hash", "model", "prompt_version"),)
@@ -1,19 +1,27 @@
 from src.db.repositories.application import ApplicationRepository
+from src.db.repositories.github_stats import GithubStatsCacheRepository
 from src.db.repositories.interview import InterviewMessageRepository
+from src.db.repositories.job import JobRepository
 from src.db.repositories.post_interview import PostInterviewResultRepository
 from src.db.repositories.pre_interview import PreInterviewResultRepository
+from src.db.repositories.refresh_token import RefreshTokenRepository
 from src.db.repositories.skill import SkillRepository, SkillResultRepository, SkillTypeRepository
 from src.db.repositories.user import UserRepository
 from src.db.repositories.vacancy import VacancyRepository
+from src.db.repositories.vacancy_extraction import VacancyExtractionRepository
 
 __all__ = [
     'ApplicationRepository',
+    'GithubStatsCacheRepository',
     'SkillRepository',
     'SkillResultRepository',
     'SkillTypeRepository',
     'UserRepository',
     'VacancyRepository',
+    'VacancyExtractionRepository',
     'InterviewMessageRepository',
+    'JobRepository',
     'PostInterviewResultRepository',
-    'PreInterviewResultRepository'
+    'PreInterviewResultRepository',
+    'RefreshTokenRepository',
 ]
@@ -1,11 +1,16 @@
+import datetime
+from collections.abc import AsyncIterator
 from typing import Self
 
-from sqlalchemy import select
+from sqlalchemy import RowMapping, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from src.db import AbstractSQLAlchemyStorage
-from src.db.models import Application, PreInterviewResult, Vacancy
-from src.schemas import Status
+from src.db.models import Application, PostInterviewResult, PreInterviewResult, Vacancy
+from src.db.repositories.pagination import paginate
+from src.db.repositories.vacancy import VACANCY_SKILLS_LOADER
+from src.schemas import SortOrder, Status
 
 
 class ApplicationRepository:
@@ -21,10 +26,13 @@ class ApplicationRepository:
     def _create_session(self) -> AsyncSession:
         return self.storage.create_session()
 
-    async def create_application(self, cv: str, status: Status, user_id: int, vacancy_id: int, git: str | None) -> Application:
+    async def create_application(
+        self, cv: str, status: Status, user_id: int, vacancy_id: int, git: str | None, cv_text: str | None = None
+    ) -> Application:
         async with self._create_session() as session:
             application = Application(
                 cv=cv,
+                cv_text=cv_text,
                 status=status.value,
                 user_id=user_id,
                 vacancy_id=vacancy_id,
@@ -34,19 +42,62 @@ class ApplicationRepository:
             await session.commit()
             return application
 
-    async def get_application(self, application_id: int) -> Application | None:
+    async def get_application(
+        self, application_id: int, *, with_vacancy: bool = False, with_results: bool = False
+    ) -> Application | None:
+        """
+        `with_vacancy` loads the vacancy with its skills, as needed for the prompts,
+        `with_results` loads the pre- and post-interview results.
+        """
+        options = []
+        if with_vacancy:
+            options.append(selectinload(Application.vacancy).options(VACANCY_SKILLS_LOADER))
+        if with_results:
+            options.append(selectinload(Application.pre_interview_result))
+            options.append(selectinload(Application.post_interview_result))
+
         async with self._create_session() as session:
-            application = await session.get(Application, application_id)
+            # With options, an instance already in the shared session's identity map must be loaded again to get them
+            application = await session.get(
+                Application, application_id, options=options, populate_existing=bool(options)
+            )
             return application
 
-    async def get_all_applications(self) -> list[Application]:
+    async def get_all_applications(
+        self,
+        *,
+        after_id: int | None = None,
+        limit: int | None = None,
+        order: SortOrder = SortOrder.ASC,
+        status: Status | None = None,
+        vacancy_id: int | None = None,
+        user_id: int | None = None,
+        created_after: datetime.datetime | None = None,
+        created_before: datetime.datetime | None = None,
+    ) -> list[Application]:
+        query = select(Application)
+        if status is not None:
+            query = query.where(Application.status == status.value)
+        if vacancy_id is not None:
+            query = query.where(Application.vacancy_id == vacancy_id)
+        if user_id is not None:
+            query = query.where(Application.user_id == user_id)
+        if created_after is not None:
+            query = query.where(Application.created_at >= created_after)
+        if created_before is not None:
+            query = query.where(Application.created_at < created_before)
+        query = paginate(query, Application.id, after_id, limit, order)
+
         async with self._create_session() as session:
-            result = await session.execute(select(Application))
+            result = await session.execute(query)
             return result.scalars().all()
 
-    async def get_user_applications(self, user_id: int) -> list[Application]:
+    async def get_user_applications(self, user_id: int, *, with_vacancy: bool = False) -> list[Application]:
         async with self._create_session() as session:
-            result = await session.execute(select(Application).filter(Application.user_id == user_id))
+            query = select(Application).filter(Application.user_id == user_id)
+            if with_vacancy:
+                query = query.options(selectinload(Application.vacancy))
+            result = await session.execute(query)
             return result.scalars().all()
 
     async def edit_application(
@@ -54,6 +105,7 @@ class ApplicationRepository:
         application_id: int,
         *,
         cv: str | None = None,
+        cv_text: str | None = None,
         status: Status | None = None,
         git: str | None = None,
         user_id: int | None = None,
@@ -66,10 +118,17 @@ class ApplicationRepository:
 
             if cv is not None:
                 application.cv = cv
+                application.cv_sha256 = None
+                application.cv_file_id = None
+                application.cv_text = None
+            if cv_text is not None:
+                application.cv_text = cv_text
             if status is not None:
                 application.status = status.value
-            if git is not None:
+            if git is not None and git != application.profile_url:
                 application.profile_url = git
+                application.github_stats = None
+                application.github_stats_fetched_at = None
             if user_id is not None:
                 application.user_id = user_id
             if vacancy_id is not None:
@@ -78,6 +137,43 @@ class ApplicationRepository:
             await session.commit()
             return application
 
+    async def set_github_stats(self, application_id: int, github_stats: dict | None) -> Application | None:
+        async with self._create_session() as session:
+            application = await session.get(Application, application_id)
+            if application is None:
+                return None
+
+            application.github_stats = github_stats
+            application.github_stats_fetched_at = datetime.datetime.now(tz=datetime.UTC)
+            await session.commit()
+            return application
+
+    async def get_cv_file_id_by_hash(self, cv_sha256: str) -> str | None:
+        async with self._create_session() as session:
+            result = await session.execute(
+                select(Application.cv_file_id)
+                .where(Application.cv_sha256 == cv_sha256, Application.cv_file_id.is_not(None))
+                .limit(1)
+            )
+            return result.scalar_one_or_none()
+
+    async def set_cv_file(self, application_id: int, cv_sha256: str, cv_file_id: str) -> None:
+        async with self._create_session() as session:
+            await session.execute(
+                update(Application)
+                .where(Application.id == application_id)
+                .values(cv_sha256=cv_sha256, cv_file_id=cv_file_id)
+            )
+            await session.commit()
+
+    async def forget_cv_file_id(self, cv_file_id: str) -> None:
+        """Drop a file id the provider no longer knows from every application that shares it."""
+        async with self._create_session() as session:
+            await session.execute(
+                update(Application).where(Application.cv_file_id == cv_file_id).values(cv_file_id=None)
+            )
+            await session.commit()
+
     async def delete_application(self, application_id: int) -> Application | None:
         async with self._create_session() as session:
             application = await session.get(Application, application_id)
@@ -87,12 +183,54 @@ class ApplicationRepository:
             await session.commit()
             return application
 
-    async def get_applications_vacancy(self, application_id) -> Vacancy:
+    async def get_applications_vacancy(self, application_id) -> Vacancy | None:
         async with self._create_session() as session:
-            application = await session.get(Application, application_id)
-            return application.vacancy
+            result = await session.execute(
+                select(Vacancy)
+                .join(Application, Application.vacancy_id == Vacancy.id)
+                .where(Application.id == application_id)
+                .options(VACANCY_SKILLS_LOADER)
+            )
+            return result.scalar_one_or_none()
 
-    async def get_applications_pre_interview(self, application_id) -> PreInterviewResult:
+    async def get_applications_pre_interview(self, application_id) -> PreInterviewResult | None:
         async with self._create_session() as session:
-            application = await session.get(Application, application_id)
-            return application.pre_interview_result
+            result = await session.execute(
+                select(PreInterviewResult).where(PreInterviewResult.application_id == application_id)
+            )
+            return result.scalar_one_or_none()
+
+    async def stream_applications(self, batch_size: int = 1000) -> AsyncIterator[Application]:
+        """Iterate over all applications with a server-side cursor, holding at most `batch_size` rows in memory."""
+        async with self._create_session() as session:
+            result = await session.stream_scalars(
+                select(Application).order_by(Application.id).execution_options(yield_per=batch_size)
+            )
+            async for application in result:
+                yield application
+
+    async def stream_assessments(self, batch_size: int = 1000) -> AsyncIterator[RowMapping]:
+        """Iterate over applications joined with their pre- and post-interview results, see `AssessmentExportRow`."""
+        query = (
+            select(
+                Application.id.label("application_id"),
+                Application.vacancy_id,
+                Application.user_id,
+                Application.status,
+                Application.created_at,
+                PreInterviewResult.is_recommended.label("pre_interview_is_recommended"),
+                PreInterviewResult.score.label("pre_interview_score"),
+                PreInterviewResult.reason.label("pre_interview_reason"),
+                PostInterviewResult.is_recommended.label("post_interview_is_recommended"),
+                PostInterviewResult.score.label("post_interview_score"),
+                PostInterviewResult.summary.label("post_interview_summary"),
+            )
+            .outerjoin(PreInterviewResult, PreInterviewResult.application_id == Application.id)
+            .outerjoin(PostInterviewResult, PostInterviewResult.application_id == Application.id)
+            .order_by(Application.id)
+            .execution_options(yield_per=batch_size)
+        )
+        async with self._create_session() as session:
+            result = await session.stream(query)
+            async for row in result.mappings():
+                yield row
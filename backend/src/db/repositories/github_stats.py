@@ -0,0 +1,37 @@
+import datetime
+from typing import Self
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db import AbstractSQLAlchemyStorage
+from src.db.models import GithubStatsCache
+
+
+class GithubStatsCacheRepository:
+    storage: AbstractSQLAlchemyStorage
+
+    def __init__(self, storage: AbstractSQLAlchemyStorage) -> None:
+        self.storage = storage
+
+    def update_storage(self, storage: AbstractSQLAlchemyStorage) -> Self:
+        self.storage = storage
+        return self
+
+    def _create_session(self) -> AsyncSession:
+        return self.storage.create_session()
+
+    async def get_stats(self, username: str) -> GithubStatsCache | None:
+        async with self._create_session() as session:
+            return await session.get(GithubStatsCache, username)
+
+    async def save_stats(self, username: str, stats: dict, fetched_at: datetime.datetime) -> None:
+        async with self._create_session() as session:
+            stmt = insert(GithubStatsCache).values(username=username, stats=stats, fetched_at=fetched_at)
+            await session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[GithubStatsCache.username],
+                    set_={"stats": stmt.excluded.stats, "fetched_at": stmt.excluded.fetched_at},
+                )
+            )
+            await session.commit()
@@ -1,10 +1,10 @@
 from typing import Self
 
-from sqlalchemy import select
+from sqlalchemy import func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db import AbstractSQLAlchemyStorage
-from src.db.models import InterviewMessage
+from src.db.models import Application, InterviewMessage
 
 
 class InterviewMessageRepository:
@@ -21,15 +21,38 @@ class InterviewMessageRepository:
         return self.storage.create_session()
 
     async def create_message(self, role: str, message: str, application_id: int) -> InterviewMessage:
+        [created] = await self.bulk_create_messages(application_id, [{"role": role, "message": message}])
+        return created
+
+    async def bulk_create_messages(self, application_id: int, items: list[dict]) -> list[InterviewMessage]:
+        """Append messages with `role` and `message` keys to the transcript in one INSERT ... RETURNING."""
+        if not items:
+            return []
+
         async with self._create_session() as session:
-            message = InterviewMessage(
-                role=role,
-                message=message,
-                application_id=application_id,
+            # Concurrent appends to one transcript would read the same max position, the application row lock
+            # serializes them until commit
+            await session.execute(select(Application.id).where(Application.id == application_id).with_for_update())
+            start = await session.scalar(
+                select(func.coalesce(func.max(InterviewMessage.position) + 1, 0)).where(
+                    InterviewMessage.application_id == application_id
+                )
+            )
+            result = await session.scalars(
+                insert(InterviewMessage).returning(InterviewMessage, sort_by_parameter_order=True),
+                [
+                    {
+                        "role": it["role"],
+                        "message": it["message"],
+                        "position": start + i,
+                        "application_id": application_id,
+                    }
+                    for i, it in enumerate(items)
+                ],
             )
-            session.add(message)
+            messages = list(result.all())
             await session.commit()
-            return message
+            return messages
 
     async def get_message(self, message_id: int) -> InterviewMessage | None:
         async with self._create_session() as session:
@@ -38,6 +61,8 @@ class InterviewMessageRepository:
     async def get_interview_messages(self, application_id: int) -> list[InterviewMessage]:
         async with self._create_session() as session:
             result = await session.execute(
-                select(InterviewMessage).filter(InterviewMessage.application_id == application_id)
+                select(InterviewMessage)
+                .filter(InterviewMessage.application_id == application_id)
+                .order_by(InterviewMessage.position, InterviewMessage.id)
             )
             return result.scalars().all()
@@ -0,0 +1,105 @@
+import datetime
+from typing import Self
+
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db import AbstractSQLAlchemyStorage
+from src.db.models import Job
+from src.schemas import JobKind, JobStatus
+
+
+class JobRepository:
+    storage: AbstractSQLAlchemyStorage
+
+    def __init__(self, storage: AbstractSQLAlchemyStorage) -> None:
+        self.storage = storage
+
+    def update_storage(self, storage: AbstractSQLAlchemyStorage) -> Self:
+        self.storage = storage
+        return self
+
+    def _create_session(self) -> AsyncSession:
+        return self.storage.create_session()
+
+    async def enqueue(self, kind: JobKind, payload: dict, max_attempts: int) -> Job:
+        async with self._create_session() as session:
+            job = Job(
+                kind=kind.value,
+                payload=payload,
+                status=JobStatus.QUEUED.value,
+                max_attempts=max_attempts,
+            )
+            session.add(job)
+            await session.commit()
+            return job
+
+    async def claim(self, limit: int, lock_timeout: datetime.timedelta) -> list[Job]:
+        """
+        Lock up to `limit` due jobs for the current worker. Concurrent workers skip rows locked by each other,
+        jobs left running by a crashed worker are picked up again after `lock_timeout`. The `locked_at` of the returned
+        jobs identifies this claim in `complete` and `fail`.
+        """
+        now = datetime.datetime.now(tz=datetime.UTC)
+        async with self._create_session() as session:
+            result = await session.execute(
+                select(Job)
+                .where(
+                    or_(
+                        and_(Job.status == JobStatus.QUEUED.value, Job.run_after <= now),
+                        and_(Job.status == JobStatus.RUNNING.value, Job.locked_at < now - lock_timeout),
+                    )
+                )
+                .order_by(Job.run_after, Job.id)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            jobs = list(result.scalars().all())
+            for job in jobs:
+                job.status = JobStatus.RUNNING.value
+                job.locked_at = now
+                job.attempts += 1
+
+            await session.commit()
+            return jobs
+
+    def _locked(self, job_id: int, locked_at: datetime.datetime):
+        """The job, unless it was claimed again since `locked_at`: the result then belongs to the other run."""
+        return update(Job).where(Job.id == job_id, Job.status == JobStatus.RUNNING.value, Job.locked_at == locked_at)
+
+    async def complete(self, job_id: int, locked_at: datetime.datetime) -> bool:
+        """Mark the job as done, False if it is no longer locked by this run."""
+        async with self._create_session() as session:
+            result = await session.execute(
+                self._locked(job_id, locked_at).values(status=JobStatus.DONE.value, locked_at=None, last_error=None)
+            )
+            await session.commit()
+            return result.rowcount > 0
+
+    async def fail(
+        self, job_id: int, locked_at: datetime.datetime, error: str, retry_in: datetime.timedelta | None
+    ) -> bool:
+        """
+        Return the job to the queue after `retry_in`, or mark it as failed for good if it is None.
+        False if it is no longer locked by this run.
+        """
+        if retry_in is None:
+            values = {"status": JobStatus.FAILED.value}
+        else:
+            values = {
+                "status": JobStatus.QUEUED.value,
+                "run_after": datetime.datetime.now(tz=datetime.UTC) + retry_in,
+            }
+        async with self._create_session() as session:
+            result = await session.execute(
+                self._locked(job_id, locked_at).values(last_error=error, locked_at=None, **values)
+            )
+            await session.commit()
+            return result.rowcount > 0
+
+    async def get_queue_depth(self) -> dict[str, int]:
+        async with self._create_session() as session:
+            result = await session.execute(
+                select(Job.status, func.count()).where(Job.status != JobStatus.DONE.value).group_by(Job.status)
+            )
+            return {status: count for status, count in result.all()}
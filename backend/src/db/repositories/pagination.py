@@ -0,0 +1,27 @@
+from typing import Any
+
+from sqlalchemy import Select
+from sqlalchemy.orm import InstrumentedAttribute
+
+from src.schemas import SortOrder
+
+
+def paginate(
+    query: Select, id_column: InstrumentedAttribute[Any], after_id: int | None, limit: int | None, order: SortOrder
+) -> Select:
+    """
+    Keyset pagination by `id_column`: the page starts right after `after_id` instead of using OFFSET,
+    so that each page is a range scan of the index no matter how deep it is.
+    """
+    if order == SortOrder.DESC:
+        if after_id is not None:
+            query = query.where(id_column < after_id)
+        query = query.order_by(id_column.desc())
+    else:
+        if after_id is not None:
+            query = query.where(id_column > after_id)
+        query = query.order_by(id_column.asc())
+
+    if limit is not None:
+        query = query.limit(limit)
+    return query
@@ -1,9 +1,13 @@
 from typing import Self
 
+from sqlalchemy import JSON, RowMapping, func, literal_column, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db import AbstractSQLAlchemyStorage
-from src.db.models import PostInterviewResult
+from src.db.models import InterviewMessage, PostInterviewResult, Skill, SkillResult, SkillType
+
+_EMPTY_JSON_ARRAY = literal_column("'[]'::json", JSON)
 
 
 class PostInterviewResultRepository:
@@ -95,3 +99,79 @@ class PostInterviewResultRepository:
             await session.delete(result)
             await session.commit()
             return result
+
+    async def get_application_result_with_details(self, application_id: int) -> RowMapping | None:
+        """
+        Post-interview result of the application with `skill_scores` (including skill name and weight) and the
+        ordered `interview_transcript`, aggregated to JSON by the database in a single query.
+        Fields match `PostInterviewResultResponse`.
+        """
+        skill_scores = (
+            select(
+                func.coalesce(
+                    func.json_agg(
+                        aggregate_order_by(
+                            func.json_build_object(
+                                "id",
+                                SkillResult.id,
+                                "score",
+                                SkillResult.score,
+                                "skill_id",
+                                SkillResult.skill_id,
+                                "skill_name",
+                                SkillType.name,
+                                "weight",
+                                Skill.weight,
+                            ),
+                            SkillResult.id,
+                        )
+                    ),
+                    _EMPTY_JSON_ARRAY,
+                    type_=JSON,
+                )
+            )
+            .join(Skill, Skill.id == SkillResult.skill_id)
+            .join(SkillType, SkillType.id == Skill.skill_type_id)
+            .where(SkillResult.application_id == PostInterviewResult.application_id)
+            .scalar_subquery()
+        )
+        transcript = (
+            select(
+                func.coalesce(
+                    func.json_agg(
+                        aggregate_order_by(
+                            func.json_build_object(
+                                "id",
+                                InterviewMessage.id,
+                                "role",
+                                InterviewMessage.role,
+                                "message",
+                                InterviewMessage.message,
+                            ),
+                            InterviewMessage.position,
+                            InterviewMessage.id,
+                        )
+                    ),
+                    _EMPTY_JSON_ARRAY,
+                    type_=JSON,
+                )
+            )
+            .where(InterviewMessage.application_id == PostInterviewResult.application_id)
+            .scalar_subquery()
+        )
+        query = select(
+            PostInterviewResult.id,
+            PostInterviewResult.is_recommended,
+            PostInterviewResult.score,
+            PostInterviewResult.summary,
+            PostInterviewResult.interview_summary,
+            PostInterviewResult.candidate_response,
+            PostInterviewResult.emotional_analysis,
+            PostInterviewResult.candidate_roadmap,
+            skill_scores.label("skill_scores"),
+            transcript.label("interview_transcript"),
+        ).where(PostInterviewResult.application_id == application_id)
+
+        async with self._create_session() as session:
+            result = await session.execute(query)
+            return result.mappings().one_or_none()
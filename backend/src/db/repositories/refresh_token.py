@@ -0,0 +1,50 @@
+import datetime
+import uuid
+from typing import Self
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db import AbstractSQLAlchemyStorage
+from src.db.models import RefreshToken
+
+
+class RefreshTokenRepository:
+    storage: AbstractSQLAlchemyStorage
+
+    def __init__(self, storage: AbstractSQLAlchemyStorage) -> None:
+        self.storage = storage
+
+    def update_storage(self, storage: AbstractSQLAlchemyStorage) -> Self:
+        self.storage = storage
+        return self
+
+    def _create_session(self) -> AsyncSession:
+        return self.storage.create_session()
+
+    async def create_token(self, user_id: int, expires_at: datetime.datetime) -> RefreshToken:
+        async with self._create_session() as session:
+            # Tokens that were never used are only removed here
+            await session.execute(
+                delete(RefreshToken).where(
+                    RefreshToken.user_id == user_id, RefreshToken.expires_at <= datetime.datetime.now(datetime.UTC)
+                )
+            )
+            token = RefreshToken(id=uuid.uuid4().hex, user_id=user_id, expires_at=expires_at)
+            session.add(token)
+            await session.commit()
+            return token
+
+    async def consume_token(self, token_id: str) -> int | None:
+        """Delete the token and return its user id, None if it was already used or revoked."""
+        async with self._create_session() as session:
+            user_id = await session.scalar(
+                delete(RefreshToken).where(RefreshToken.id == token_id).returning(RefreshToken.user_id)
+            )
+            await session.commit()
+            return user_id
+
+    async def revoke_user_tokens(self, user_id: int) -> None:
+        async with self._create_session() as session:
+            await session.execute(delete(RefreshToken).where(RefreshToken.user_id == user_id))
+            await session.commit()
@@ -1,10 +1,25 @@
+from collections.abc import Iterable
 from typing import Self
 
-from sqlalchemy import select
+from sqlalchemy import Select, Update, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db import AbstractSQLAlchemyStorage
-from src.db.models import Skill, SkillResult, SkillType
+from src.db.models import Skill, SkillResult, SkillType, Vacancy
+from src.db.repositories.pagination import paginate
+from src.schemas import SortOrder
+
+
+def _touch_vacancies(vacancy_ids: Iterable[int] | Select) -> Update:
+    """Skills are part of the vacancy prompts cached by `Vacancy.updated_at`, so their changes move it too."""
+    if not isinstance(vacancy_ids, Select):
+        vacancy_ids = list(vacancy_ids)
+    return (
+        update(Vacancy)
+        .where(Vacancy.id.in_(vacancy_ids))
+        .values(updated_at=func.now())
+        .execution_options(synchronize_session=False)
+    )
 
 
 class SkillRepository:
@@ -35,9 +50,36 @@ class SkillRepository:
                 vacancy_id=vacancy_id,
             )
             session.add(skill)
+            await session.execute(_touch_vacancies([vacancy_id]))
             await session.commit()
             return skill
 
+    async def bulk_create_skills(self, vacancy_id: int, items: list[dict]) -> list[Skill]:
+        """Create skills with `weight`, `details` and `skill_type_id` keys in one INSERT ... RETURNING."""
+        return await self.bulk_create_vacancy_skills({vacancy_id: items})
+
+    async def bulk_create_vacancy_skills(self, skills_by_vacancy: dict[int, list[dict]]) -> list[Skill]:
+        """Same as `bulk_create_skills`, for several vacancies at once."""
+        rows = [
+            {
+                "weight": it["weight"],
+                "details": it["details"],
+                "skill_type_id": it["skill_type_id"],
+                "vacancy_id": vacancy_id,
+            }
+            for vacancy_id, items in skills_by_vacancy.items()
+            for it in items
+        ]
+        if not rows:
+            return []
+
+        async with self._create_session() as session:
+            result = await session.scalars(insert(Skill).returning(Skill, sort_by_parameter_order=True), rows)
+            skills = list(result.all())
+            await session.execute(_touch_vacancies(skills_by_vacancy))
+            await session.commit()
+            return skills
+
     async def get_skill(self, skill_id: int) -> Skill | None:
         async with self._create_session() as session:
             skill = await session.get(Skill, skill_id)
@@ -50,6 +92,7 @@ class SkillRepository:
                 return None
 
             await session.delete(skill)
+            await session.execute(_touch_vacancies([skill.vacancy_id]))
             await session.commit()
             return skill
 
@@ -65,6 +108,7 @@ class SkillRepository:
             skill = await session.get(Skill, skill_id)
             if skill is None:
                 return None
+            vacancy_ids = {skill.vacancy_id}
 
             if weight is not None:
                 skill.weight = weight
@@ -74,7 +118,9 @@ class SkillRepository:
                 skill.skill_type_id = skill_type_id
             if vacancy_id is not None:
                 skill.vacancy_id = vacancy_id
+                vacancy_ids.add(vacancy_id)
 
+            await session.execute(_touch_vacancies(vacancy_ids))
             await session.commit()
             return skill
 
@@ -109,9 +155,11 @@ class SkillTypeRepository:
             skill_type = await session.get(SkillType, skill_type_id)
             return skill_type
 
-    async def get_all_skill_types(self) -> list[SkillType]:
+    async def get_all_skill_types(
+        self, *, after_id: int | None = None, limit: int | None = None, order: SortOrder = SortOrder.ASC
+    ) -> list[SkillType]:
         async with self._create_session() as session:
-            skill_types = await session.execute(select(SkillType))
+            skill_types = await session.execute(paginate(select(SkillType), SkillType.id, after_id, limit, order))
             return skill_types.scalars().all()
 
     async def delete_skill_type(self, skill_type_id: int) -> SkillType | None:
@@ -120,6 +168,10 @@ class SkillTypeRepository:
             if skill_type is None:
                 return None
 
+            # Before the delete, while its skills still point to the vacancies
+            await session.execute(
+                _touch_vacancies(select(Skill.vacancy_id).where(Skill.skill_type_id == skill_type_id))
+            )
             await session.delete(skill_type)
             await session.commit()
             return skill_type
@@ -136,6 +188,9 @@ class SkillTypeRepository:
 
             if name is not None:
                 skill_type.name = name
+                await session.execute(
+                    _touch_vacancies(select(Skill.vacancy_id).where(Skill.skill_type_id == skill_type_id))
+                )
 
             await session.commit()
             return skill_type
@@ -5,6 +5,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db import AbstractSQLAlchemyStorage
 from src.db.models import User
+from src.db.repositories.pagination import paginate
+from src.schemas import SortOrder
 
 
 class UserRepository:
@@ -76,7 +78,19 @@ class UserRepository:
             await session.commit()
             return user
 
-    async def list_users(self) -> list[User]:
+    async def list_users(
+        self,
+        *,
+        after_id: int | None = None,
+        limit: int | None = None,
+        order: SortOrder = SortOrder.ASC,
+        is_admin: bool | None = None,
+    ) -> list[User]:
+        query = select(User)
+        if is_admin is not None:
+            query = query.where(User.is_admin == is_admin)
+        query = paginate(query, User.id, after_id, limit, order)
+
         async with self._create_session() as session:
-            result = await session.execute(select(User))
+            result = await session.execute(query)
             return list(result.scalars().all())
@@ -1,11 +1,18 @@
 import datetime
+from collections.abc import AsyncIterator
 from typing import Self
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from src.db import AbstractSQLAlchemyStorage
-from src.db.models import Vacancy
+from src.db.models import Skill, Vacancy
+from src.db.repositories.pagination import paginate
+from src.schemas import SortOrder
+
+# Relationships are not loaded implicitly, this is what is needed to render a vacancy with its skills
+VACANCY_SKILLS_LOADER = selectinload(Vacancy.skills).selectinload(Skill.skill_type)
 
 
 class VacancyRepository:
@@ -57,14 +64,63 @@ class VacancyRepository:
             await session.commit()
             return vacancy
 
-    async def get_vacancy(self, vacancy_id: int) -> Vacancy | None:
+    async def bulk_create_vacancies(self, user_id: int, items: list[dict]) -> list[Vacancy]:
+        """Create vacancies from dicts of `Vacancy` columns in one INSERT ... RETURNING, keeping the order of `items`."""
+        if not items:
+            return []
+
+        rows = []
+        for it in items:
+            row = {**it, "user_id": user_id}
+            for key in ("open_time", "close_time"):
+                if row.get(key) and row[key].tzinfo is None:
+                    row[key] = row[key].replace(tzinfo=datetime.UTC)
+            rows.append(row)
+
         async with self._create_session() as session:
-            vacancy = await session.get(Vacancy, vacancy_id)
+            result = await session.scalars(insert(Vacancy).returning(Vacancy, sort_by_parameter_order=True), rows)
+            vacancies = list(result.all())
+            await session.commit()
+            return vacancies
+
+    async def get_vacancy(self, vacancy_id: int, *, with_skills: bool = False) -> Vacancy | None:
+        async with self._create_session() as session:
+            # With options, an instance already in the shared session's identity map must be loaded again to get them
+            vacancy = await session.get(
+                Vacancy,
+                vacancy_id,
+                options=[VACANCY_SKILLS_LOADER] if with_skills else None,
+                populate_existing=with_skills,
+            )
             return vacancy
 
-    async def get_all_vacancies(self) -> list[Vacancy]:
+    async def get_all_vacancies(
+        self,
+        *,
+        with_skills: bool = False,
+        after_id: int | None = None,
+        limit: int | None = None,
+        order: SortOrder = SortOrder.ASC,
+        is_active: bool | None = None,
+        city: str | None = None,
+        open_after: datetime.datetime | None = None,
+        open_before: datetime.datetime | None = None,
+    ) -> list[Vacancy]:
+        query = select(Vacancy)
+        if with_skills:
+            query = query.options(VACANCY_SKILLS_LOADER)
+        if is_active is not None:
+            query = query.where(Vacancy.is_active == is_active)
+        if city is not None:
+            query = query.where(Vacancy.city == city)
+        if open_after is not None:
+            query = query.where(Vacancy.open_time >= open_after)
+        if open_before is not None:
+            query = query.where(Vacancy.open_time < open_before)
+        query = paginate(query, Vacancy.id, after_id, limit, order)
+
         async with self._create_session() as session:
-            result = await session.execute(select(Vacancy))
+            result = await session.execute(query)
             return result.scalars().all()
 
     async def delete_vacancy(self, vacancy_id: int) -> Vacancy | None:
@@ -119,3 +175,13 @@ class VacancyRepository:
             await session.commit()
             await session.refresh(vacancy)
             return vacancy
+
+    async def stream_vacancies(self, batch_size: int = 1000, *, with_skills: bool = False) -> AsyncIterator[Vacancy]:
+        """Iterate over all vacancies with a server-side cursor, skills are loaded for each batch."""
+        query = select(Vacancy).order_by(Vacancy.id).execution_options(yield_per=batch_size)
+        if with_skills:
+            query = query.options(VACANCY_SKILLS_LOADER)
+        async with self._create_session() as session:
+            result = await session.stream_scalars(query)
+            async for vacancy in result:
+                yield vacancy
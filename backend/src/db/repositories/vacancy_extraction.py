@@ -0,0 +1,63 @@
+import datetime
+from typing import Self
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db import AbstractSQLAlchemyStorage
+from src.db.models import VacancyExtraction
+
+
+class VacancyExtractionRepository:
+    storage: AbstractSQLAlchemyStorage
+
+    def __init__(self, storage: AbstractSQLAlchemyStorage) -> None:
+        self.storage = storage
+
+    def update_storage(self, storage: AbstractSQLAlchemyStorage) -> Self:
+        self.storage = storage
+        return self
+
+    def _create_session(self) -> AsyncSession:
+        return self.storage.create_session()
+
+    async def get_result(
+        self, document_hash: str, model: str, prompt_version: str, max_age: datetime.timedelta
+    ) -> dict | None:
+        async with self._create_session() as session:
+            return await session.scalar(
+                select(VacancyExtraction.result).where(
+                    VacancyExtraction.document_hash == document_hash,
+                    VacancyExtraction.model == model,
+                    VacancyExtraction.prompt_version == prompt_version,
+                    VacancyExtraction.created_at > func.now() - max_age,
+                )
+            )
+
+    async def save_result(self, document_hash: str, model: str, prompt_version: str, result: dict) -> None:
+        async with self._create_session() as session:
+            stmt = insert(VacancyExtraction).values(
+                document_hash=document_hash, model=model, prompt_version=prompt_version, result=result
+            )
+            await session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[
+                        VacancyExtraction.document_hash,
+                        VacancyExtraction.model,
+                        VacancyExtraction.prompt_version,
+                    ],
+                    set_={"result": stmt.excluded.result, "created_at": func.now()},
+                )
+            )
+            await session.commit()
+
+    async def delete_results(self, keep_prompt_version: str | None = None) -> int:
+        """Delete cached results, except the ones of `keep_prompt_version` if given. Returns the number of rows."""
+        async with self._create_session() as session:
+            stmt = delete(VacancyExtraction)
+            if keep_prompt_version is not None:
+                stmt = stmt.where(VacancyExtraction.prompt_version != keep_prompt_version)
+            result = await session.execute(stmt)
+            await session.commit()
+            return result.rowcount
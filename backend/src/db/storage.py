@@ -1,6 +1,8 @@
-__all__ = ["SQLAlchemyStorage", "AbstractSQLAlchemyStorage"]
+__all__ = ["SQLAlchemyStorage", "AbstractSQLAlchemyStorage", "UnitOfWork"]
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from typing import Any, Self
 
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
@@ -48,3 +50,97 @@ class SQLAlchemyStorage(AbstractSQLAlchemyStorage):
 
     async def close_connection(self):
         await self.engine.dispose()
+
+
+class _SharedSession:
+    """
+    Session handed out by `UnitOfWork`. Repositories keep their `async with ...: await session.commit()` code,
+    but here commit only flushes and leaving the block does not close the session.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._session, name)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        pass
+
+    async def commit(self) -> None:
+        await self._session.flush()
+
+    async def close(self) -> None:
+        pass
+
+
+class UnitOfWork(AbstractSQLAlchemyStorage):
+    """
+    One session and one transaction shared by all repositories created with it. Committed once when leaving
+    `async with`, or rolled back if an exception is raised.
+
+    The transaction starts with the first query and holds a pooled connection until the end, so slow calls to other
+    services should be made before it or outside of the unit of work.
+    """
+
+    storage: AbstractSQLAlchemyStorage
+    session: AsyncSession
+
+    def __init__(self, storage: AbstractSQLAlchemyStorage) -> None:
+        self.storage = storage
+        self.session = storage.create_session()
+        self._shared_session = _SharedSession(self.session)
+        self._commit_callbacks: list[Callable[[], Any]] = []
+        self._rollback_callbacks: list[Callable[[], Any]] = []
+
+    def after_commit(self, callback: Callable[[], Any]) -> None:
+        """Call `callback` once the unit of work is committed, e.g. to drop cached copies of the changed rows."""
+        self._commit_callbacks.append(callback)
+
+    def after_rollback(self, callback: Callable[[], Any]) -> None:
+        """Call `callback` if the unit of work is rolled back, e.g. to remove files written for the rows."""
+        self._rollback_callbacks.append(callback)
+
+    def create_session(self) -> AsyncSession:
+        return self._shared_session  # type: ignore[return-value]
+
+    async def create_all(self) -> None:
+        await self.storage.create_all()
+
+    async def close_connection(self):
+        await self.session.close()
+
+    async def commit(self) -> None:
+        await self.session.commit()
+        callbacks, self._commit_callbacks = self._commit_callbacks, []
+        self._rollback_callbacks.clear()
+        for callback in callbacks:
+            callback()
+
+    async def rollback(self) -> None:
+        try:
+            await self.session.rollback()
+        finally:
+            self._commit_callbacks.clear()
+            callbacks, self._rollback_callbacks = self._rollback_callbacks, []
+            for callback in callbacks:
+                callback()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            if exc_type is None:
+                try:
+                    await self.commit()
+                except BaseException:
+                    await self.rollback()
+                    raise
+            else:
+                await self.rollback()
+        finally:
+            await self.close_connection()
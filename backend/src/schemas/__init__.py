@@ -1,9 +1,17 @@
-from src.schemas.application import ApplicationResponse, ApplicationWithVacancyResponse, Status
-from src.schemas.auth import LoginRequest, RegisterRequest, TokenPayload, TokenResponse
+from src.schemas.application import (
+    ApplicationListParams,
+    ApplicationResponse,
+    ApplicationWithVacancyResponse,
+    Status,
+)
+from src.schemas.auth import LoginRequest, RefreshRequest, RegisterRequest, TokenPayload, TokenResponse
+from src.schemas.export import AssessmentExportRow, ExportFormat
 from src.schemas.interview import (
     InterviewHistoryRequest,
     InterviewMessageResponse,
 )
+from src.schemas.job import JobKind, JobStatus, QueueDepthResponse
+from src.schemas.pagination import PaginationParams, SortOrder
 from src.schemas.post_interview import PostInterviewAIStructure, PostInterviewResponse, PostInterviewResultResponse
 from src.schemas.pre_interview import PreInterviewAIStructure, PreInterviewResponse
 from src.schemas.skills import (
@@ -14,21 +22,31 @@ from src.schemas.skills import (
     SkillTypeResponse,
     SkillTypeUpdateRequest,
 )
-from src.schemas.user import UserCreate, UserResponse
+from src.schemas.user import UserCreate, UserListParams, UserResponse
 from src.schemas.vacancy import (
     VacancyCreateRequest,
     VacancyEditRequest,
     VacancyFromFile,
+    VacancyImportError,
+    VacancyImportResponse,
+    VacancyListParams,
     VacancyResponse,
     VacancyWithSkillsCreateRequest,
     VacancyWithSkillsResponse,
 )
 
 __all__ = [
+    'AssessmentExportRow',
+    'ExportFormat',
+    'ApplicationListParams',
+    'UserListParams',
+    'PaginationParams',
+    'SortOrder',
     'ApplicationResponse',
     'ApplicationWithVacancyResponse',
     'Status',
     'LoginRequest',
+    'RefreshRequest',
     'RegisterRequest',
     'TokenPayload',
     'TokenResponse',
@@ -43,11 +61,17 @@ __all__ = [
     'VacancyCreateRequest',
     'VacancyEditRequest',
     'VacancyFromFile',
+    'VacancyImportError',
+    'VacancyImportResponse',
+    'VacancyListParams',
     'VacancyResponse',
     'VacancyWithSkillsCreateRequest',
     'VacancyWithSkillsResponse',
     'InterviewHistoryRequest',
     'InterviewMessageResponse',
+    'JobKind',
+    'JobStatus',
+    'QueueDepthResponse',
     'PostInterviewAIStructure',
     'PostInterviewResponse',
     'PostInterviewResultResponse',
@@ -1,5 +1,7 @@
+import datetime
 from enum import StrEnum
 
+from src.schemas.pagination import PaginationParams
 from src.schemas.pydantic_base import BaseSchema
 from src.schemas.vacancy import VacancyResponse
 from src.services.pre_interview.github_eval import GithubStats
@@ -14,6 +16,16 @@ class Status(StrEnum):
     PENDING = "pending"
 
 
+class ApplicationListParams(PaginationParams):
+    status: Status | None = None
+    vacancy_id: int | None = None
+    user_id: int | None = None
+    created_after: datetime.datetime | None = None
+    "Only applications created at or after this moment"
+    created_before: datetime.datetime | None = None
+    "Only applications created before this moment"
+
+
 class ApplicationResponse(BaseSchema):
     id: int
     cv: str
@@ -6,6 +6,7 @@ from src.schemas.pydantic_base import BaseSchema
 class TokenResponse(BaseSchema):
     access_token: str
     token_type: str = "bearer"
+    refresh_token: str | None = None
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -13,6 +14,12 @@ class TokenResponse(BaseSchema):
 class TokenPayload(BaseSchema):
     sub: int  # user id
     exp: int | None = None  # optional expiration
+    is_admin: bool | None = None  # missing in tokens issued before the claim was added
+    jti: str | None = None  # id of a refresh token
+
+
+class RefreshRequest(BaseSchema):
+    refresh_token: str
 
 
 class RegisterRequest(BaseSchema):
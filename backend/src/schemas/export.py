@@ -0,0 +1,31 @@
+import datetime
+from enum import StrEnum
+
+from pydantic import ConfigDict
+
+from src.schemas.pydantic_base import BaseSchema
+
+
+class ExportFormat(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class AssessmentExportRow(BaseSchema):
+    """Application with the results of both assessments, flattened for analytics."""
+
+    application_id: int
+    vacancy_id: int
+    user_id: int
+    status: str
+    created_at: datetime.datetime
+
+    pre_interview_is_recommended: bool | None = None
+    pre_interview_score: float | None = None
+    pre_interview_reason: str | None = None
+
+    post_interview_is_recommended: bool | None = None
+    post_interview_score: float | None = None
+    post_interview_summary: str | None = None
+
+    model_config = ConfigDict(from_attributes=True)
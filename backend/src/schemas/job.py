@@ -0,0 +1,24 @@
+from enum import StrEnum
+
+from src.schemas.pydantic_base import BaseSchema
+
+
+class JobKind(StrEnum):
+    GITHUB_STATS = "github_stats"
+    PRE_INTERVIEW = "pre_interview"
+
+
+class JobStatus(StrEnum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class QueueDepthResponse(BaseSchema):
+    queued: int = 0
+    "Jobs waiting to be picked up, including the ones scheduled for a retry"
+    running: int = 0
+    "Jobs currently claimed by a worker"
+    failed: int = 0
+    "Jobs that ran out of attempts"
@@ -0,0 +1,21 @@
+from enum import StrEnum
+
+from pydantic import Field
+
+from src.schemas.pydantic_base import BaseSchema
+
+
+class SortOrder(StrEnum):
+    ASC = "asc"
+    "Oldest first"
+    DESC = "desc"
+    "Newest first"
+
+
+class PaginationParams(BaseSchema):
+    after_id: int | None = None
+    "Id of the last item of the previous page, omit for the first page"
+    limit: int | None = Field(None, ge=1, le=1000)
+    "Page size, omit to get all items after `after_id`"
+    order: SortOrder = SortOrder.ASC
+    "Order by id, which follows the creation order"
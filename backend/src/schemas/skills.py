@@ -44,6 +44,10 @@ class SkillResultResponse(BaseSchema):
     id: int
     score: float
     skill_id: int
+    skill_name: str | None = None
+    "Name of the skill type"
+    weight: float | None = None
+    "Weight of the skill in the vacancy"
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -1,8 +1,13 @@
 from pydantic import ConfigDict
 
+from src.schemas.pagination import PaginationParams
 from src.schemas.pydantic_base import BaseSchema
 
 
+class UserListParams(PaginationParams):
+    is_admin: bool | None = None
+
+
 class UserCreate(BaseSchema):
     name: str
     email: str
@@ -2,6 +2,7 @@ import datetime
 
 from pydantic import ConfigDict
 
+from src.schemas.pagination import PaginationParams
 from src.schemas.pydantic_base import BaseSchema
 from src.schemas.skills import SkillCreateRequestNoId, SkillResponse
 
@@ -25,6 +26,15 @@ class VacancyWithSkillsCreateRequest(BaseSchema):
     skills: list[SkillCreateRequestNoId]
 
 
+class VacancyListParams(PaginationParams):
+    is_active: bool | None = None
+    city: str | None = None
+    open_after: datetime.datetime | None = None
+    "Only vacancies opened at or after this moment"
+    open_before: datetime.datetime | None = None
+    "Only vacancies opened before this moment"
+
+
 class VacancyEditRequest(BaseSchema):
     name: str | None = None
     description: str | None = None
@@ -73,3 +83,14 @@ class VacancyFromFile(BaseSchema):
 class VacancyWithSkillsResponse(BaseSchema):
     vacancy: VacancyResponse
     skills: list[SkillResponse]
+
+
+class VacancyImportError(BaseSchema):
+    row: int
+    "1-based number of the data row in the imported file"
+    error: str
+
+
+class VacancyImportResponse(BaseSchema):
+    created: int
+    errors: list[VacancyImportError]
@@ -1,29 +1,59 @@
-import base64
+from typing import Any
 
-from openai.types.responses import EasyInputMessageParam, ResponseInputFileParam, ResponseInputTextParam
+import openai
+from openai.types.responses import EasyInputMessageParam, ResponseInputTextParam
 
 from src.config import open_ai_text_settings
 from src.db.models import Application, InterviewMessage, PostInterviewResult, PreInterviewResult, Vacancy
-from src.db.repositories import PostInterviewResultRepository, PreInterviewResultRepository, SkillResultRepository
+from src.db.repositories import (
+    ApplicationRepository,
+    PostInterviewResultRepository,
+    PreInterviewResultRepository,
+    SkillResultRepository,
+)
 from src.schemas import PostInterviewAIStructure, PreInterviewAIStructure
-from src.services.ai.openai_client import async_client
+from src.services.ai.cv_store import forget_cv_file_id, get_cv_file_input
+from src.services.ai.openai_client import openai_scheduler
 from src.services.ai.prompt_builder import (
-    build_github_prompt,
     build_post_interview_assessment_prompt,
-    build_vacancy_prompt,
+    build_pre_interview_assessment_prompt,
+    prompt_cache_key,
 )
+from src.services.ai.prompt_templates import POST_INTERVIEW_ASSESSMENT_TEMPLATE, PRE_INTERVIEW_ASSESSMENT_TEMPLATE
+from src.services.ai.scheduler import Priority
 from src.services.pre_interview.github_eval import GithubStats
 
 
+async def _parse_with_cv(
+    *,
+    application: Application,
+    application_repository: ApplicationRepository,
+    system_msg: EasyInputMessageParam,
+    text: str,
+    **kwargs: Any,
+) -> Any:
+    """Scheduled `responses.parse` of the prompt with the CV attached, uploading the CV again if its file is gone."""
+    text_input = ResponseInputTextParam(type="input_text", text=text)
+    for attempt in range(2):
+        file_input = await get_cv_file_input(application, application_repository)
+        user_msg = EasyInputMessageParam(role="user", content=[text_input, file_input])
+        try:
+            return await openai_scheduler.parse(priority=Priority.BATCH, input=[system_msg, user_msg], **kwargs)
+        except openai.NotFoundError:
+            if attempt == 1:
+                raise
+            await forget_cv_file_id(application, application_repository)
+    raise AssertionError("unreachable")
+
+
 async def pre_interview_assessment(
     *,
     application: Application,
     vacancy: Vacancy,
     repository: PreInterviewResultRepository,
+    application_repository: ApplicationRepository,
     github: GithubStats | None,
 ) -> PreInterviewResult:
-    vacancy_text = build_vacancy_prompt(vacancy)
-
     system_msg = EasyInputMessageParam(
         role="system",
         content=(
@@ -31,30 +61,14 @@ async def pre_interview_assessment(
             "Return a structured decision only. All text outputs should be in Russian language."
         ),
     )
-    with open(application.cv, "rb") as f:
-        data = f.read()
-
-    base64_string = base64.b64encode(data).decode("utf-8")
-    file_input = ResponseInputFileParam(
-        type="input_file",
-        filename="CV.pdf",
-        file_data=f"data:application/pdf;base64,{base64_string}",
-    )
-    _text = (
-        "Evaluate the candidate for the following role and only use the attached CV and github stats for evidence. "
-        "Output the exact schema with is_recommended: bool, score: float between 0 and 1, "
-        "reason: justification of is_recommended and score values\n\n" + vacancy_text
-    )
-    _text += f"Candidate github stats:\n{build_github_prompt(github)}"
-
-    text_input = ResponseInputTextParam(type="input_text", text=_text)
-
-    user_msg = EasyInputMessageParam(role="user", content=[text_input, file_input])
-
-    response = await async_client.responses.parse(
+    response = await _parse_with_cv(
+        application=application,
+        application_repository=application_repository,
+        system_msg=system_msg,
+        text=build_pre_interview_assessment_prompt(vacancy, github),
         text_format=PreInterviewAIStructure,
-        input=[system_msg, user_msg],
         model=open_ai_text_settings.model,
+        prompt_cache_key=prompt_cache_key(PRE_INTERVIEW_ASSESSMENT_TEMPLATE, vacancy),
     )
     pre_interview_result = await repository.create_result(
         is_recommended=bool(response.output_parsed.is_recommended),
@@ -73,6 +87,7 @@ async def post_interview_assessment(
     transcript: list[InterviewMessage],
     pre_interview_result: PreInterviewResult,
     post_interview_repository: PostInterviewResultRepository,
+    application_repository: ApplicationRepository,
     skill_results_repository: SkillResultRepository,
 ) -> PostInterviewResult:
     system_msg = EasyInputMessageParam(
@@ -83,28 +98,18 @@ async def post_interview_assessment(
         ),
     )
 
-    with open(application.cv, "rb") as f:
-        data = f.read()
-
-    base64_string = base64.b64encode(data).decode("utf-8")
-    file_input = ResponseInputFileParam(
-        type="input_file",
-        filename="CV.pdf",
-        file_data=f"data:application/pdf;base64,{base64_string}",
-    )
-    _text = build_post_interview_assessment_prompt(
-        vacancy=vacancy,
-        transcript=transcript,
-        pre_interview_result=pre_interview_result,
-    )
-
-    text_input = ResponseInputTextParam(type="input_text", text=_text)
-    user_msg = EasyInputMessageParam(role="user", content=[text_input, file_input])
-
-    response = await async_client.responses.parse(
+    response = await _parse_with_cv(
+        application=application,
+        application_repository=application_repository,
+        system_msg=system_msg,
+        text=build_post_interview_assessment_prompt(
+            vacancy=vacancy,
+            transcript=transcript,
+            pre_interview_result=pre_interview_result,
+        ),
         text_format=PostInterviewAIStructure,
-        input=[system_msg, user_msg],
         model=open_ai_text_settings.model,
+        prompt_cache_key=prompt_cache_key(POST_INTERVIEW_ASSESSMENT_TEMPLATE, vacancy),
     )
 
     parsed = response.output_parsed
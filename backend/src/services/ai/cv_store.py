@@ -0,0 +1,55 @@
+import asyncio
+import hashlib
+from pathlib import Path
+
+from openai.types.responses import ResponseInputFileParam
+
+from src.api.logging_ import logger
+from src.db.models import Application
+from src.db.repositories import ApplicationRepository
+from src.services.ai.openai_client import openai_scheduler
+from src.services.ai.scheduler import Priority
+
+
+def _read_and_hash(path: str) -> tuple[bytes, str]:
+    data = Path(path).read_bytes()
+    return data, hashlib.sha256(data).hexdigest()
+
+
+async def get_cv_file_id(application: Application, application_repository: ApplicationRepository) -> str:
+    """
+    Return the OpenAI file id of the application's CV, uploading it only if no file with the same content was uploaded
+    before. Identical CVs attached to several applications share one uploaded file.
+    """
+    if application.cv_file_id is not None:
+        return application.cv_file_id
+
+    data, cv_sha256 = await asyncio.to_thread(_read_and_hash, application.cv)
+    file_id = await application_repository.get_cv_file_id_by_hash(cv_sha256)
+    if file_id is None:
+        uploaded = await openai_scheduler.create_file(
+            priority=Priority.BATCH, file=("CV.pdf", data, "application/pdf"), purpose="user_data"
+        )
+        file_id = uploaded.id
+        logger.info(f"Uploaded CV of application {application.id} as {file_id}")
+
+    await application_repository.set_cv_file(application.id, cv_sha256=cv_sha256, cv_file_id=file_id)
+    application.cv_sha256 = cv_sha256
+    application.cv_file_id = file_id
+    return file_id
+
+
+async def forget_cv_file_id(application: Application, application_repository: ApplicationRepository) -> None:
+    """Forget the uploaded file of the CV, e.g. deleted or expired on the provider side, so that it is uploaded again."""
+    if application.cv_file_id is None:
+        return
+    logger.warning(f"CV file {application.cv_file_id} of application {application.id} is gone, uploading it again")
+    await application_repository.forget_cv_file_id(application.cv_file_id)
+    application.cv_file_id = None
+
+
+async def get_cv_file_input(
+    application: Application, application_repository: ApplicationRepository
+) -> ResponseInputFileParam:
+    file_id = await get_cv_file_id(application, application_repository)
+    return ResponseInputFileParam(type="input_file", file_id=file_id)
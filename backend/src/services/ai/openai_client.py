@@ -1,5 +1,15 @@
 from openai import AsyncOpenAI
 
 from src.config import open_ai_text_settings
+from src.services.ai.scheduler import OpenAIScheduler
 
 async_client = AsyncOpenAI(api_key=open_ai_text_settings.api_key.get_secret_value())
+
+openai_scheduler = OpenAIScheduler(
+    async_client,
+    requests_per_minute=open_ai_text_settings.requests_per_minute,
+    tokens_per_minute=open_ai_text_settings.tokens_per_minute,
+    max_concurrency=open_ai_text_settings.max_concurrency,
+    max_retries=open_ai_text_settings.max_retries,
+    budget_share=open_ai_text_settings.budget_share,
+)
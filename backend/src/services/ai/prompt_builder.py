@@ -1,14 +1,56 @@
+import datetime
 import json
+from collections import OrderedDict
+from typing import NamedTuple
+
+from src.db.models import Application, InterviewMessage, PreInterviewResult, Skill, User, Vacancy
+from src.services.ai.prompt_templates import (
+    POST_INTERVIEW_ASSESSMENT_TEMPLATE,
+    PRE_INTERVIEW_ASSESSMENT_TEMPLATE,
+    REALTIME_INTERVIEW_TEMPLATE,
+    PromptTemplate,
+)
+from src.services.pre_interview.github_eval import GithubStats
 
-import PyPDF2
 
-from src.db.models import Application, InterviewMessage, PreInterviewResult, Skill, Vacancy, User
-from src.services.pre_interview.github_eval import GithubStats
+class VacancyBlocks(NamedTuple):
+    vacancy: str
+    skills: str
+    skills_count: int
+
+
+class VacancyBlocksCache:
+    """
+    Prompt blocks of the recently used vacancies, keyed by vacancy id and `updated_at`, which moves on any change of
+    the vacancy or its skills, so that an entry is never outdated and is only evicted as the least recently used.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[tuple[int, datetime.datetime], VacancyBlocks] = OrderedDict()
+
+    def get(self, vacancy: Vacancy) -> VacancyBlocks:
+        key = (vacancy.id, vacancy.updated_at)
+        blocks = self._entries.get(key)
+        if blocks is not None:
+            self._entries.move_to_end(key)
+            return blocks
+
+        skills = vacancy.skills
+        blocks = VacancyBlocks(build_vacancy_prompt(vacancy), build_skills_prompt(skills), len(skills))
+        # Vacancies that are not stored yet have no updated_at to tell their versions apart
+        if vacancy.id is not None and vacancy.updated_at is not None:
+            self._entries[key] = blocks
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return blocks
+
+    def clear(self) -> None:
+        self._entries.clear()
 
 
 def build_vacancy_prompt(vacancy: Vacancy) -> str:
-    skills = getattr(vacancy, "skills", []) or []
-    skill_names: list[str] = [getattr(s, "name", str(s)) for s in skills]
+    skill_names = [s.skill_type.name for s in vacancy.skills]
 
     return (
         f"Vacancy:\n"
@@ -25,7 +67,7 @@ def build_vacancy_prompt(vacancy: Vacancy) -> str:
 def build_github_prompt(stats: GithubStats | None) -> str:
     if stats is None:
         return "No github info found\n"
-    
+
     prompt = f"```json\n{stats.model_dump_json(indent=2)}\n```"
     return prompt
 
@@ -50,99 +92,34 @@ def build_skills_prompt(skills: list[Skill]) -> str:
 
     lines: list[str] = []
     for s in skills:
-        name = (s.skill_type.name if getattr(s, "skill_type", None) else "").strip()
+        name = s.skill_type.name.strip()
         details = (s.details or "").strip().replace("\n", " ")
         lines.append(f"- id: {s.id}; weight: {s.weight}; name: {name}; details: {details}")
     return "\n".join(lines)
 
 
-def _extract_text_from_pdf(pdf_path: str) -> str:
-    with open(pdf_path, "rb") as f:
-        reader = PyPDF2.PdfReader(f)
-        parts = []
-        for page in reader.pages:
-            txt = page.extract_text() or ""
-            parts.append(txt)
-        return "\n".join(parts).strip()
+vacancy_blocks_cache = VacancyBlocksCache(max_size=1024)
+
+
+def prompt_cache_key(template: PromptTemplate, vacancy: Vacancy) -> str:
+    """Groups the calls sharing the instructions and the vacancy, for the provider to route them to one prompt cache."""
+    return f"{template.cache_key}-vacancy-{vacancy.id}"
 
 
 def build_realtime_prompt(application: Application, user: User, github_stats: GithubStats | None = None) -> str:
-    vacancy_text = build_vacancy_prompt(application.vacancy)
-    cv_text = _extract_text_from_pdf(application.cv)
-    user_name = user.name
-
-    github_prompt = build_github_prompt(github_stats)
-
-
-    return f"""
-Act as a real-time HR Interview Specialist AI conducting interviews with job applicants.
-Your name is Ainna (Аинна)
-
-You will receive the job vacancy description and the candidate's CV.
-
-Your objectives are:
-- Ask relevant, professional interview questions tailored to the specific position and the contents of the candidate's CV.
-- Wait for and consider the candidate's response before asking the next question.
-- Do not analyze or evaluate the candidate; do not share any opinions or conclusions about their suitability.
-- Do not provide any feedback or summary at any point. The evaluation and final decision will be made separately.
-- Change complexity of your questions based on the level of the candidate.
-- If you consider that interview should be over, you should send <end_of_conversation> xml tag.
-- If vacancy have requirements for certain language you can switch to that language to test it. You should warn candidate about switch first.
-- Ask different questions, do not focus too much on one topic
-
-Interview Flow:
-1. Introduce yourself with your name, give candidate short info about position.
-2. Review the given vacancy description and the candidate’s CV in full detail.
-3. Remember to greet candidate in the beginning of the interview.
-4. Formulate a context-appropriate, open-ended interview question based on the position and the candidate’s experiences, skills, or past roles.
-5. Ask the question and pause for a response.
-6. Upon receiving a response, review it carefully, and then generate the next question based on both the vacancy and the candidate’s previous answers.
-7. Continue this process until instructed otherwise.
-8. In the end of the interview ask if candidate has any questions.
-
-Output Formatting:
-- Each output should include **only** the next interview question in Russian, unless testing candidate for specific language required in vacancy.
-- Output must be a clear, written in a professional HR tone, appropriate for the given job and candidate.
-- You should act supportive.
-- Do not output analysis, commentary, or any conclusions.
-- Maintain all interaction in Russian, unless testing candidate for specific language required in vacancy.
-
-Example:
-**Вход:**  
-Вакансия: [Должность: Старший разработчик Python. Обязанности: проектирование архитектуры ПО, оптимизация производительности.]  
-Резюме: [Опыт: 5 лет разработки ПО на Python в банковском секторе. Навыки: Django, Flask, оптимизация кода.]
-
-**Выход — первый вопрос:**  
-Расскажите, пожалуйста, о самом сложном проекте на Python, в котором вы принимали участие, и какие задачи там решали?
-
-(Remember: In real use, include the full vacancy and resume, and interview questions should be fully tailored and may reference details from both.)
-
-Important Reminders:
-- Always ask a question, never analyze or evaluate.
-- Remain in context—draw on all available details from both vacancy and resume for tailored questioning.
-- Each output is a single professional interview question in Russian; do not greet, summarize, or comment.
-
-(Important: Your objective is to ask context-relevant interview questions based on the vacancy and resume, awaiting a response before proceeding. Do not evaluate or make conclusions about the candidate.)
-
-<candidate_info>
-Name: {user_name}
-</candidate_info>
-
-Vacancy:
-<vacancy>
-{vacancy_text}
-</vacancy>
-
-Candidate CV:
-<cv>
-{cv_text}
-</cv>
-
-Candidate Github:
-<cv>
-{github_prompt}
-</cv>
-"""
+    return REALTIME_INTERVIEW_TEMPLATE.render(
+        vacancy=vacancy_blocks_cache.get(application.vacancy).vacancy,
+        user_name=user.name,
+        cv=application.cv_text or "",
+        github=build_github_prompt(github_stats),
+    )
+
+
+def build_pre_interview_assessment_prompt(vacancy: Vacancy, github_stats: GithubStats | None) -> str:
+    return PRE_INTERVIEW_ASSESSMENT_TEMPLATE.render(
+        vacancy=vacancy_blocks_cache.get(vacancy).vacancy,
+        github=build_github_prompt(github_stats),
+    )
 
 
 def build_post_interview_assessment_prompt(
@@ -150,47 +127,11 @@ def build_post_interview_assessment_prompt(
     transcript: list[InterviewMessage],
     pre_interview_result: PreInterviewResult,
 ) -> str:
-    vacancy_text = build_vacancy_prompt(vacancy)
-    transcript_text = build_transcript_prompt(transcript)
-    result_text = build_pre_interview_result_prompt(pre_interview_result)
-
-    skills_block = build_skills_prompt(vacancy.skills)
-    skills_count = len(vacancy.skills)
-
-    return f"""
-You are a technical recruiter evaluating a candidate strictly from the attached information (CV file, vacancy info, pre-interview result, interview transcript). Produce only a structured decision matching the provided schema. All free-text fields must be written in Russian. Do not include any extra keys or commentary outside the schema.
-
-Scoring rules:
-- For every skill listed under Vacancy → Skills, output exactly one SkillResult with: skill_id (verbatim), weight (verbatim), and score in [0.0–1.0]. Do not omit any listed skill. If evidence is insufficient, assign a cautious score (e.g., 0.45–0.55) rather than skipping.
-- The top-level score should align with the per-skill evaluations and weights; be conservative when evidence is limited.
-- is_recommended must reflect overall suitability and risks based only on the provided materials.
-
-Writing rules (Russian):
-- interview_summary: 3–5 neutral sentences describing strengths, gaps, notable moments.
-- candidate_response: Polite, actionable feedback for the candidate; exclude internal rationale and sensitive decision logic.
-- summary: Internal rationale connecting is_recommended, interpretation of skill scores, evidence, and risks.
-- emotional_analysis: Observations inferred from the transcript’s tone and behavior; avoid clinical labels.
-- candidate_roadmap: Actionable plan with prioritized gaps, concrete steps, recommended resources, and suggested timelines.
-
-Return strictly in the specified structured format. If Vacancy → Skills is empty, skill_scores may be empty; otherwise include one SkillResult for each listed skill.
-
-Vacancy:
-<vacancy>
-{vacancy_text}
-
-Skills (score each; preserve id and weight exactly; count={skills_count}):
-<skills>
-{skills_block if skills_block else "- (no skills listed)"}
-</skills>
-</vacancy>
-
-Interview transcript:
-<transcript>
-{transcript_text}
-</transcript>
-
-Pre-interview candidate assessment:
-<pre_interview_result>
-{result_text}
-</pre_interview_result>
-"""
+    vacancy_blocks = vacancy_blocks_cache.get(vacancy)
+    return POST_INTERVIEW_ASSESSMENT_TEMPLATE.render(
+        vacancy=vacancy_blocks.vacancy,
+        skills=vacancy_blocks.skills,
+        skills_count=str(vacancy_blocks.skills_count),
+        transcript=build_transcript_prompt(transcript),
+        pre_interview_result=build_pre_interview_result_prompt(pre_interview_result),
+    )
@@ -0,0 +1,258 @@
+__all__ = ["OpenAIScheduler", "Priority", "TokenBucket"]
+
+import asyncio
+import heapq
+import itertools
+import random
+import re
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from enum import IntEnum
+from typing import Any, TypeVar
+
+import httpx
+import openai
+from openai import AsyncOpenAI
+from openai._legacy_response import LegacyAPIResponse
+from openai.types import FileObject
+from openai.types.realtime import ClientSecretCreateResponse
+
+from src.api.logging_ import logger
+
+T = TypeVar("T")
+
+# Rough token estimates used to reserve capacity before the request is sent, corrected with the real usage afterwards
+_CHARS_PER_TOKEN = 4
+_FILE_TOKENS_ESTIMATE = 3_000
+_OUTPUT_TOKENS_ESTIMATE = 2_000
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+
+
+class Priority(IntEnum):
+    """Lower value is served first."""
+
+    INTERACTIVE = 0
+    "A user is waiting for the response, e.g. realtime session creation"
+    BATCH = 10
+    "Background scoring jobs"
+
+
+class TokenBucket:
+    """
+    Bucket refilled continuously up to `capacity` units per minute. With `share` below 1 it takes only that part of
+    the limits, including the ones reported by the provider, leaving the rest to other processes using the same key.
+    """
+
+    def __init__(self, capacity: float, share: float = 1.0) -> None:
+        self.share = share
+        self.capacity = float(capacity) * share
+        self.tokens = self.capacity
+        self._updated_at = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated_at) * self.capacity / 60)
+        self._updated_at = now
+
+    def time_until_available(self, amount: float) -> float:
+        """Seconds to wait until `amount` can be consumed, requests larger than the bucket wait for a full one."""
+        self._refill()
+        missing = min(amount, self.capacity) - self.tokens
+        return max(0.0, missing * 60 / self.capacity)
+
+    def consume(self, amount: float) -> None:
+        """Take `amount` out of the bucket, negative amounts give the tokens back."""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens - amount)
+
+    def sync(self, limit: float | None, remaining: float | None) -> None:
+        """Adopt the limits reported by the provider, trusting whichever side is more pessimistic."""
+        self._refill()
+        if limit:
+            self.capacity = float(limit) * self.share
+        if remaining is not None:
+            self.tokens = min(self.tokens, float(remaining))
+
+
+def _parse_duration(value: str | None) -> float | None:
+    """Parse durations like '20ms', '1s' or '6m0s' from the rate limit headers."""
+    if not value:
+        return None
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+def _parse_number(value: str | None) -> float | None:
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def estimate_tokens(input_: Iterable[Any] | str | None) -> int:
+    """Estimate prompt and completion tokens of a Responses API input."""
+    if input_ is None:
+        return _OUTPUT_TOKENS_ESTIMATE
+    if isinstance(input_, str):
+        return len(input_) // _CHARS_PER_TOKEN + _OUTPUT_TOKENS_ESTIMATE
+
+    total = _OUTPUT_TOKENS_ESTIMATE
+    for message in input_:
+        content = message.get("content") if isinstance(message, dict) else None
+        if isinstance(content, str):
+            total += len(content) // _CHARS_PER_TOKEN
+            continue
+        for part in content or []:
+            if part.get("type") == "input_file":
+                total += _FILE_TOKENS_ESTIMATE
+            else:
+                total += len(part.get("text") or "") // _CHARS_PER_TOKEN
+    return total
+
+
+class OpenAIScheduler:
+    """
+    Shared gate for all OpenAI calls: caps concurrency, enforces requests-per-minute and tokens-per-minute budgets,
+    serves interactive requests before batch ones and backs off on rate limiting using the provider's headers.
+
+    The budgets are tracked in memory, so each process has its own; `budget_share` is the part of the key's limits
+    this process may use, the API and job worker processes sharing one key should add up to 1.
+    """
+
+    def __init__(
+        self,
+        client: AsyncOpenAI,
+        *,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        max_concurrency: int,
+        max_retries: int,
+        budget_share: float = 1.0,
+    ) -> None:
+        # Retries are handled here, so that they respect the shared budget
+        self.client = client.with_options(max_retries=0)
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self._requests = TokenBucket(requests_per_minute, budget_share)
+        self._tokens = TokenBucket(tokens_per_minute, budget_share)
+        self._queue: list[tuple[int, int]] = []
+        self._counter = itertools.count()
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._condition = asyncio.Condition()
+
+    @property
+    def queue_size(self) -> int:
+        return len(self._queue)
+
+    async def parse(self, *, priority: Priority, **kwargs: Any) -> Any:
+        """Scheduled `client.responses.parse`."""
+        estimated = estimate_tokens(kwargs.get("input"))
+        response = await self._call(
+            priority, estimated, lambda: self.client.responses.with_raw_response.parse(**kwargs)
+        )
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            self._tokens.consume(usage.total_tokens - estimated)
+        return response
+
+    async def create_realtime_client_secret(self, *, priority: Priority, **kwargs: Any) -> ClientSecretCreateResponse:
+        """Scheduled `client.realtime.client_secrets.create`."""
+        return await self._call(
+            priority, 0, lambda: self.client.realtime.client_secrets.with_raw_response.create(**kwargs)
+        )
+
+    async def create_file(self, *, priority: Priority, **kwargs: Any) -> FileObject:
+        """Scheduled `client.files.create`."""
+        return await self._call(priority, 0, lambda: self.client.files.with_raw_response.create(**kwargs))
+
+    async def _call(self, priority: Priority, tokens: int, request: Callable[[], Awaitable[LegacyAPIResponse[T]]]) -> T:
+        for attempt in range(self.max_retries + 1):
+            await self._acquire(priority, tokens)
+            try:
+                raw = await request()
+            except (openai.RateLimitError, openai.InternalServerError, openai.APIConnectionError) as e:
+                if attempt == self.max_retries:
+                    raise
+                self._back_off(e, attempt)
+                continue
+            finally:
+                await self._release()
+
+            self._update_limits(raw.headers)
+            return raw.parse()
+        raise AssertionError("unreachable")
+
+    async def _acquire(self, priority: Priority, tokens: int) -> None:
+        ticket = (int(priority), next(self._counter))
+        heapq.heappush(self._queue, ticket)
+        try:
+            async with self._condition:
+                while True:
+                    timeout = None
+                    if self._queue[0] == ticket and self._in_flight < self.max_concurrency:
+                        timeout = max(
+                            self._paused_until - time.monotonic(),
+                            self._requests.time_until_available(1),
+                            self._tokens.time_until_available(tokens),
+                        )
+                        if timeout <= 0:
+                            heapq.heappop(self._queue)
+                            self._in_flight += 1
+                            self._requests.consume(1)
+                            self._tokens.consume(tokens)
+                            # The next waiter may be able to go right away
+                            self._condition.notify_all()
+                            return
+                    try:
+                        await asyncio.wait_for(self._condition.wait(), timeout=timeout)
+                    except TimeoutError:
+                        pass
+        except BaseException:
+            # Cancelled while waiting: leave the queue so that others are not blocked by this ticket
+            if ticket in self._queue:
+                self._queue.remove(ticket)
+                heapq.heapify(self._queue)
+                async with self._condition:
+                    self._condition.notify_all()
+            raise
+
+    async def _release(self) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def _update_limits(self, headers: httpx.Headers) -> None:
+        self._requests.sync(
+            _parse_number(headers.get("x-ratelimit-limit-requests")),
+            _parse_number(headers.get("x-ratelimit-remaining-requests")),
+        )
+        self._tokens.sync(
+            _parse_number(headers.get("x-ratelimit-limit-tokens")),
+            _parse_number(headers.get("x-ratelimit-remaining-tokens")),
+        )
+
+    def _back_off(self, error: openai.APIError, attempt: int) -> None:
+        delay = None
+        if isinstance(error, openai.APIStatusError):
+            headers = error.response.headers
+            self._update_limits(headers)
+            if (retry_after_ms := _parse_number(headers.get("retry-after-ms"))) is not None:
+                delay = retry_after_ms / 1000
+            elif (retry_after := _parse_number(headers.get("retry-after"))) is not None:
+                delay = retry_after
+            else:
+                delay = max(
+                    _parse_duration(headers.get("x-ratelimit-reset-requests")) or 0,
+                    _parse_duration(headers.get("x-ratelimit-reset-tokens")) or 0,
+                )
+        if not delay:
+            delay = min(2**attempt, 60) * random.uniform(0.5, 1.0)
+
+        logger.warning(f"OpenAI request failed with {type(error).__name__}, pausing for {delay:.1f} s")
+        # Pause everyone, not just this request: the budget is shared
+        self._paused_until = max(self._paused_until, time.monotonic() + delay)
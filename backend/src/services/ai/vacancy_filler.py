@@ -1,14 +1,23 @@
 import base64
+import datetime
+import hashlib
 from pathlib import Path
 
 from openai.types.responses import EasyInputMessageParam, ResponseInputFileParam, ResponseInputTextParam
 
 from src.config import open_ai_text_settings
+from src.db.repositories import VacancyExtractionRepository
 from src.schemas import VacancyFromFile
-from src.services.ai.openai_client import async_client
+from src.services.ai.openai_client import openai_scheduler
+from src.services.ai.scheduler import Priority
 
+VACANCY_PROMPT_VERSION = "1"
+"Bump on any change of the prompt below, so that results extracted with the old one are not reused"
 
-async def fill_vacancy_from_file(filepath: Path) -> VacancyFromFile:
+
+async def fill_vacancy_from_file(
+    filepath: Path, vacancy_extraction_repository: VacancyExtractionRepository
+) -> VacancyFromFile:
     system_msg = EasyInputMessageParam(
         role="system",
         content=(
@@ -31,6 +40,16 @@ async def fill_vacancy_from_file(filepath: Path) -> VacancyFromFile:
     with open(filepath, "rb") as f:
         data = f.read()
 
+    document_hash = hashlib.sha256(data).hexdigest()
+    cached = await vacancy_extraction_repository.get_result(
+        document_hash=document_hash,
+        model=open_ai_text_settings.model,
+        prompt_version=VACANCY_PROMPT_VERSION,
+        max_age=datetime.timedelta(seconds=open_ai_text_settings.vacancy_extraction_cache_ttl_seconds),
+    )
+    if cached is not None:
+        return VacancyFromFile.model_validate(cached)
+
     base64_string = base64.b64encode(data).decode("utf-8")
 
     text_input = ResponseInputTextParam(type="input_text", text=instructions)
@@ -42,10 +61,18 @@ async def fill_vacancy_from_file(filepath: Path) -> VacancyFromFile:
 
     user_msg = EasyInputMessageParam(role="user", content=[file_input, text_input])
 
-    response = await async_client.responses.parse(
+    response = await openai_scheduler.parse(
+        priority=Priority.INTERACTIVE,
         model=open_ai_text_settings.model,
         input=[system_msg, user_msg],
         text_format=VacancyFromFile,
     )
 
-    return response.output_parsed
+    result: VacancyFromFile = response.output_parsed
+    await vacancy_extraction_repository.save_result(
+        document_hash=document_hash,
+        model=open_ai_text_settings.model,
+        prompt_version=VACANCY_PROMPT_VERSION,
+        result=result.model_dump(mode="json"),
+    )
+    return result
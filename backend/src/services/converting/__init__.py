@@ -1,3 +1,4 @@
-from src.services.converting.repository import ConvertingRepository
+from src.services.converting.cache import ConversionCache
+from src.services.converting.repository import ConversionQueueFullError, ConvertingRepository
 
-__all__ = ["ConvertingRepository"]
+__all__ = ["ConversionCache", "ConversionQueueFullError", "ConvertingRepository"]
@@ -0,0 +1,73 @@
+import asyncio
+import hashlib
+import os
+import shutil
+from pathlib import Path
+from uuid import uuid4
+
+
+class ConversionCache:
+    """
+    Converted PDFs stored on disk as `<sha256 of the original document>.pdf`. Hits are hard-linked to the destination,
+    so evicting an entry never removes a file that is still referenced. Least recently used entries are evicted once
+    the cache grows over `max_bytes`.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    def _entry(self, key: str) -> Path:
+        return self.directory / f"{key}.pdf"
+
+    def _link_sync(self, key: str, dest_path: Path) -> bool:
+        entry = self._entry(key)
+        try:
+            os.utime(entry)  # mark as recently used
+        except FileNotFoundError:
+            return False
+
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(entry, dest_path)
+        except FileNotFoundError:
+            return False  # evicted in between
+        except OSError:
+            shutil.copyfile(entry, dest_path)  # e.g. different file systems
+        return True
+
+    def _store_sync(self, key: str, pdf: bytes) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = self.directory / f".{uuid4()}.tmp"
+        tmp.write_bytes(pdf)
+        tmp.replace(self._entry(key))
+        self._evict_sync()
+
+    def _evict_sync(self) -> None:
+        entries = []
+        total = 0
+        for entry in self.directory.glob("*.pdf"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+            total += stat.st_size
+
+        entries.sort()
+        for _, size, entry in entries:
+            if total <= self.max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+
+    async def link(self, key: str, dest_path: Path) -> bool:
+        """Put the cached PDF to `dest_path`. Returns False on a cache miss."""
+        return await asyncio.to_thread(self._link_sync, key, dest_path)
+
+    async def store(self, key: str, pdf: bytes) -> None:
+        await asyncio.to_thread(self._store_sync, key, pdf)
@@ -1,9 +1,54 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
 import unoserver.client
 
 
+class ConversionQueueFullError(Exception):
+    """Raised when too many conversions are already waiting for a free unoserver connection."""
+
+
 class ConvertingRepository:
-    def __init__(self, server: str, port: int):
-        self.client = unoserver.client.UnoClient(server, str(port), host_location="remote")
+    """
+    Pool of unoserver connections, possibly to several unoserver instances. Conversions run in a dedicated thread pool
+    with one thread per connection, callers wait in a bounded queue for a free connection.
+    """
+
+    def __init__(
+        self, instances: list[tuple[str, int]], connections_per_instance: int, timeout_seconds: float, max_queue: int
+    ):
+        clients = [
+            unoserver.client.UnoClient(server, str(port), host_location="remote")
+            for server, port in instances
+            for _ in range(connections_per_instance)
+        ]
+        self.timeout_seconds = timeout_seconds
+        self.max_queue = max_queue
+        self._idle: asyncio.Queue[unoserver.client.UnoClient] = asyncio.Queue()
+        for client in clients:
+            self._idle.put_nowait(client)
+        self._waiting = 0
+        self._executor = ThreadPoolExecutor(max_workers=len(clients), thread_name_prefix="unoserver")
+
+    async def convert(self, indata: bytes, convert_to: str = "pdf") -> bytes:
+        """Convert a document in memory and return the converted bytes."""
+        if self._waiting >= self.max_queue:
+            raise ConversionQueueFullError(f"{self._waiting} conversions are already waiting")
+
+        self._waiting += 1
+        try:
+            client = await self._idle.get()
+        finally:
+            self._waiting -= 1
+
+        loop = asyncio.get_running_loop()
+        future = self._executor.submit(client.convert, indata=indata, convert_to=convert_to)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=self.timeout_seconds)
+        finally:
+            # A timed out conversion keeps the unoserver instance busy, so the connection is
+            # handed out again only once it is actually finished
+            future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._idle.put_nowait, client))
 
-    def any2pdf(self, inpath: str, outpath: str):
-        self.client.convert(inpath=inpath, outpath=outpath)
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
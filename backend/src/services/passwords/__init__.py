@@ -0,0 +1,10 @@
+from src.config import password_hashing_settings
+from src.services.passwords.hasher import PasswordHasher, PasswordHasherBusyError
+
+password_hasher = PasswordHasher(
+    rounds=password_hashing_settings.rounds,
+    max_workers=password_hashing_settings.max_workers,
+    max_waiting=password_hashing_settings.max_waiting,
+)
+
+__all__ = ["PasswordHasher", "PasswordHasherBusyError", "password_hasher"]
@@ -0,0 +1,72 @@
+__all__ = ["PasswordHasher", "PasswordHasherBusyError"]
+
+import asyncio
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+from passlib.context import CryptContext
+
+T = TypeVar("T")
+
+
+class PasswordHasherBusyError(Exception):
+    """Raised when too many hashes are already waiting for a free thread."""
+
+
+class PasswordHasher:
+    """
+    bcrypt hashing and verification in a dedicated thread pool, bcrypt releases the GIL so threads are enough to keep
+    the event loop free. Callers wait in a bounded queue, so that a login flood is rejected instead of queued forever.
+    """
+
+    def __init__(self, rounds: int, max_workers: int | None, max_waiting: int) -> None:
+        # Equal min and max rounds make any hash with another cost factor "need update"
+        self.context = CryptContext(
+            schemes=["bcrypt"],
+            deprecated="auto",
+            bcrypt__default_rounds=rounds,
+            bcrypt__min_rounds=rounds,
+            bcrypt__max_rounds=rounds,
+        )
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_waiting = max_waiting
+        self._semaphore = asyncio.Semaphore(self.max_workers)
+        self._waiting = 0
+        self._executor: ThreadPoolExecutor | None = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="bcrypt")
+        return self._executor
+
+    async def _run(self, fn: Callable[..., T], *args) -> T:
+        if self._semaphore.locked() and self._waiting >= self.max_waiting:
+            raise PasswordHasherBusyError(f"{self._waiting} hashes are already waiting")
+
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._get_executor(), fn, *args)
+        finally:
+            self._semaphore.release()
+
+    async def hash(self, password: str) -> str:
+        return await self._run(self.context.hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run(self.context.verify, password, hashed_password)
+
+    async def verify_and_update(self, password: str, hashed_password: str) -> tuple[bool, str | None]:
+        """Verify the password, also returning a new hash if the stored one was made with outdated parameters."""
+        return await self._run(self.context.verify_and_update, password, hashed_password)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
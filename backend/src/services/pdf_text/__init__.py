@@ -0,0 +1,13 @@
+from src.config import pdf_text_settings
+from src.services.pdf_text.backends import BACKENDS, PdfBackend, PdfDocument
+from src.services.pdf_text.extractor import PdfExtractionError, PdfTextExtractor
+
+pdf_text_extractor = PdfTextExtractor(
+    backend=pdf_text_settings.backend,
+    max_workers=pdf_text_settings.max_workers,
+    max_pages=pdf_text_settings.max_pages,
+    timeout_seconds=pdf_text_settings.timeout_seconds,
+    pages_per_chunk=pdf_text_settings.pages_per_chunk,
+)
+
+__all__ = ["BACKENDS", "PdfBackend", "PdfDocument", "PdfExtractionError", "PdfTextExtractor", "pdf_text_extractor"]
@@ -0,0 +1,44 @@
+__all__ = ["BACKENDS", "PdfBackend", "PdfDocument", "PyPDF2Backend"]
+
+from typing import Protocol
+
+import PyPDF2
+
+
+class PdfDocument(Protocol):
+    """A parsed PDF, opened once and then read chunk by chunk."""
+
+    @property
+    def page_count(self) -> int: ...
+
+    def extract_pages(self, start: int, stop: int) -> list[str]: ...
+
+
+class PdfBackend(Protocol):
+    """Text extraction library. Instances are created inside extraction processes, so they must be cheap to construct."""
+
+    def open(self, path: str) -> PdfDocument: ...
+
+
+class PyPDF2Document:
+    def __init__(self, path: str) -> None:
+        # Reads the whole file into memory, no handle is kept open
+        self.reader = PyPDF2.PdfReader(path)
+
+    @property
+    def page_count(self) -> int:
+        return len(self.reader.pages)
+
+    def extract_pages(self, start: int, stop: int) -> list[str]:
+        return [(self.reader.pages[i].extract_text() or "") for i in range(start, stop)]
+
+
+class PyPDF2Backend:
+    def open(self, path: str) -> PdfDocument:
+        return PyPDF2Document(path)
+
+
+BACKENDS: dict[str, type[PdfBackend]] = {
+    "pypdf2": PyPDF2Backend,
+}
+"Register faster parsers here to make them selectable with `pdf_text_settings.backend`"
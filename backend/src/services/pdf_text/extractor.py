@@ -0,0 +1,119 @@
+__all__ = ["PdfExtractionError", "PdfTextExtractor"]
+
+import asyncio
+import multiprocessing
+import os
+from collections.abc import AsyncIterator
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from pathlib import Path
+from typing import Any
+
+from src.api.logging_ import logger
+from src.services.pdf_text.backends import BACKENDS
+
+
+class PdfExtractionError(Exception):
+    """Raised when the backend fails to parse a document, with the error from the extraction process."""
+
+
+def _extract_document(backend: str, path: str, max_pages: int, pages_per_chunk: int, connection: Connection) -> None:
+    """
+    Entry point of an extraction process: opens the document once and sends the total page count, then chunks of page
+    texts and finally None, or an error message instead if parsing fails.
+    """
+    try:
+        document = BACKENDS[backend]().open(path)
+        page_count = document.page_count
+        connection.send(("page_count", page_count))
+        page_count = min(page_count, max_pages)
+        for start in range(0, page_count, pages_per_chunk):
+            connection.send(("pages", document.extract_pages(start, min(start + pages_per_chunk, page_count))))
+        connection.send(("pages", None))
+    except Exception as e:
+        connection.send(("error", f"{type(e).__name__}: {e}"))
+    finally:
+        connection.close()
+
+
+class PdfTextExtractor:
+    """
+    Extracts text from PDFs in separate processes, so that parsing neither blocks the event loop nor holds the GIL.
+    Each document gets its own process, at most `max_workers` at a time, and only the first `max_pages` pages are read.
+    A document taking longer than `timeout_seconds` has its process killed, which does not affect any other document.
+    """
+
+    def __init__(
+        self, backend: str, max_workers: int | None, max_pages: int, timeout_seconds: float, pages_per_chunk: int
+    ) -> None:
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown PDF backend {backend!r}, available: {', '.join(BACKENDS)}")
+        self.backend = backend
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pages = max_pages
+        self.timeout_seconds = timeout_seconds
+        self.pages_per_chunk = pages_per_chunk
+        # Forking the threaded event loop process is unsafe; the fork server is a clean process started once, that
+        # has the parser imported and forks the extraction processes cheaply
+        self._context = multiprocessing.get_context("forkserver")
+        self._context.set_forkserver_preload([__name__])
+        self._slots = asyncio.Semaphore(self.max_workers)
+        self._processes: set[BaseProcess] = set()
+
+    def shutdown(self) -> None:
+        for process in list(self._processes):
+            process.kill()
+
+    @staticmethod
+    async def _receive(connection: Connection, deadline: float) -> tuple[str, Any]:
+        loop = asyncio.get_running_loop()
+        if not connection.poll():
+            readable = loop.create_future()
+            loop.add_reader(connection.fileno(), lambda: readable.done() or readable.set_result(None))
+            try:
+                await asyncio.wait_for(readable, timeout=max(0.0, deadline - loop.time()))
+            finally:
+                loop.remove_reader(connection.fileno())
+        try:
+            return connection.recv()
+        except EOFError:
+            raise PdfExtractionError("Extraction process exited unexpectedly") from None
+
+    async def iter_pages(self, path: Path | str) -> AsyncIterator[str]:
+        """Yield page texts one by one as soon as their chunk is parsed."""
+        path = str(path)
+        async with self._slots:
+            deadline = asyncio.get_running_loop().time() + self.timeout_seconds
+            receiver, sender = self._context.Pipe(duplex=False)
+            process = self._context.Process(
+                target=_extract_document,
+                args=(self.backend, path, self.max_pages, self.pages_per_chunk, sender),
+                daemon=True,
+            )
+            process.start()
+            self._processes.add(process)
+            # Only the child writes, closing our copy lets the reader see the end when the child dies
+            sender.close()
+            try:
+                while True:
+                    kind, value = await self._receive(receiver, deadline)
+                    if kind == "error":
+                        raise PdfExtractionError(value)
+                    if kind == "page_count":
+                        if value > self.max_pages:
+                            logger.info(f"{path} has {value} pages, only the first {self.max_pages} are extracted")
+                        continue
+                    if value is None:
+                        break
+                    for text in value:
+                        yield text
+            finally:
+                if process.is_alive():
+                    process.kill()
+                receiver.close()
+                self._processes.discard(process)
+                await asyncio.to_thread(process.join)
+
+    async def extract_text(self, path: Path | str) -> str:
+        parts = [text async for text in self.iter_pages(path)]
+        return "\n".join(parts).strip()
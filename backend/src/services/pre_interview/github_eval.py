@@ -1,14 +1,11 @@
 import re
 from typing import Literal
+from xml.etree.ElementTree import Element, XMLPullParser, tostring
 
-from bs4 import BeautifulSoup
-from httpx import AsyncClient
 from pydantic import Field
 
 from src.schemas.pydantic_base import BaseSchema
 
-async_client = AsyncClient()
-
 
 class Stat(BaseSchema):
     name: str
@@ -25,73 +22,109 @@ class GithubStats(BaseSchema):
     stats: list[Stat]
 
 
-async def parse_github_stats(github_username: str) -> GithubStats:
-    url = f"https://github-readme-stats.vercel.app/api?username={github_username}&include_all_commits=false&count_private=true&show_icons=true"
-
-    response = await async_client.get(url)
-    soup = BeautifulSoup(response.text, "html.parser")
-    svg_data = soup.find("svg")
-    title = svg_data.find("title").text
-    fullname, _, _ = title.partition(" GitHub Stats")
-    fullname = fullname.removesuffix("'s")
-    _, _, rank = title.rpartition("Rank: ")
-    desc = svg_data.find("desc").text
-
-    # find style
-    # .rank-circle {
-    #   stroke: #2f80ed;
-    #   stroke-dasharray: 300;
-    #   fill: none;
-    #   stroke-width: 6;
-    #   stroke-linecap: round;
-    #   opacity: 0.8;
-    #   transform-origin: -10px 8px;
-    #   transform: rotate(-90deg);
-    #   animation: rankAnimation 1s forwards ease-in-out;
-    # }
-    style = svg_data.find("style").text
-    rankAnimation = re.search(r"@keyframes rankAnimation ", style)
-
-    if rankAnimation:
-        stroke_dasharray = 0
-        starting_pos = rankAnimation.span()
-        to = re.search(r"to {", style[starting_pos[1] :])
-        if to:
-            to_pos = to.span()
-            to_pos = to_pos[0] + starting_pos[1]
-            # stroke-dashoffset: 120.12313
-            stroke_dasharray_str = re.search(
-                r"stroke-dashoffset: (\d+\.\d+);", style[to_pos:]
-            )
-            if stroke_dasharray_str:
-                stroke_dasharray = float(stroke_dasharray_str.group(1))
-
-        rank_progress = round(((250 - stroke_dasharray) / 250) * 100)
-    else:
-        rank_progress = 0
-
-    # Total Stars Earned: 130, Total Commits in 2025 : 935, Total PRs: 79, Total Issues: 292, Contributed to (last year): 72
-    stats = []
-    for line in desc.split(", "):
-        key, _, value = line.partition(": ")
-        stats.append(Stat(name=key, value=int(value) if value.isdigit() else value))
-
-    icons = []
-
-    # find all svgs with class "icon"
-    icons_elements = svg_data.find_all("svg", class_="icon")
-    for icon_element in icons_elements:
-        # as html string
-        icons.append(icon_element.prettify())
-
-    if len(icons) == len(stats):
-        for icon, stat in zip(icons, stats):
-            stat.icon = icon
-
-    return GithubStats(
-        github_stats_url=url,
-        fullname=fullname,
-        rank=rank,
-        rank_progress=rank_progress,
-        stats=stats,
-    )
+SVG_NAMESPACE = "{http://www.w3.org/2000/svg}"
+
+# .rank-circle is animated from the empty circle to the progress, e.g.
+# @keyframes rankAnimation {
+#   from { stroke-dashoffset: 251.32741228718345; }
+#   to { stroke-dashoffset: 120.12313; }
+# }
+_RANK_ANIMATION = "@keyframes rankAnimation "
+_RANK_OFFSET = re.compile(r"to {.*?stroke-dashoffset: (\d+\.\d+);", re.DOTALL)
+
+
+def _local_name(tag: str) -> str:
+    return tag.removeprefix(SVG_NAMESPACE)
+
+
+def _is_icon(element: Element) -> bool:
+    return _local_name(element.tag) == "svg" and "icon" in element.get("class", "").split()
+
+
+def _icon_markup(element: Element) -> str:
+    """Icon as an inline `<svg>` tag, without the namespace prefixes added by the XML parser."""
+    for child in element.iter():
+        child.tag = _local_name(child.tag)
+    element.tail = None
+    return tostring(element, encoding="unicode")
+
+
+class GithubStatsParser:
+    """
+    Incremental parser of the stats card returned by github-readme-stats. Everything needed is extracted in one pass
+    over the document as it is fed, elements are dropped right after being read, so no tree of the card is kept.
+    """
+
+    def __init__(self) -> None:
+        self._parser = XMLPullParser(events=("start", "end"))
+        self._texts: dict[str, str] = {}
+        self._icons: list[str] = []
+        self._icon_depth = 0
+
+    def feed(self, data: str | bytes) -> None:
+        self._parser.feed(data)
+        self._read_events()
+
+    def _read_events(self) -> None:
+        for event, element in self._parser.read_events():
+            if event == "start":
+                if _is_icon(element):
+                    self._icon_depth += 1
+                continue
+
+            if self._icon_depth:
+                if _is_icon(element):
+                    self._icon_depth -= 1
+                    if not self._icon_depth:
+                        self._icons.append(_icon_markup(element))
+                        element.clear()
+                # Icon contents are needed until the whole icon is serialized
+                continue
+
+            name = _local_name(element.tag)
+            if name in ("title", "desc", "style") and name not in self._texts:
+                self._texts[name] = element.text or ""
+            element.clear()
+
+    def close(self, url: str) -> GithubStats:
+        self._parser.close()
+        self._read_events()
+
+        title = self._texts["title"]
+        fullname, _, _ = title.partition(" GitHub Stats")
+        fullname = fullname.removesuffix("'s")
+        _, _, rank = title.rpartition("Rank: ")
+
+        style = self._texts.get("style", "")
+        animation = style.find(_RANK_ANIMATION)
+        if animation != -1:
+            offset = _RANK_OFFSET.search(style, animation + len(_RANK_ANIMATION))
+            stroke_dashoffset = float(offset.group(1)) if offset else 0
+            rank_progress = round(((250 - stroke_dashoffset) / 250) * 100)
+        else:
+            rank_progress = 0
+
+        # Total Stars Earned: 130, Total Commits in 2025 : 935, Total PRs: 79, Total Issues: 292, Contributed to (last year): 72
+        stats = []
+        for line in self._texts["desc"].split(", "):
+            key, _, value = line.partition(": ")
+            stats.append(Stat(name=key, value=int(value) if value.isdigit() else value))
+
+        if len(self._icons) == len(stats):
+            for icon, stat in zip(self._icons, stats):
+                stat.icon = icon
+
+        return GithubStats(
+            github_stats_url=url,
+            fullname=fullname,
+            rank=rank,
+            rank_progress=rank_progress,
+            stats=stats,
+        )
+
+
+def parse_github_stats(svg: str | bytes, url: str) -> GithubStats:
+    """Parse the stats card returned by github-readme-stats from `url`."""
+    parser = GithubStatsParser()
+    parser.feed(svg)
+    return parser.close(url)
@@ -0,0 +1,157 @@
+__all__ = ["CircuitBreaker", "GithubStatsService", "github_username"]
+
+import asyncio
+import datetime
+import re
+import time
+
+import httpx
+
+from src.api.logging_ import logger
+from src.config_schema import GithubStatsSettings
+from src.db.repositories import GithubStatsCacheRepository
+from src.db.storage import AbstractSQLAlchemyStorage
+from src.services.pre_interview.github_eval import GithubStats, parse_github_stats
+
+# GitHub usernames are alphanumeric with single hyphens, up to 39 characters
+_USERNAME = re.compile(r"[a-z\d](?:[a-z\d-]{0,38})")
+
+
+def github_username(profile_url: str | None) -> str | None:
+    """Username from a profile link like https://github.com/octocat, None for other links."""
+    if not profile_url or "github" not in profile_url:
+        return None
+    username = profile_url.rstrip("/").split("/")[-1].lower()
+    return username if _USERNAME.fullmatch(username) else None
+
+
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive failures and rejects calls for `recovery_seconds`,
+    then lets a single trial call through: its success closes the breaker, its failure opens it again.
+    """
+
+    def __init__(self, failure_threshold: int, recovery_seconds: float) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self.failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_progress = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def allow(self) -> bool:
+        if self._opened_at is None:
+            return True
+        if self._trial_in_progress or time.monotonic() - self._opened_at < self.recovery_seconds:
+            return False
+        self._trial_in_progress = True
+        return True
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self._opened_at = None
+        self._trial_in_progress = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._trial_in_progress = False
+        if self.failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+
+
+class GithubStatsService:
+    """
+    github-readme-stats cards fetched through one pooled client with strict timeouts and cached in the database.
+    Fresh entries are returned as is, stale ones right away while being refreshed in the background, and when the
+    instance is failing the circuit breaker skips it, so callers get the cached stats or None instead of waiting.
+    """
+
+    def __init__(self, storage: AbstractSQLAlchemyStorage, settings: GithubStatsSettings) -> None:
+        self.client = httpx.AsyncClient(
+            base_url=settings.base_url,
+            timeout=httpx.Timeout(settings.timeout_seconds, connect=settings.connect_timeout_seconds),
+            limits=httpx.Limits(
+                max_connections=settings.max_connections,
+                max_keepalive_connections=settings.max_keepalive_connections,
+            ),
+        )
+        self.repository = GithubStatsCacheRepository(storage)
+        self.fresh_ttl = datetime.timedelta(seconds=settings.fresh_ttl_seconds)
+        self.stale_ttl = datetime.timedelta(seconds=settings.stale_ttl_seconds)
+        self.breaker = CircuitBreaker(settings.failure_threshold, settings.recovery_seconds)
+        # One request per username at a time, concurrent callers share it
+        self._in_flight: dict[str, asyncio.Task[GithubStats | None]] = {}
+
+    async def get_stats(self, username: str) -> GithubStats | None:
+        username = username.lower()
+        if not _USERNAME.fullmatch(username):
+            return None
+
+        cached = await self.repository.get_stats(username)
+        cached_stats = None
+        if cached is not None:
+            cached_stats = GithubStats.model_validate(cached.stats)
+            age = datetime.datetime.now(tz=datetime.UTC) - cached.fetched_at
+            if age < self.fresh_ttl:
+                return cached_stats
+            if age < self.stale_ttl:
+                self._refresh(username)
+                return cached_stats
+
+        # Shielded: a cancelled caller should not abort the request shared with others
+        stats = await asyncio.shield(self._refresh(username))
+        return stats if stats is not None else cached_stats
+
+    def _refresh(self, username: str) -> asyncio.Task[GithubStats | None]:
+        task = self._in_flight.get(username)
+        if task is None:
+            task = asyncio.create_task(self._fetch(username))
+            self._in_flight[username] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(username, None))
+        return task
+
+    async def _fetch(self, username: str) -> GithubStats | None:
+        if not self.breaker.allow():
+            logger.info(f"github-readme-stats is unavailable, stats of {username} are not fetched")
+            return None
+
+        try:
+            response = await self.client.get(
+                "/api",
+                params={
+                    "username": username,
+                    "include_all_commits": "false",
+                    "count_private": "true",
+                    "show_icons": "true",
+                },
+            )
+            # Rate limiting (429) and any other non-2xx answer mean the service is not usable either
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            self.breaker.record_failure()
+            logger.warning(f"Fetching github stats of {username} failed: {type(e).__name__}: {e}")
+            return None
+        self.breaker.record_success()
+
+        try:
+            # Unknown users get an error card with status 200, it does not parse
+            stats = parse_github_stats(response.text, str(response.url))
+        except Exception as e:
+            logger.warning(f"Github stats card of {username} could not be parsed: {type(e).__name__}: {e}")
+            return None
+
+        try:
+            await self.repository.save_stats(
+                username, stats.model_dump(mode="json"), datetime.datetime.now(tz=datetime.UTC)
+            )
+        except Exception as e:
+            logger.warning(f"Github stats of {username} could not be cached: {type(e).__name__}: {e}")
+        return stats
+
+    async def close(self) -> None:
+        for task in list(self._in_flight.values()):
+            task.cancel()
+        await self.client.aclose()
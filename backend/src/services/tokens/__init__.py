@@ -0,0 +1,16 @@
+from datetime import timedelta
+
+from src.config import api_settings
+from src.services.tokens.service import InvalidTokenError, TokenService, TokenType
+
+token_service = TokenService(
+    algorithm=api_settings.encryption_algorithm,
+    secret_key=api_settings.secret_key.get_secret_value(),
+    private_key_path=api_settings.private_key_path,
+    public_key_path=api_settings.public_key_path,
+    access_token_expiration=timedelta(minutes=api_settings.token_expiration_in_minutes),
+    refresh_token_expiration=timedelta(days=api_settings.refresh_token_expiration_in_days),
+    cache_max_size=api_settings.token_cache_max_size,
+)
+
+__all__ = ["InvalidTokenError", "TokenService", "TokenType", "token_service"]
@@ -0,0 +1,113 @@
+__all__ = ["InvalidTokenError", "TokenService", "TokenType"]
+
+import base64
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from enum import StrEnum
+from pathlib import Path
+from typing import Any
+
+from jose import JWTError, jwk, jwt
+from jose.backends.base import Key
+
+# Members of the public JWK that its RFC 7638 thumbprint is computed from
+_THUMBPRINT_MEMBERS = ("crv", "e", "kty", "n", "x", "y")
+
+
+class InvalidTokenError(Exception):
+    """Raised when a token is malformed, expired, signed with another key or is of another type."""
+
+
+class TokenType(StrEnum):
+    ACCESS = "access"
+    REFRESH = "refresh"
+
+
+class TokenService:
+    """
+    Issues and verifies JWTs with keys parsed once at startup. HMAC algorithms sign with `secret_key`, asymmetric ones
+    with the private key, while the public key is published so that other services can verify tokens on their own.
+    Successfully decoded tokens are remembered by their hash until they expire.
+    """
+
+    def __init__(
+        self,
+        algorithm: str,
+        secret_key: str,
+        private_key_path: Path | None,
+        public_key_path: Path | None,
+        access_token_expiration: timedelta,
+        refresh_token_expiration: timedelta,
+        cache_max_size: int,
+    ) -> None:
+        self.algorithm = algorithm
+        self.access_token_expiration = access_token_expiration
+        self.refresh_token_expiration = refresh_token_expiration
+        self.cache_max_size = cache_max_size
+        self._cache: OrderedDict[bytes, tuple[float, dict[str, Any]]] = OrderedDict()
+
+        self.is_asymmetric = not algorithm.startswith("HS")
+        if self.is_asymmetric:
+            if private_key_path is None:
+                raise ValueError(f"private_key_path is required for {algorithm}")
+            self._signing_key: Key = jwk.construct(private_key_path.read_text(), algorithm)
+            if public_key_path is not None:
+                self._verifying_key: Key = jwk.construct(public_key_path.read_text(), algorithm)
+            else:
+                self._verifying_key = self._signing_key.public_key()
+            self.key_id = self._thumbprint(self._verifying_key.to_dict())
+        else:
+            self._signing_key = self._verifying_key = jwk.construct(secret_key, algorithm)
+            self.key_id = None
+
+    @staticmethod
+    def _thumbprint(public_jwk: dict[str, Any]) -> str:
+        members = {key: public_jwk[key] for key in _THUMBPRINT_MEMBERS if key in public_jwk}
+        digest = hashlib.sha256(json.dumps(members, separators=(",", ":"), sort_keys=True).encode()).digest()
+        return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+    def public_jwks(self) -> dict[str, Any] | None:
+        """JSON Web Key Set with the verifying key, None for HMAC algorithms: their key must stay secret."""
+        if not self.is_asymmetric:
+            return None
+        key = {**self._verifying_key.to_dict(), "alg": self.algorithm, "use": "sig", "kid": self.key_id}
+        return {"keys": [key]}
+
+    def _encode(self, claims: dict[str, Any], token_type: TokenType, expires_in: timedelta) -> str:
+        claims = {**claims, "type": token_type.value, "exp": int(time.time() + expires_in.total_seconds())}
+        headers = {"kid": self.key_id} if self.key_id else None
+        return jwt.encode(claims, self._signing_key, algorithm=self.algorithm, headers=headers)
+
+    def create_access_token(self, claims: dict[str, Any]) -> str:
+        return self._encode(claims, TokenType.ACCESS, self.access_token_expiration)
+
+    def create_refresh_token(self, claims: dict[str, Any]) -> str:
+        return self._encode(claims, TokenType.REFRESH, self.refresh_token_expiration)
+
+    def decode(self, token: str, token_type: TokenType = TokenType.ACCESS) -> dict[str, Any]:
+        key = hashlib.sha256(token.encode()).digest()
+        now = time.time()
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] > now:
+            self._cache.move_to_end(key)
+            claims = cached[1]
+        else:
+            if cached is not None:
+                del self._cache[key]
+            try:
+                claims = jwt.decode(token, self._verifying_key, algorithms=[self.algorithm])
+            except JWTError as e:
+                raise InvalidTokenError(str(e)) from e
+            # Tokens without expiration are not cached, there would be no moment to forget them
+            if isinstance(claims.get("exp"), int | float) and self.cache_max_size > 0:
+                self._cache[key] = (claims["exp"], claims)
+                while len(self._cache) > self.cache_max_size:
+                    self._cache.popitem(last=False)
+
+        # Tokens issued before refresh tokens were introduced carry no type and are access tokens
+        if claims.get("type", TokenType.ACCESS.value) != token_type.value:
+            raise InvalidTokenError(f"Expected {token_type.value} token")
+        return claims
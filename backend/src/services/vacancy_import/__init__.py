@@ -0,0 +1,4 @@
+from src.services.vacancy_import.importer import VacancyImporter
+from src.services.vacancy_import.parsing import RowError, iter_csv_rows, iter_lines, iter_ndjson_rows
+
+__all__ = ["RowError", "VacancyImporter", "iter_csv_rows", "iter_lines", "iter_ndjson_rows"]
@@ -0,0 +1,88 @@
+from collections.abc import AsyncIterable
+
+from pydantic import ValidationError
+from sqlalchemy.exc import DBAPIError
+
+from src.api.logging_ import logger
+from src.db import AbstractSQLAlchemyStorage, UnitOfWork
+from src.db.repositories import SkillRepository, VacancyRepository
+from src.schemas import VacancyImportError, VacancyImportResponse, VacancyWithSkillsCreateRequest
+from src.services.vacancy_import.parsing import RowError
+
+IMPORT_BATCH_SIZE = 500
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(map(str, e['loc']))}: {e['msg']}" for e in error.errors())
+
+
+def _format_db_error(error: DBAPIError) -> str:
+    return str(error.orig).strip().splitlines()[0]
+
+
+class VacancyImporter:
+    """
+    Validates rows one by one and writes them in batches, each batch in its own transaction with one insert for the
+    vacancies and one for their skills. If the database rejects a batch, its rows are retried one by one, so that
+    only the offending rows are reported.
+    """
+
+    def __init__(self, storage: AbstractSQLAlchemyStorage, user_id: int, batch_size: int = IMPORT_BATCH_SIZE) -> None:
+        self.storage = storage
+        self.user_id = user_id
+        self.batch_size = batch_size
+
+    async def run(self, rows: AsyncIterable[tuple[int, dict | RowError]]) -> VacancyImportResponse:
+        created = 0
+        errors: list[VacancyImportError] = []
+        batch: list[tuple[int, VacancyWithSkillsCreateRequest]] = []
+
+        async for row, data in rows:
+            if isinstance(data, RowError):
+                errors.append(VacancyImportError(row=row, error=str(data)))
+                continue
+            try:
+                batch.append((row, VacancyWithSkillsCreateRequest.model_validate(data)))
+            except ValidationError as e:
+                errors.append(VacancyImportError(row=row, error=_format_validation_error(e)))
+                continue
+
+            if len(batch) >= self.batch_size:
+                created += await self._write(batch, errors)
+                batch = []
+
+        if batch:
+            created += await self._write(batch, errors)
+
+        errors.sort(key=lambda error: error.row)
+        logger.info(f"Imported {created} vacancies, {len(errors)} rows rejected")
+        return VacancyImportResponse(created=created, errors=errors)
+
+    async def _write(
+        self, batch: list[tuple[int, VacancyWithSkillsCreateRequest]], errors: list[VacancyImportError]
+    ) -> int:
+        try:
+            await self._insert(batch)
+            return len(batch)
+        except DBAPIError as e:
+            if len(batch) == 1:
+                errors.append(VacancyImportError(row=batch[0][0], error=_format_db_error(e)))
+                return 0
+
+        created = 0
+        for item in batch:
+            created += await self._write([item], errors)
+        return created
+
+    async def _insert(self, batch: list[tuple[int, VacancyWithSkillsCreateRequest]]) -> None:
+        async with UnitOfWork(self.storage) as unit_of_work:
+            vacancies = await VacancyRepository(unit_of_work).bulk_create_vacancies(
+                user_id=self.user_id,
+                items=[request.vacancy.model_dump() for _, request in batch],
+            )
+            await SkillRepository(unit_of_work).bulk_create_vacancy_skills(
+                {
+                    vacancy.id: [skill.model_dump() for skill in request.skills]
+                    for vacancy, (_, request) in zip(vacancies, batch, strict=True)
+                }
+            )
@@ -0,0 +1,90 @@
+import codecs
+import csv
+import json
+from collections.abc import AsyncIterable, AsyncIterator
+
+# Columns of a CSV import, `skills` holds a JSON list of {"weight", "details", "skill_type_id"}
+CSV_VACANCY_COLUMNS = (
+    "name",
+    "description",
+    "salary",
+    "city",
+    "weekly_hours_occupancy",
+    "required_experience",
+    "open_time",
+    "close_time",
+    "is_active",
+)
+CSV_SKILLS_COLUMN = "skills"
+
+
+class RowError(ValueError):
+    """A row that cannot be turned into a vacancy, the import goes on with the next one."""
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """Split a stream of UTF-8 bytes into lines without reading it whole."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.removesuffix("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.removesuffix("\r")
+
+
+async def iter_ndjson_rows(lines: AsyncIterable[str]) -> AsyncIterator[tuple[int, dict | RowError]]:
+    """Yield (row number, parsed object or error) for each non-empty line."""
+    row = 0
+    async for line in lines:
+        row += 1
+        if not line.strip():
+            continue
+        try:
+            yield row, json.loads(line)
+        except json.JSONDecodeError as e:
+            yield row, RowError(f"Invalid JSON: {e}")
+
+
+async def _iter_csv_records(lines: AsyncIterable[str]) -> AsyncIterator[list[str]]:
+    # A quoted field may contain line breaks: a record is complete once its quotes are balanced
+    record = None
+    async for line in lines:
+        record = line if record is None else f"{record}\n{line}"
+        if record.count('"') % 2 == 0:
+            yield next(csv.reader([record]), [])
+            record = None
+    if record is not None:
+        yield next(csv.reader([record]), [])
+
+
+async def iter_csv_rows(lines: AsyncIterable[str]) -> AsyncIterator[tuple[int, dict | RowError]]:
+    """Yield (row number, `VacancyWithSkillsCreateRequest`-shaped dict or error) for each data row."""
+    header = None
+    row = 0
+    async for record in _iter_csv_records(lines):
+        if header is None:
+            header = [column.strip() for column in record]
+            missing = {"name", "description", "city", "weekly_hours_occupancy", "required_experience"} - set(header)
+            if missing:
+                raise RowError(f"CSV header is missing columns: {', '.join(sorted(missing))}")
+            continue
+
+        row += 1
+        if not any(value.strip() for value in record):
+            continue
+        if len(record) != len(header):
+            yield row, RowError(f"Expected {len(header)} columns, got {len(record)}")
+            continue
+
+        values = dict(zip(header, record, strict=True))
+        vacancy = {key: values[key] for key in CSV_VACANCY_COLUMNS if values.get(key, "").strip()}
+        try:
+            skills = json.loads(values.get(CSV_SKILLS_COLUMN) or "[]")
+        except json.JSONDecodeError as e:
+            yield row, RowError(f"Invalid JSON in '{CSV_SKILLS_COLUMN}': {e}")
+            continue
+        yield row, {"vacancy": vacancy, "skills": skills}
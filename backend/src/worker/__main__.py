@@ -0,0 +1,33 @@
+import asyncio
+import os
+import signal
+
+from src.prepare import BASE_DIR
+
+os.chdir(BASE_DIR)
+
+from src.config import api_settings, github_stats_settings, worker_settings  # noqa: E402
+from src.db import SQLAlchemyStorage  # noqa: E402
+from src.services.pre_interview.github_stats import GithubStatsService  # noqa: E402
+from src.worker.handlers import make_handlers  # noqa: E402
+from src.worker.worker import JobWorker  # noqa: E402
+
+
+async def main() -> None:
+    storage = SQLAlchemyStorage.from_url(api_settings.db_url.get_secret_value())
+    github_stats_service = GithubStatsService(storage, github_stats_settings)
+    worker = JobWorker(storage, make_handlers(github_stats_service), worker_settings)
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+
+    try:
+        await worker.run()
+    finally:
+        await github_stats_service.close()
+        await storage.close_connection()
+
+
+print("🚀 Starting job worker")
+asyncio.run(main())
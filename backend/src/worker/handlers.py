@@ -0,0 +1,94 @@
+__all__ = ["JobHandler", "make_handlers"]
+
+from collections.abc import Awaitable, Callable
+from functools import partial
+
+from src.api.logging_ import logger
+from src.config import worker_settings
+from src.db.repositories import (
+    ApplicationRepository,
+    JobRepository,
+    PreInterviewResultRepository,
+    VacancyRepository,
+)
+from src.db.storage import AbstractSQLAlchemyStorage, UnitOfWork
+from src.schemas import JobKind, Status
+from src.services.ai.assessor import pre_interview_assessment
+from src.services.pre_interview.github_eval import GithubStats
+from src.services.pre_interview.github_stats import GithubStatsService, github_username
+
+JobHandler = Callable[[AbstractSQLAlchemyStorage, dict], Awaitable[None]]
+
+
+async def run_github_stats(
+    storage: AbstractSQLAlchemyStorage, payload: dict, github_stats_service: GithubStatsService
+) -> None:
+    """Store the github stats of the application's profile, then queue the pre-interview assessment."""
+    application_id = payload["application_id"]
+    application = await ApplicationRepository(storage).get_application(application_id)
+    if application is None:
+        logger.warning(f"Application {application_id} was deleted before its github stats were fetched")
+        return
+    # A previous attempt may have stored the stats and queued the next job, both are committed together. Unavailable
+    # stats leave no mark, a second pre-interview job then finds the assessment already stored
+    if application.github_stats_fetched_at is not None:
+        return
+
+    github_info = None
+    if username := github_username(application.profile_url):
+        # Unavailable stats are not worth delaying the assessment, it is done without them
+        github_info = await github_stats_service.get_stats(username)
+
+    async with UnitOfWork(storage) as uow:
+        # Left unstamped when the fetch failed, so that the interview session tries to fetch them again
+        if github_info is not None or username is None:
+            await ApplicationRepository(uow).set_github_stats(
+                application_id, github_info.model_dump(mode="json") if github_info else None
+            )
+        await JobRepository(uow).enqueue(
+            kind=JobKind.PRE_INTERVIEW,
+            payload={"application_id": application_id},
+            max_attempts=worker_settings.max_attempts,
+        )
+    if github_info is None and username is not None:
+        logger.info(f"Github stats for application {application_id} are unavailable, assessing without them")
+    else:
+        logger.info(f"Github stats for application {application_id} stored")
+
+
+async def run_pre_interview(storage: AbstractSQLAlchemyStorage, payload: dict) -> None:
+    application_repository = ApplicationRepository(storage)
+    vacancy_repository = VacancyRepository(storage)
+    pre_interview_repository = PreInterviewResultRepository(storage)
+
+    application_id = payload["application_id"]
+    application = await application_repository.get_application(application_id, with_results=True)
+    if application is None:
+        logger.warning(f"Application {application_id} was deleted before pre-interview assessment")
+        return
+
+    # A previous attempt may have stored the result and failed right after that
+    res = application.pre_interview_result
+    if res is None:
+        vacancy = await vacancy_repository.get_vacancy(application.vacancy_id, with_skills=True)
+        # Jobs queued before the github stats stage carry the stats in the payload
+        github_stats = application.github_stats or payload.get("github")
+        github_info = GithubStats.model_validate(github_stats) if github_stats else None
+        res = await pre_interview_assessment(
+            application=application,
+            vacancy=vacancy,
+            repository=pre_interview_repository,
+            application_repository=application_repository,
+            github=github_info,
+        )
+
+    new_status = Status.APPROVED_FOR_INTERVIEW if res.is_recommended else Status.REJECTED_FOR_INTERVIEW
+    await application_repository.edit_application(application_id, status=new_status)
+    logger.info(f"Pre-interview result for application {application_id} created")
+
+
+def make_handlers(github_stats_service: GithubStatsService) -> dict[str, JobHandler]:
+    return {
+        JobKind.GITHUB_STATS: partial(run_github_stats, github_stats_service=github_stats_service),
+        JobKind.PRE_INTERVIEW: run_pre_interview,
+    }
@@ -0,0 +1,102 @@
+__all__ = ["JobWorker"]
+
+import asyncio
+import datetime
+import random
+
+from src.api.logging_ import logger
+from src.config_schema import WorkerSettings
+from src.db.models import Job
+from src.db.repositories import JobRepository
+from src.db.storage import AbstractSQLAlchemyStorage
+from src.worker.handlers import JobHandler
+
+
+class JobWorker:
+    """Claims jobs from the `job` table and runs them with bounded concurrency."""
+
+    def __init__(
+        self, storage: AbstractSQLAlchemyStorage, handlers: dict[str, JobHandler], settings: WorkerSettings
+    ) -> None:
+        # Otherwise a job still running could be claimed and run again by another worker
+        if settings.job_timeout_seconds >= settings.lock_timeout_seconds:
+            raise ValueError("job_timeout_seconds must be below lock_timeout_seconds")
+        self.storage = storage
+        self.handlers = handlers
+        self.settings = settings
+        self.repository = JobRepository(storage)
+        self._stopping = asyncio.Event()
+        self._tasks: set[asyncio.Task] = set()
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+    async def run(self) -> None:
+        lock_timeout = datetime.timedelta(seconds=self.settings.lock_timeout_seconds)
+        logger.info(f"Worker started with concurrency {self.settings.concurrency}")
+
+        while not self._stopping.is_set():
+            free_slots = self.settings.concurrency - len(self._tasks)
+            if free_slots <= 0:
+                await asyncio.wait(self._tasks, return_when=asyncio.FIRST_COMPLETED)
+                continue
+
+            try:
+                jobs = await self.repository.claim(limit=free_slots, lock_timeout=lock_timeout)
+            except Exception:
+                logger.exception("Failed to claim jobs")
+                jobs = []
+
+            if not jobs:
+                await self._sleep(self.settings.poll_interval_seconds)
+                continue
+
+            for job in jobs:
+                task = asyncio.create_task(self._process(job))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+        if self._tasks:
+            logger.info(f"Waiting for {len(self._tasks)} running jobs to finish")
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        logger.info("Worker stopped")
+
+    async def _sleep(self, seconds: float) -> None:
+        try:
+            await asyncio.wait_for(self._stopping.wait(), timeout=seconds)
+        except TimeoutError:
+            pass
+
+    def _retry_delay(self, attempts: int) -> datetime.timedelta:
+        delay = min(self.settings.retry_base_delay_seconds * 2 ** (attempts - 1), self.settings.retry_max_delay_seconds)
+        # Jitter spreads retries of jobs that failed together, e.g. on an upstream outage
+        return datetime.timedelta(seconds=delay * random.uniform(0.8, 1.2))
+
+    async def _process(self, job: Job) -> None:
+        handler = self.handlers.get(job.kind)
+        if handler is None:
+            logger.error(f"No handler for job {job.id} of kind {job.kind!r}")
+            await self._fail(job, f"Unknown job kind {job.kind!r}", retry_in=None)
+            return
+
+        try:
+            async with asyncio.timeout(self.settings.job_timeout_seconds):
+                await handler(self.storage, job.payload)
+        except Exception as e:
+            if job.attempts >= job.max_attempts:
+                logger.exception(f"Job {job.id} ({job.kind}) failed after {job.attempts} attempts")
+                await self._fail(job, repr(e), retry_in=None)
+            else:
+                retry_in = self._retry_delay(job.attempts)
+                logger.warning(
+                    f"Job {job.id} ({job.kind}) failed, retrying in {int(retry_in.total_seconds())} s: {e!r}"
+                )
+                await self._fail(job, repr(e), retry_in=retry_in)
+            return
+
+        if not await self.repository.complete(job.id, job.locked_at):
+            logger.warning(f"Job {job.id} ({job.kind}) was claimed again while running, the other run completes it")
+
+    async def _fail(self, job: Job, error: str, retry_in: datetime.timedelta | None) -> None:
+        if not await self.repository.fail(job.id, job.locked_at, error, retry_in):
+            logger.warning(f"Job {job.id} ({job.kind}) was claimed again while running, the other run completes it")
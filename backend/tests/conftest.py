@@ -0,0 +1,43 @@
+import os
+from pathlib import Path
+
+# src.config reads the settings on import
+os.environ.setdefault("SETTINGS_PATH", str(Path(__file__).parent / "settings.yaml"))
+
+import pytest  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from src.db.storage import SQLAlchemyStorage  # noqa: E402
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+async def storage(tmp_path: Path):
+    """Empty database: Postgres from TEST_DB_URL if set, SQLite otherwise."""
+    storage = SQLAlchemyStorage.from_url(os.getenv("TEST_DB_URL", f"sqlite+aiosqlite:///{tmp_path / 'test.db'}"))
+    await storage.create_all()
+    yield storage
+    await storage.drop_all()
+    await storage.close_connection()
+
+
+class StatementCounter:
+    """Counts the statements sent to the database."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, *args) -> None:
+        self.count += 1
+
+
+@pytest.fixture
+def statements(storage: SQLAlchemyStorage):
+    counter = StatementCounter()
+    event.listen(storage.engine.sync_engine, "before_cursor_execute", counter)
+    yield counter
+    event.remove(storage.engine.sync_engine, "before_cursor_execute", counter)
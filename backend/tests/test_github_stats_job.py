@@ -0,0 +1,36 @@
+import datetime
+
+import pytest
+
+from src.db.repositories import ApplicationRepository, UserRepository, VacancyRepository
+from src.schemas import Status
+from src.services.pre_interview.github_eval import GithubStats
+from src.worker.handlers import run_github_stats
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeGithubStatsService:
+    def __init__(self, stats: GithubStats | None) -> None:
+        self.stats = stats
+
+    async def get_stats(self, username: str) -> GithubStats | None:
+        return self.stats
+
+
+@pytest.mark.parametrize(("git", "is_stamped"), [("https://github.com/octocat", False), (None, True)])
+async def test_unavailable_stats_are_not_stamped(storage, git, is_stamped):
+    user = await UserRepository(storage).create_user("A", "a@example.com", "hash", False)
+    vacancy = await VacancyRepository(storage).create_vacancy(
+        "Vacancy", "", None, "Kazan", 40, 1, datetime.datetime.now(datetime.UTC), None, True, user.id
+    )
+    application = await ApplicationRepository(storage).create_application(
+        "cv.pdf", Status.PENDING, user.id, vacancy.id, git
+    )
+
+    await run_github_stats(storage, {"application_id": application.id}, FakeGithubStatsService(None))
+
+    application = await ApplicationRepository(storage).get_application(application.id)
+    assert application.github_stats is None
+    # Without a timestamp the interview session fetches the stats again
+    assert (application.github_stats_fetched_at is not None) == is_stamped
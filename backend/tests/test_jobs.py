@@ -0,0 +1,62 @@
+import asyncio
+import datetime
+
+import pytest
+
+from src.config_schema import WorkerSettings
+from src.db.models import Job
+from src.db.repositories import JobRepository
+from src.schemas import JobKind, JobStatus
+from src.worker.worker import JobWorker
+
+pytestmark = pytest.mark.anyio
+
+
+async def get_job(storage, job_id: int) -> Job:
+    async with storage.create_session() as session:
+        return await session.get(Job, job_id)
+
+
+async def test_abandoned_run_does_not_finish_the_job_claimed_again(storage):
+    repository = JobRepository(storage)
+    job = await repository.enqueue(JobKind.PRE_INTERVIEW, {"application_id": 1}, max_attempts=3)
+    [first] = await repository.claim(limit=1, lock_timeout=datetime.timedelta(seconds=60))
+    # Considered abandoned right away
+    [second] = await repository.claim(limit=1, lock_timeout=datetime.timedelta(0))
+    assert first.id == second.id == job.id
+    assert first.locked_at != second.locked_at
+
+    assert not await repository.complete(first.id, first.locked_at)
+    assert not await repository.fail(first.id, first.locked_at, "error", retry_in=datetime.timedelta(0))
+    assert (await get_job(storage, job.id)).status == JobStatus.RUNNING
+
+    assert await repository.complete(second.id, second.locked_at)
+    assert (await get_job(storage, job.id)).status == JobStatus.DONE
+
+
+async def test_job_running_too_long_is_cancelled_and_retried(storage):
+    cancelled = asyncio.Event()
+
+    async def hanging_handler(storage, payload: dict) -> None:
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    settings = WorkerSettings(job_timeout_seconds=0.05, lock_timeout_seconds=60)
+    worker = JobWorker(storage, {JobKind.PRE_INTERVIEW.value: hanging_handler}, settings)
+    job = await worker.repository.enqueue(JobKind.PRE_INTERVIEW, {"application_id": 1}, max_attempts=3)
+    [claimed] = await worker.repository.claim(limit=1, lock_timeout=datetime.timedelta(seconds=60))
+
+    await worker._process(claimed)
+
+    assert cancelled.is_set()
+    job = await get_job(storage, job.id)
+    assert job.status == JobStatus.QUEUED
+    assert job.last_error == "TimeoutError()"
+
+
+async def test_job_timeout_must_be_below_lock_timeout(storage):
+    with pytest.raises(ValueError):
+        JobWorker(storage, {}, WorkerSettings(job_timeout_seconds=900, lock_timeout_seconds=900))
@@ -0,0 +1,176 @@
+"""Relationships are loaded explicitly, so the number of statements must not grow with the number of rows."""
+
+import datetime
+
+import httpx
+import pytest
+
+from src.api.app import app as api
+from src.api.auth.dependencies import get_current_user, require_admin
+from src.db.models import User
+from src.db.repositories import (
+    ApplicationRepository,
+    PreInterviewResultRepository,
+    SkillRepository,
+    SkillTypeRepository,
+    UserRepository,
+    VacancyRepository,
+)
+from src.db.storage import SQLAlchemyStorage, UnitOfWork
+from src.schemas import Status
+
+pytestmark = pytest.mark.anyio
+
+
+async def create_applications(storage: SQLAlchemyStorage, count: int) -> list[int]:
+    """Applications to one vacancy with three skills, each with a pre-interview result."""
+    user = await UserRepository(storage).create_user("HR", "hr@example.com", "hash", is_admin=True)
+    vacancy = await VacancyRepository(storage).create_vacancy(
+        "Python developer", "Backend", 1000, "Kazan", 40, 3, datetime.datetime.now(datetime.UTC), None, True, user.id
+    )
+    skill_type = await SkillTypeRepository(storage).create_skill_type("Python")
+    await SkillRepository(storage).bulk_create_skills(
+        vacancy.id, [{"weight": 1, "details": f"skill {i}", "skill_type_id": skill_type.id} for i in range(3)]
+    )
+
+    application_ids = []
+    for i in range(count):
+        candidate = await UserRepository(storage).create_user(f"Candidate {i}", f"c{i}@example.com", "hash", False)
+        application = await ApplicationRepository(storage).create_application(
+            f"cv{i}.pdf", Status.PENDING, candidate.id, vacancy.id, git=None
+        )
+        await PreInterviewResultRepository(storage).create_result(True, 0.5, application.id, "reason")
+        application_ids.append(application.id)
+    return application_ids
+
+
+async def test_get_application_with_vacancy(storage, statements):
+    [application_id] = await create_applications(storage, 1)
+
+    statements.count = 0
+    application = await ApplicationRepository(storage).get_application(application_id, with_vacancy=True)
+    # Application, vacancy, its skills and their types
+    assert statements.count == 4
+
+    assert [skill.skill_type.name for skill in application.vacancy.skills] == ["Python"] * 3
+    assert statements.count == 4
+
+
+async def test_get_user(storage, statements):
+    await create_applications(storage, 1)
+
+    statements.count = 0
+    user = await UserRepository(storage).get_user(1)
+    assert user is not None
+    assert statements.count == 1
+
+
+@pytest.mark.parametrize("count", [1, 10])
+async def test_list_applications(storage, statements, count):
+    await create_applications(storage, count)
+
+    statements.count = 0
+    applications = await ApplicationRepository(storage).get_all_applications()
+    assert len(applications) == count
+    assert statements.count == 1
+
+
+@pytest.mark.parametrize("count", [1, 10])
+async def test_list_vacancies_with_skills(storage, statements, count):
+    user = await UserRepository(storage).create_user("HR", "hr@example.com", "hash", is_admin=True)
+    skill_type = await SkillTypeRepository(storage).create_skill_type("Python")
+    for i in range(count):
+        vacancy = await VacancyRepository(storage).create_vacancy(
+            f"Vacancy {i}", "", None, "Kazan", 40, 1, datetime.datetime.now(datetime.UTC), None, True, user.id
+        )
+        await SkillRepository(storage).create_skill(1, "", skill_type.id, vacancy.id)
+
+    statements.count = 0
+    vacancies = await VacancyRepository(storage).get_all_vacancies(with_skills=True)
+    assert [len(vacancy.skills) for vacancy in vacancies] == [1] * count
+    # Vacancies, their skills and the skill types
+    assert statements.count == 3
+
+
+async def test_options_apply_to_instances_already_in_the_unit_of_work(storage):
+    [application_id] = await create_applications(storage, 1)
+
+    async with UnitOfWork(storage) as unit_of_work:
+        application_repository = ApplicationRepository(unit_of_work)
+        application = await application_repository.get_application(application_id)
+        same_application = await application_repository.get_application(
+            application_id, with_vacancy=True, with_results=True
+        )
+        assert same_application is application
+        assert application.pre_interview_result.score == 0.5
+        assert len(application.vacancy.skills) == 3
+
+        vacancy_repository = VacancyRepository(unit_of_work)
+        vacancy = await vacancy_repository.get_vacancy(application.vacancy_id)
+        assert len((await vacancy_repository.get_vacancy(vacancy.id, with_skills=True)).skills) == 3
+
+
+@pytest.fixture
+async def app(storage):
+    """The API without its lifespan, on the test database."""
+    api.state.storage = storage
+    yield api
+    api.dependency_overrides.clear()
+
+
+@pytest.fixture
+async def client(app):
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+def authenticate(app, user: User) -> None:
+    """Requests are made as `user`, without loading the user from the database."""
+    app.dependency_overrides[get_current_user] = app.dependency_overrides[require_admin] = lambda: user
+
+
+@pytest.mark.parametrize("count", [1, 10])
+async def test_endpoint_vacancies_with_skills(storage, statements, app, client, count):
+    user = await UserRepository(storage).create_user("HR", "hr@example.com", "hash", is_admin=True)
+    skill_type = await SkillTypeRepository(storage).create_skill_type("Python")
+    for i in range(count):
+        vacancy = await VacancyRepository(storage).create_vacancy(
+            f"Vacancy {i}", "", None, "Kazan", 40, 1, datetime.datetime.now(datetime.UTC), None, True, user.id
+        )
+        await SkillRepository(storage).create_skill(1, "", skill_type.id, vacancy.id)
+    authenticate(app, user)
+
+    statements.count = 0
+    response = await client.get("/vacancy/with_skills")
+    assert response.status_code == 200
+    assert [len(item["skills"]) for item in response.json()] == [1] * count
+    assert statements.count == 3
+
+
+@pytest.mark.parametrize("count", [1, 10])
+async def test_endpoint_list_applications(storage, statements, app, client, count):
+    await create_applications(storage, count)
+    authenticate(app, await UserRepository(storage).get_user(1))
+
+    statements.count = 0
+    response = await client.get("/applications")
+    assert response.status_code == 200
+    assert len(response.json()) == count
+    assert statements.count == 1
+
+
+@pytest.mark.parametrize("count", [1, 10])
+async def test_endpoint_my_applications_with_vacancies(storage, statements, app, client, count):
+    [application_id] = await create_applications(storage, 1)
+    application = await ApplicationRepository(storage).get_application(application_id)
+    for i in range(count - 1):
+        await ApplicationRepository(storage).create_application(
+            f"cv{i}.pdf", Status.PENDING, application.user_id, application.vacancy_id, git=None
+        )
+    authenticate(app, await UserRepository(storage).get_user(application.user_id))
+
+    statements.count = 0
+    response = await client.get("/applications/my/with_vacancies")
+    assert response.status_code == 200
+    assert [item["vacancy"]["name"] for item in response.json()] == ["Python developer"] * count
+    assert statements.count == 2
@@ -0,0 +1,100 @@
+"""The details of the post-interview result are aggregated with Postgres JSON functions, SQLite cannot run them."""
+
+import datetime
+import os
+
+import pytest
+
+from src.api.post_interview.routes import get_post_interview_for_application
+from src.db.models import InterviewMessage
+from src.db.repositories import (
+    ApplicationRepository,
+    PostInterviewResultRepository,
+    SkillRepository,
+    SkillResultRepository,
+    SkillTypeRepository,
+    UserRepository,
+    VacancyRepository,
+)
+from src.schemas import Status
+
+pytestmark = [
+    pytest.mark.anyio,
+    pytest.mark.skipif(
+        not os.getenv("TEST_DB_URL", "").startswith("postgresql"), reason="TEST_DB_URL is not a Postgres database"
+    ),
+]
+
+
+async def create_application(storage) -> int:
+    user = await UserRepository(storage).create_user("A", "a@example.com", "hash", False)
+    vacancy = await VacancyRepository(storage).create_vacancy(
+        "Vacancy", "", None, "Kazan", 40, 1, datetime.datetime.now(datetime.UTC), None, True, user.id
+    )
+    application = await ApplicationRepository(storage).create_application(
+        "cv.pdf", Status.PENDING, user.id, vacancy.id, git=None
+    )
+    return application.id
+
+
+async def get_details(storage, application_id: int):
+    return await get_post_interview_for_application(
+        application_id, PostInterviewResultRepository(storage), ApplicationRepository(storage), None
+    )
+
+
+async def create_result(storage, application_id: int) -> None:
+    await PostInterviewResultRepository(storage).create_result(
+        True, 0.8, "interview summary", "response", "summary", "emotions", "roadmap", application_id
+    )
+
+
+async def test_result_with_scores_and_ordered_transcript(storage):
+    application_id = await create_application(storage)
+    application = await ApplicationRepository(storage).get_application(application_id)
+    python = await SkillTypeRepository(storage).create_skill_type("Python")
+    sql = await SkillTypeRepository(storage).create_skill_type("SQL")
+    skills = await SkillRepository(storage).bulk_create_skills(
+        application.vacancy_id,
+        [
+            {"weight": 3, "details": "", "skill_type_id": python.id},
+            {"weight": 1, "details": "", "skill_type_id": sql.id},
+        ],
+    )
+    await SkillResultRepository(storage).bulk_create_skill_results(
+        application_id, [{"skill_id": skills[0].id, "score": 0.9}, {"skill_id": skills[1].id, "score": 0.4}]
+    )
+    # Inserted in the reverse order of the transcript, so that ordering by id would fail
+    async with storage.create_session() as session:
+        for position, role in [(2, "assistant"), (1, "user"), (0, "assistant")]:
+            session.add(
+                InterviewMessage(
+                    role=role, message=f"message {position}", position=position, application_id=application_id
+                )
+            )
+        await session.commit()
+    await create_result(storage, application_id)
+
+    details = await get_details(storage, application_id)
+
+    assert details.score == 0.8
+    assert details.candidate_roadmap == "roadmap"
+    assert [(s.skill_id, s.skill_name, s.weight, s.score) for s in details.skill_scores] == [
+        (skills[0].id, "Python", 3, 0.9),
+        (skills[1].id, "SQL", 1, 0.4),
+    ]
+    assert [(m.role, m.message) for m in details.interview_transcript] == [
+        ("assistant", "message 0"),
+        ("user", "message 1"),
+        ("assistant", "message 2"),
+    ]
+
+
+async def test_result_without_scores_and_transcript(storage):
+    application_id = await create_application(storage)
+    await create_result(storage, application_id)
+
+    details = await get_details(storage, application_id)
+
+    assert details.skill_scores == []
+    assert details.interview_transcript == []
@@ -0,0 +1,100 @@
+"""The user endpoints are called directly with the unit of work that the request would get."""
+
+import pytest
+from fastapi import HTTPException
+
+from src.api.auth.cache import principal_cache
+from src.api.auth.dependencies import _load_user
+from src.api.user.routes import delete_user_endpoint, edit_user_endpoint
+from src.db.models import User
+from src.db.repositories import RefreshTokenRepository, UserRepository
+from src.db.storage import SQLAlchemyStorage, UnitOfWork
+from src.schemas.auth import TokenPayload
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(autouse=True)
+def clear_principal_cache():
+    principal_cache.clear()
+    yield
+    principal_cache.clear()
+
+
+async def delete_user(unit_of_work: UnitOfWork, admin: User, user_id: int) -> None:
+    await delete_user_endpoint(user_id, admin, UserRepository(unit_of_work), unit_of_work)
+
+
+async def create_users(storage: SQLAlchemyStorage) -> tuple[User, User]:
+    admin = await UserRepository(storage).create_user("Admin", "admin@example.com", "hash", True)
+    user = await UserRepository(storage).create_user("A", "a@example.com", "hash", False)
+    return admin, user
+
+
+async def assert_unauthorized(storage: SQLAlchemyStorage, payload: TokenPayload) -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        await _load_user(payload, UserRepository(storage))
+    assert exc_info.value.status_code == 401
+
+
+async def test_user_loaded_before_the_delete_commits_is_not_cached(storage):
+    admin, user = await create_users(storage)
+    payload = TokenPayload(sub=user.id, exp=None)
+
+    async with UnitOfWork(storage) as unit_of_work:
+        await delete_user(unit_of_work, admin, user.id)
+        # Another request authenticates meanwhile and still reads the committed row
+        assert (await _load_user(payload, UserRepository(storage))).id == user.id
+
+    await assert_unauthorized(storage, payload)
+
+
+async def test_user_deleted_while_being_loaded_is_not_cached(storage):
+    admin, user = await create_users(storage)
+    payload = TokenPayload(sub=user.id, exp=None)
+
+    class DeletedAfterRead(UserRepository):
+        async def get_user(self, user_id: int):
+            loaded = await super().get_user(user_id)
+            async with UnitOfWork(storage) as unit_of_work:
+                await delete_user(unit_of_work, admin, user_id)
+            return loaded
+
+    # The request that was already reading the user lets it through, but must not cache it
+    assert (await _load_user(payload, DeletedAfterRead(storage))).id == user.id
+
+    await assert_unauthorized(storage, payload)
+
+
+async def test_edited_user_is_loaded_again(storage):
+    _, user = await create_users(storage)
+    payload = TokenPayload(sub=user.id, exp=None)
+    await _load_user(payload, UserRepository(storage))
+
+    async with UnitOfWork(storage) as unit_of_work:
+        await edit_user_endpoint(
+            user.id,
+            name="B",
+            email=None,
+            password=None,
+            is_admin=None,
+            current_user=user,
+            user_repository=UserRepository(unit_of_work),
+            refresh_token_repository=RefreshTokenRepository(unit_of_work),
+            unit_of_work=unit_of_work,
+        )
+
+    assert (await _load_user(payload, UserRepository(storage))).name == "B"
+
+
+async def test_rolled_back_delete_keeps_the_cached_user(storage):
+    admin, user = await create_users(storage)
+    payload = TokenPayload(sub=user.id, exp=None)
+    await _load_user(payload, UserRepository(storage))
+
+    with pytest.raises(RuntimeError):
+        async with UnitOfWork(storage) as unit_of_work:
+            await delete_user(unit_of_work, admin, user.id)
+            raise RuntimeError
+
+    assert principal_cache.get(user.id, None) is not None
@@ -0,0 +1,45 @@
+import pytest
+from fastapi import HTTPException
+
+from src.api.auth.routes import refresh
+from src.api.auth.util import create_tokens
+from src.db.repositories import RefreshTokenRepository, UserRepository
+from src.schemas import RefreshRequest
+from src.services.tokens import token_service
+
+pytestmark = pytest.mark.anyio
+
+
+async def assert_rejected(storage, refresh_token: str) -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        await refresh(RefreshRequest(refresh_token=refresh_token), storage)
+    assert exc_info.value.status_code == 401
+
+
+async def test_refresh_token_is_rotated(storage):
+    user = await UserRepository(storage).create_user("A", "a@example.com", "hash", False)
+    tokens = await create_tokens(user, RefreshTokenRepository(storage))
+
+    refreshed = await refresh(RefreshRequest(refresh_token=tokens.refresh_token), storage)
+    assert refreshed.refresh_token != tokens.refresh_token
+    await assert_rejected(storage, tokens.refresh_token)
+
+
+async def test_reused_refresh_token_revokes_the_others(storage):
+    user = await UserRepository(storage).create_user("A", "a@example.com", "hash", False)
+    tokens = await create_tokens(user, RefreshTokenRepository(storage))
+    other_session = await create_tokens(user, RefreshTokenRepository(storage))
+    refreshed = await refresh(RefreshRequest(refresh_token=tokens.refresh_token), storage)
+
+    await assert_rejected(storage, tokens.refresh_token)
+    await assert_rejected(storage, refreshed.refresh_token)
+    await assert_rejected(storage, other_session.refresh_token)
+
+
+async def test_revoked_and_legacy_refresh_tokens_are_rejected(storage):
+    user = await UserRepository(storage).create_user("A", "a@example.com", "hash", False)
+    tokens = await create_tokens(user, RefreshTokenRepository(storage))
+
+    await RefreshTokenRepository(storage).revoke_user_tokens(user.id)
+    await assert_rejected(storage, tokens.refresh_token)
+    await assert_rejected(storage, token_service.create_refresh_token({"sub": str(user.id)}))
@@ -0,0 +1,38 @@
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from src.db.models import User
+from src.db.repositories import UserRepository
+from src.db.storage import UnitOfWork
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_rollback_callbacks_run_only_on_rollback(storage):
+    calls = []
+
+    async with UnitOfWork(storage) as unit_of_work:
+        unit_of_work.after_rollback(lambda: calls.append("committed"))
+        await UserRepository(unit_of_work).create_user("A", "a@example.com", "hash", False)
+
+    with pytest.raises(RuntimeError):
+        async with UnitOfWork(storage) as unit_of_work:
+            unit_of_work.after_rollback(lambda: calls.append("raised"))
+            await UserRepository(unit_of_work).create_user("B", "b@example.com", "hash", False)
+            raise RuntimeError
+
+    assert calls == ["raised"]
+    assert await UserRepository(storage).get_user_by_email("b@example.com") is None
+
+
+async def test_rollback_callbacks_run_when_commit_fails(storage):
+    await UserRepository(storage).create_user("A", "a@example.com", "hash", False)
+    calls = []
+
+    with pytest.raises(IntegrityError):
+        async with UnitOfWork(storage) as unit_of_work:
+            unit_of_work.after_rollback(lambda: calls.append("rolled back"))
+            # Not flushed until the commit, which then fails on the duplicate email
+            unit_of_work.session.add(User(name="B", email="a@example.com", hashed_password="hash", is_admin=False))
+
+    assert calls == ["rolled back"]